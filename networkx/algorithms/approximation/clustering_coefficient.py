@@ -1,7 +1,12 @@
+from collections import defaultdict
+from math import sqrt
+from statistics import stdev
+
+import networkx as nx
 from networkx.utils import not_implemented_for
 from networkx.utils import py_random_state
 
-__all__ = ["average_clustering"]
+__all__ = ["average_clustering", "StreamingTriangleCounter"]
 
 
 @py_random_state(2)
@@ -63,3 +68,239 @@ def average_clustering(G, trials=1000, seed=None):
         if u in G[v]:
             triangles += 1
     return triangles / float(trials)
+
+
+class StreamingTriangleCounter:
+    r"""Estimates the triangles of a graph given as a stream of edges.
+
+    The counter reads the edges of an undirected graph one at a time and
+    keeps a uniform random sample of at most `memory` of them, so the
+    graph is never built. Whenever an edge closes triangles with two
+    sampled edges, the estimates of the number of triangles of the graph
+    and of its three nodes grow by the inverse probability that both of
+    them are in the sample, as in TRIÈST-IMPR [1]_. The estimates are
+    unbiased, and exact while the stream holds at most `memory` edges.
+
+    The sample is split between `copies` independent counters, whose
+    spread gives :meth:`confidence_interval`.
+
+    Parameters
+    ----------
+    memory : integer, optional (default=1000000)
+        The largest number of edges kept in the samples.
+
+    copies : integer, optional (default=4)
+        The number of independent counters, each sampling
+        ``memory // copies`` edges. More copies give a better estimate of
+        the error, and a larger error.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Attributes
+    ----------
+    number_of_edges : integer
+        The number of edges read so far, not counting self loops.
+
+    Raises
+    ------
+    ValueError
+        If `copies` is less than one or a counter would sample fewer than
+        two edges.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation
+    >>> counter = approximation.StreamingTriangleCounter(memory=1000, seed=42)
+    >>> counter.add_edges_from(nx.complete_graph(5).edges)
+    >>> counter.total_triangles()
+    10.0
+    >>> counter.triangles(0)
+    6.0
+
+    The edges can come from any iterable, such as the lines of an edge list
+    file:
+
+    >>> lines = ["5 6", "6 7", "7 5"]
+    >>> counter.add_edges_from(line.split() for line in lines)
+    >>> counter.total_triangles()
+    11.0
+
+    Notes
+    -----
+    Every edge must appear once in the stream. Self loops are ignored.
+    Besides the samples, the counter keeps the degree and the triangle
+    estimates of every node seen, which is linear in the number of nodes.
+
+    When the $t$-th edge closes a triangle with two sampled edges, its
+    estimate grows by $\max(1, (t - 1)(t - 2) / (M (M - 1)))$, where $M$
+    is the size of the sample. The relative error decreases like
+    $t / (M \sqrt{T})$ for $T$ triangles, for graphs whose triangles
+    share few edges.
+
+    References
+    ----------
+    .. [1] L. De Stefani, A. Epasto, M. Riondato and E. Upfal,
+       "TRIÈST: Counting Local and Global Triangles in Fully-Dynamic
+       Streams with Fixed Memory Size", KDD 2016, pp. 825-834.
+       https://doi.org/10.1145/2939672.2939771
+    """
+
+    @py_random_state("seed")
+    def __init__(self, memory=1000000, copies=4, seed=None):
+        if copies < 1:
+            raise ValueError("copies must be at least 1")
+        size = memory // copies
+        if size < 2:
+            raise ValueError("memory must be at least twice the number of copies")
+        self._seed = seed
+        self._size = size
+        self.number_of_edges = 0
+        self._degree = defaultdict(int)
+        self._wedges = 0
+        # one sample of edges, its adjacency and the estimates for each copy
+        self._samples = [[] for _ in range(copies)]
+        self._nbrs = [defaultdict(set) for _ in range(copies)]
+        self._total = [0.0] * copies
+        self._local = [defaultdict(float) for _ in range(copies)]
+
+    def add_edge(self, u, v):
+        """Reads the edge (u, v) of the stream.
+
+        Parameters
+        ----------
+        u, v : nodes
+            The endpoints of the edge.
+        """
+        if u == v:
+            return
+        degree = self._degree
+        self._wedges += degree[u] + degree[v]
+        degree[u] += 1
+        degree[v] += 1
+        self.number_of_edges = t = self.number_of_edges + 1
+        size = self._size
+        weight = max(1.0, (t - 1) * (t - 2) / (size * (size - 1)))
+        seed = self._seed
+        for i, nbrs in enumerate(self._nbrs):
+            common = nbrs[u] & nbrs[v] if u in nbrs and v in nbrs else ()
+            if common:
+                local = self._local[i]
+                increment = weight * len(common)
+                self._total[i] += increment
+                local[u] += increment
+                local[v] += increment
+                for w in common:
+                    local[w] += weight
+            sample = self._samples[i]
+            if t <= size:
+                sample.append((u, v))
+            elif seed.random() * t < size:
+                j = seed.randrange(size)
+                x, y = sample[j]
+                for a, b in ((x, y), (y, x)):
+                    nbrs[a].discard(b)
+                    if not nbrs[a]:
+                        del nbrs[a]
+                sample[j] = (u, v)
+            else:
+                continue
+            nbrs[u].add(v)
+            nbrs[v].add(u)
+
+    def add_edges_from(self, ebunch):
+        """Reads all the edges of `ebunch`.
+
+        Parameters
+        ----------
+        ebunch : iterable of edges
+            Each edge is a tuple whose first two items are its endpoints,
+            such as a 2-tuple (u, v) or a 3-tuple (u, v, d).
+        """
+        add_edge = self.add_edge
+        for e in ebunch:
+            add_edge(e[0], e[1])
+
+    def total_triangles(self):
+        """Returns the estimated number of triangles of the graph."""
+        return sum(self._total) / len(self._total)
+
+    def triangles(self, nodes=None):
+        """Returns the estimated number of triangles at nodes.
+
+        Parameters
+        ----------
+        nodes : node or container of nodes, optional (default=all nodes seen)
+            Estimate the triangles of this node or of the nodes in this
+            container.
+
+        Returns
+        -------
+        out : float or dictionary
+            The estimated number of triangles of `nodes` if it is a node
+            seen in the stream, otherwise a dictionary keyed by node.
+        """
+        copies = len(self._local)
+        # a container of nodes may not be hashable
+        try:
+            if nodes in self._degree:
+                return sum(local.get(nodes, 0.0) for local in self._local) / copies
+        except TypeError:
+            pass
+        if nodes is None:
+            nodes = self._degree
+        return {
+            n: sum(local.get(n, 0.0) for local in self._local) / copies for n in nodes
+        }
+
+    def transitivity(self):
+        """Returns the estimated transitivity of the graph.
+
+        The number of triads, pairs of edges with a shared node, is known
+        exactly from the degrees, so only the number of triangles is
+        estimated.
+
+        See Also
+        --------
+        networkx.algorithms.cluster.transitivity
+        """
+        if self._wedges == 0:
+            return 0
+        return 3 * self.total_triangles() / self._wedges
+
+    def confidence_interval(self, confidence=0.95):
+        """Returns an interval that holds the number of triangles of the
+        graph with the given probability.
+
+        The interval is centered at :meth:`total_triangles` and uses the
+        Student's t distribution with ``copies - 1`` degrees of freedom for
+        the mean of the estimates of the copies, which is wider than the
+        normal approximation when there are few copies. Requires SciPy.
+
+        Parameters
+        ----------
+        confidence : float, optional (default=0.95)
+            The probability that the interval holds the number of
+            triangles, between 0 and 1.
+
+        Returns
+        -------
+        low, high : floats
+            The bounds of the interval.
+
+        Raises
+        ------
+        NetworkXError
+            If the counter has a single copy.
+        """
+        copies = len(self._total)
+        if copies < 2:
+            raise nx.NetworkXError("confidence intervals need at least two copies")
+        import scipy as sp
+        import scipy.stats  # call as sp.stats
+
+        mean = self.total_triangles()
+        t = sp.stats.t.ppf((1 + confidence) / 2, copies - 1)
+        error = t * stdev(self._total) / sqrt(copies)
+        return max(0.0, mean - error), mean + error
@@ -1,5 +1,11 @@
+import random
+import statistics
+
+import pytest
+
 import networkx as nx
 from networkx.algorithms.approximation import average_clustering
+from networkx.algorithms.approximation import StreamingTriangleCounter
 
 # This approximation has to be exact in regular graphs
 # with no triangles or with all possible triangles.
@@ -41,3 +47,72 @@ def test_complete():
     assert average_clustering(G, trials=int(len(G) / 2)) == 1
     G = nx.complete_graph(7)
     assert average_clustering(G, trials=int(len(G) / 2)) == 1
+
+
+class TestStreamingTriangleCounter:
+    def test_exact_in_memory(self):
+        G = nx.karate_club_graph()
+        counter = StreamingTriangleCounter(memory=4 * G.size(), seed=1)
+        counter.add_edges_from(G.edges(data=True))
+        assert counter.number_of_edges == G.size()
+        assert counter.triangles() == nx.triangles(G)
+        assert counter.triangles(0) == nx.triangles(G, 0)
+        assert counter.total_triangles() == sum(nx.triangles(G).values()) / 3
+        assert counter.transitivity() == pytest.approx(nx.transitivity(G))
+        assert counter.triangles([0, 1]) == nx.triangles(G, [0, 1])
+        assert counter.triangles({0, 1}) == nx.triangles(G, {0, 1})
+
+    def test_self_loops_ignored(self):
+        counter = StreamingTriangleCounter(memory=10)
+        counter.add_edges_from([(0, 0), (0, 1), (1, 2), (2, 0)])
+        assert counter.number_of_edges == 3
+        assert counter.total_triangles() == 1
+
+    def test_estimate(self):
+        G = nx.barabasi_albert_graph(2000, 5, seed=1)
+        edges = list(G.edges())
+        random.Random(1).shuffle(edges)
+        expected = sum(nx.triangles(G).values()) / 3
+        counter = StreamingTriangleCounter(memory=len(edges) // 2, seed=2)
+        counter.add_edges_from(edges)
+        assert counter.total_triangles() == pytest.approx(expected, rel=0.2)
+        assert sum(counter.triangles().values()) == pytest.approx(
+            3 * counter.total_triangles()
+        )
+        assert counter.transitivity() == pytest.approx(nx.transitivity(G), rel=0.2)
+
+    def test_confidence_interval(self):
+        pytest.importorskip("scipy")
+        G = nx.karate_club_graph()
+        counter = StreamingTriangleCounter(memory=4 * G.size(), seed=1)
+        counter.add_edges_from(G.edges())
+        low, high = counter.confidence_interval()
+        assert low == high == counter.total_triangles()
+
+        G = nx.barabasi_albert_graph(2000, 5, seed=1)
+        edges = list(G.edges())
+        random.Random(1).shuffle(edges)
+        expected = sum(nx.triangles(G).values()) / 3
+        counter = StreamingTriangleCounter(memory=len(edges) // 2, seed=2)
+        counter.add_edges_from(edges)
+        low, high = counter.confidence_interval(0.999)
+        assert low < expected < high
+        # with 4 copies the 95% quantile of t with 3 degrees of freedom is 3.18
+        low, high = counter.confidence_interval()
+        estimates = counter._total
+        half = 3.182446 * statistics.stdev(estimates) / 2
+        assert high - counter.total_triangles() == pytest.approx(half)
+
+    def test_no_edges(self):
+        counter = StreamingTriangleCounter()
+        assert counter.total_triangles() == 0
+        assert counter.triangles() == {}
+        assert counter.transitivity() == 0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            StreamingTriangleCounter(copies=0)
+        with pytest.raises(ValueError):
+            StreamingTriangleCounter(memory=3, copies=2)
+        with pytest.raises(nx.NetworkXError):
+            StreamingTriangleCounter(copies=1).confidence_interval()
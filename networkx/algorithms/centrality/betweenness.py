@@ -2,6 +2,7 @@
 from heapq import heappush, heappop
 from collections import deque
 from itertools import count
+import os
 import warnings
 
 from networkx.utils import py_random_state
@@ -13,7 +14,7 @@ __all__ = ["betweenness_centrality", "edge_betweenness_centrality", "edge_betwee
 
 @py_random_state(5)
 def betweenness_centrality(
-    G, k=None, normalized=True, weight=None, endpoints=False, seed=None
+    G, k=None, normalized=True, weight=None, endpoints=False, seed=None, n_jobs=None
 ):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
@@ -59,6 +60,12 @@ def betweenness_centrality(
         See :ref:`Randomness<randomness>`.
         Note that this is only used if k is not None.
 
+    n_jobs : int, optional (default=None)
+        Number of worker processes among which the sources are divided.
+        If None or 1 the computation runs in the calling process, if -1
+        one worker is started per CPU. The graph is sent to every worker
+        once (on platforms that fork, it is inherited without copying).
+
     Returns
     -------
     nodes : dictionary
@@ -119,22 +126,13 @@ def betweenness_centrality(
        Sociometry 40: 35–41, 1977
        https://doi.org/10.2307/3033543
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     if k is None:
         nodes = G
     else:
         nodes = seed.sample(list(G.nodes()), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        if endpoints:
-            betweenness, delta = _accumulate_endpoints(betweenness, S, P, sigma, s)
-        else:
-            betweenness, delta = _accumulate_basic(betweenness, S, P, sigma, s)
+    betweenness = _sum_over_sources(
+        _betweenness_sources, G, nodes, n_jobs, weight, endpoints
+    )
     # rescaling
     betweenness = _rescale(
         betweenness,
@@ -148,7 +146,9 @@ def betweenness_centrality(
 
 
 @py_random_state(4)
-def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=None):
+def edge_betweenness_centrality(
+    G, k=None, normalized=True, weight=None, seed=None, n_jobs=None
+):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge $e$ is the sum of the
@@ -188,6 +188,12 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=No
         See :ref:`Randomness<randomness>`.
         Note that this is only used if k is not None.
 
+    n_jobs : int, optional (default=None)
+        Number of worker processes among which the sources are divided.
+        If None or 1 the computation runs in the calling process, if -1
+        one worker is started per CPU. The graph is sent to every worker
+        once (on platforms that fork, it is inherited without copying).
+
     Returns
     -------
     edges : dictionary
@@ -216,21 +222,11 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=No
        Social Networks 30(2):136-145, 2008.
        https://doi.org/10.1016/j.socnet.2007.11.001
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
-    # b[e]=0 for e in G.edges()
-    betweenness.update(dict.fromkeys(G.edges(), 0.0))
     if k is None:
         nodes = G
     else:
         nodes = seed.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+    betweenness = _sum_over_sources(_edge_betweenness_sources, G, nodes, n_jobs, weight)
     # rescaling
     for n in G:  # remove nodes to only return edges
         del betweenness[n]
@@ -253,6 +249,83 @@ def edge_betweenness(G, k=None, normalized=True, weight=None, seed=None):
 # helpers for betweenness centrality
 
 
+def _betweenness_sources(G, sources, weight, endpoints):
+    """Returns the node betweenness of the shortest paths from sources"""
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
+        # accumulation
+        if endpoints:
+            betweenness, delta = _accumulate_endpoints(betweenness, S, P, sigma, s)
+        else:
+            betweenness, delta = _accumulate_basic(betweenness, S, P, sigma, s)
+    return betweenness
+
+
+def _edge_betweenness_sources(G, sources, weight):
+    """Returns the edge betweenness of the shortest paths from sources"""
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    # b[e]=0 for e in G.edges()
+    betweenness.update(dict.fromkeys(G.edges(), 0.0))
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
+        # accumulation
+        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+    return betweenness
+
+
+# the graph of a worker process of _sum_over_sources
+_worker_graph = None
+
+
+def _init_worker(G):
+    global _worker_graph
+    _worker_graph = G
+
+
+def _run_worker(task):
+    func, sources, args = task
+    return func(_worker_graph, sources, *args)
+
+
+def _sum_over_sources(func, G, sources, n_jobs, *args):
+    """Returns ``func(G, sources, *args)``, run in `n_jobs` processes.
+
+    `func` returns a dict of partial sums over the sources it is given. The
+    sources are dealt round-robin to the workers and the dicts they return
+    are added up key by key, so the result equals the serial one up to the
+    order of the floating point additions.
+    """
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs is None or n_jobs == 1:
+        return func(G, sources, *args)
+    if n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, not {n_jobs}")
+    from concurrent.futures import ProcessPoolExecutor
+
+    sources = list(sources)
+    n_chunks = min(len(sources), 4 * n_jobs)
+    tasks = [(func, sources[i::n_chunks], args) for i in range(n_chunks)]
+    if not tasks:
+        return func(G, sources, *args)
+    with ProcessPoolExecutor(n_jobs, initializer=_init_worker, initargs=(G,)) as pool:
+        partials = pool.map(_run_worker, tasks)
+        total = next(partials)
+        for partial in partials:
+            for key, value in partial.items():
+                total[key] += value
+    return total
+
+
 def _single_source_shortest_path_basic(G, s):
     S = []
     P = {}
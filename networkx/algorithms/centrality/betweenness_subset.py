@@ -5,6 +5,7 @@ from networkx.algorithms.centrality.betweenness import (
     _single_source_dijkstra_path_basic as dijkstra,
     _single_source_shortest_path_basic as shortest_path,
     _add_edge_keys,
+    _sum_over_sources,
 )
 
 __all__ = [
@@ -14,7 +15,9 @@ __all__ = [
 ]
 
 
-def betweenness_centrality_subset(G, sources, targets, normalized=False, weight=None):
+def betweenness_centrality_subset(
+    G, sources, targets, normalized=False, weight=None, n_jobs=None
+):
     r"""Compute betweenness centrality for a subset of nodes.
 
     .. math::
@@ -51,6 +54,11 @@ def betweenness_centrality_subset(G, sources, targets, normalized=False, weight=
       Weights are used to calculate weighted shortest paths, so they are
       interpreted as distances.
 
+    n_jobs : int, optional (default=None)
+        Number of worker processes among which the sources are divided.
+        If None or 1 the computation runs in the calling process, if -1
+        one worker is started per CPU.
+
     Returns
     -------
     nodes : dictionary
@@ -99,20 +107,13 @@ def betweenness_centrality_subset(G, sources, targets, normalized=False, weight=
        Social Networks 30(2):136-145, 2008.
        https://doi.org/10.1016/j.socnet.2007.11.001
     """
-    b = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
-    for s in sources:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma, _ = shortest_path(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma, _ = dijkstra(G, s, weight)
-        b = _accumulate_subset(b, S, P, sigma, s, targets)
+    b = _sum_over_sources(_subset_sources, G, sources, n_jobs, targets, weight)
     b = _rescale(b, len(G), normalized=normalized, directed=G.is_directed())
     return b
 
 
 def edge_betweenness_centrality_subset(
-    G, sources, targets, normalized=False, weight=None
+    G, sources, targets, normalized=False, weight=None, n_jobs=None
 ):
     r"""Compute betweenness centrality for edges for a subset of nodes.
 
@@ -147,6 +148,11 @@ def edge_betweenness_centrality_subset(
       Weights are used to calculate weighted shortest paths, so they are
       interpreted as distances.
 
+    n_jobs : int, optional (default=None)
+        Number of worker processes among which the sources are divided.
+        If None or 1 the computation runs in the calling process, if -1
+        one worker is started per CPU.
+
     Returns
     -------
     edges : dictionary
@@ -180,15 +186,7 @@ def edge_betweenness_centrality_subset(
        Social Networks 30(2):136-145, 2008.
        https://doi.org/10.1016/j.socnet.2007.11.001
     """
-    b = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
-    b.update(dict.fromkeys(G.edges(), 0.0))  # b[e] for e in G.edges()
-    for s in sources:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma, _ = shortest_path(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma, _ = dijkstra(G, s, weight)
-        b = _accumulate_edges_subset(b, S, P, sigma, s, targets)
+    b = _sum_over_sources(_edge_subset_sources, G, sources, n_jobs, targets, weight)
     for n in G:  # remove nodes to only return edges
         del b[n]
     b = _rescale_e(b, len(G), normalized=normalized, directed=G.is_directed())
@@ -207,6 +205,33 @@ def betweenness_centrality_source(G, normalized=True, weight=None, sources=None)
     return betweenness_centrality_subset(G, sources, targets, normalized, weight)
 
 
+def _subset_sources(G, sources, targets, weight):
+    """Returns the node betweenness of the shortest paths from sources to targets"""
+    b = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma, _ = shortest_path(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma, _ = dijkstra(G, s, weight)
+        b = _accumulate_subset(b, S, P, sigma, s, targets)
+    return b
+
+
+def _edge_subset_sources(G, sources, targets, weight):
+    """Returns the edge betweenness of the shortest paths from sources to targets"""
+    b = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    b.update(dict.fromkeys(G.edges(), 0.0))  # b[e] for e in G.edges()
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma, _ = shortest_path(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma, _ = dijkstra(G, s, weight)
+        b = _accumulate_edges_subset(b, S, P, sigma, s, targets)
+    return b
+
+
 def _accumulate_subset(betweenness, S, P, sigma, s, targets):
     delta = dict.fromkeys(S, 0.0)
     target_set = set(targets) - {s}
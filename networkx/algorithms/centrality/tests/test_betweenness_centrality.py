@@ -287,6 +287,19 @@ class TestBetweennessCentrality:
         for n in sorted(G):
             assert b[n] == pytest.approx(b_answer[n], abs=1e-7)
 
+    def test_n_jobs(self):
+        """Betweenness centrality: sources divided among processes"""
+        G = nx.les_miserables_graph()
+        for weight in (None, "weight"):
+            b_answer = nx.betweenness_centrality(G, weight=weight)
+            b = nx.betweenness_centrality(G, weight=weight, n_jobs=2)
+            assert b == pytest.approx(b_answer, abs=1e-7)
+        b_answer = nx.betweenness_centrality(G, k=10, seed=1, endpoints=True)
+        b = nx.betweenness_centrality(G, k=10, seed=1, endpoints=True, n_jobs=-1)
+        assert b == pytest.approx(b_answer, abs=1e-7)
+        with pytest.raises(ValueError):
+            nx.betweenness_centrality(G, n_jobs=0)
+
 
 class TestWeightedBetweennessCentrality:
     def test_K5(self):
@@ -602,6 +615,18 @@ class TestEdgeBetweennessCentrality:
         for n in sorted(G.edges()):
             assert b[n] == pytest.approx(b_answer[n], abs=1e-7)
 
+    def test_n_jobs(self):
+        """Edge betweenness centrality: sources divided among processes"""
+        G = nx.gnp_random_graph(30, 0.2, seed=42, directed=True)
+        b_answer = nx.edge_betweenness_centrality(G)
+        b = nx.edge_betweenness_centrality(G, n_jobs=2)
+        assert b == pytest.approx(b_answer, abs=1e-7)
+        G = nx.MultiGraph(weighted_G())
+        G.add_edge(0, 1, weight=1)
+        b_answer = nx.edge_betweenness_centrality(G, weight="weight")
+        b = nx.edge_betweenness_centrality(G, weight="weight", n_jobs=2)
+        assert b == pytest.approx(b_answer, abs=1e-7)
+
 
 class TestWeightedEdgeBetweennessCentrality:
     def test_K5(self):
@@ -115,6 +115,14 @@ class TestSubsetBetweennessCentrality:
         for n in sorted(G):
             assert b[n] == pytest.approx(expected_b[n], abs=1e-7)
 
+    def test_n_jobs(self):
+        """Betweenness Centrality Subset: sources divided among processes"""
+        G = nx.les_miserables_graph()
+        sources, targets = list(G)[:20], list(G)[40:]
+        b_answer = nx.betweenness_centrality_subset(G, sources, targets)
+        b = nx.betweenness_centrality_subset(G, sources, targets, n_jobs=2)
+        assert b == pytest.approx(b_answer, abs=1e-7)
+
 
 class TestBetweennessCentralitySources:
     def test_K5(self):
@@ -224,3 +232,15 @@ class TestEdgeSubsetBetweennessCentrality:
         )
         for n in sorted(G.edges()):
             assert b[n] == pytest.approx(b_answer[n], abs=1e-7)
+
+    def test_n_jobs(self):
+        """Edge betweenness subset centrality: sources divided among processes"""
+        G = nx.les_miserables_graph()
+        sources, targets = list(G)[:20], list(G)[40:]
+        b_answer = nx.edge_betweenness_centrality_subset(
+            G, sources, targets, weight="weight"
+        )
+        b = nx.edge_betweenness_centrality_subset(
+            G, sources, targets, weight="weight", n_jobs=2
+        )
+        assert b == pytest.approx(b_answer, abs=1e-7)
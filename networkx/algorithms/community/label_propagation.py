@@ -2,8 +2,10 @@
 Label propagation community detection algorithms.
 """
 from collections import Counter, defaultdict
+from itertools import repeat
 
 import networkx as nx
+from networkx.classes.csrgraph import CSRAdjacency
 from networkx.utils import groups
 from networkx.utils import not_implemented_for
 from networkx.utils import py_random_state
@@ -108,7 +110,7 @@ def asyn_lpa_communities(G, weight=None, seed=None):
 
 
 @not_implemented_for("directed")
-def label_propagation_communities(G):
+def label_propagation_communities(G, method="sequential", executor=None):
     """Generates community sets determined by label propagation
 
     Finds communities in `G` using a semi-synchronous label propagation
@@ -120,6 +122,20 @@ def label_propagation_communities(G):
     G : graph
         An undirected NetworkX graph.
 
+    method : string, optional (default="sequential")
+        Either "sequential" or "parallel". The "sequential" method updates
+        the nodes of a color class one at a time. The "parallel" method
+        stores the graph in NumPy arrays and updates all the nodes of a
+        color class at once, from the label counts of their neighbors.
+        It is much faster on large graphs and requires NumPy.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        Only used by the "parallel" method. If given, the nodes of large
+        color classes are split into chunks that are updated by `executor`.
+        A :class:`~concurrent.futures.ThreadPoolExecutor` shares the arrays
+        of the graph between the workers, while a process pool has to copy
+        them for every chunk.
+
     Returns
     -------
     communities : iterable
@@ -130,6 +146,18 @@ def label_propagation_communities(G):
     NetworkXNotImplemented
        If the graph is directed
 
+    ValueError
+        If `method` is not "sequential" or "parallel".
+
+    Notes
+    -----
+    The nodes of a color class are never adjacent, so updating them all at
+    once gives the same labels as updating them one at a time. The
+    "parallel" method colors the graph with the Jones-Plassmann algorithm
+    instead of :func:`~networkx.algorithms.coloring.greedy_color`, so it may
+    find different communities. It stops after a round over all the color
+    classes in which no label changed.
+
     References
     ----------
     .. [1] Cordasco, G., & Gargano, L. (2010, December). Community detection
@@ -137,6 +165,10 @@ def label_propagation_communities(G):
        Applications of Social Network Analysis (BASNA), 2010 IEEE International
        Workshop on (pp. 1-8). IEEE.
     """
+    if method == "parallel":
+        return _parallel_label_propagation(G, executor)
+    if method != "sequential":
+        raise ValueError(f"Unknown method {method!r}")
     coloring = _color_network(G)
     # Create a unique label for each node in the graph
     labeling = {v: k for k, v in enumerate(G)}
@@ -152,6 +184,121 @@ def label_propagation_communities(G):
     return clusters.values()
 
 
+# nodes of a color class updated by one task of the executor
+_CHUNK_SIZE = 1 << 16
+
+
+def _parallel_label_propagation(G, executor):
+    """Returns the communities of label propagation on arrays."""
+    import numpy as np
+
+    if isinstance(G._adj, CSRAdjacency):
+        nodes = G._adj.nodes
+        indptr = G._adj.indptr.astype(np.int64)
+        indices = G._adj.indices.astype(np.int64)
+    else:
+        nodes = list(G)
+        index = {u: i for i, u in enumerate(nodes)}
+        degree = np.fromiter((len(G._adj[u]) for u in nodes), np.int64, len(nodes))
+        indptr = np.concatenate([[0], np.cumsum(degree)])
+        indices = np.fromiter(
+            (index[v] for u in nodes for v in G._adj[u]), np.int64, indptr[-1]
+        )
+    n = len(nodes)
+    labels = np.arange(n)
+    classes = _array_color_classes(indptr, indices)
+    changed = n
+    while changed:
+        changed = 0
+        for batch in classes:
+            if executor is None or len(batch) <= _CHUNK_SIZE:
+                new = _prec_max_labels(indptr, indices, labels, batch)
+            else:
+                chunks = np.array_split(batch, -(-len(batch) // _CHUNK_SIZE))
+                new = np.concatenate(
+                    list(
+                        executor.map(
+                            _prec_max_labels,
+                            repeat(indptr),
+                            repeat(indices),
+                            repeat(labels),
+                            chunks,
+                        )
+                    )
+                )
+            changed += np.count_nonzero(new != labels[batch])
+            labels[batch] = new
+
+    clusters = defaultdict(set)
+    for node, label in zip(nodes, labels.tolist()):
+        clusters[label].add(node)
+    return clusters.values()
+
+
+def _array_color_classes(indptr, indices):
+    """Returns a list of arrays of nodes with neighbors, no two of them
+    adjacent in a list.
+
+    Each round takes the nodes whose priority is larger than that of all
+    their neighbors not taken yet, as in the Jones-Plassmann algorithm.
+    Nodes of larger degree have larger priority.
+    """
+    import numpy as np
+
+    n = len(indptr) - 1
+    degree = np.diff(indptr)
+    rows = np.repeat(np.arange(n), degree)
+    cols = indices
+    loop = rows == cols
+    rows, cols = rows[~loop], cols[~loop]
+    priority = np.empty(n, dtype=np.int64)
+    priority[np.lexsort((-np.arange(n), degree))] = np.arange(n)
+    # nodes without neighbors keep their label
+    remaining = degree > 0
+    classes = []
+    while remaining.any():
+        live = remaining[rows] & remaining[cols]
+        rows, cols = rows[live], cols[live]
+        # the largest priority of the remaining neighbors of every node; the
+        # edges are sorted by their first node and stored in both directions
+        largest = np.full(n, -1)
+        if len(rows):
+            first = np.flatnonzero(np.diff(rows, prepend=-1))
+            largest[rows[first]] = np.maximum.reduceat(priority[cols], first)
+        chosen = np.flatnonzero(remaining & (priority > largest))
+        classes.append(chosen)
+        remaining[chosen] = False
+    return classes
+
+
+def _prec_max_labels(indptr, indices, labels, batch):
+    """Returns the labels of the nodes of `batch` after a Prec-Max update.
+
+    Every node of `batch` must have a neighbor.
+    """
+    import numpy as np
+
+    n = len(labels)
+    starts = indptr[batch]
+    counts = indptr[batch + 1] - starts
+    edges = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    edges += np.arange(counts.sum())
+    owner = np.repeat(np.arange(len(batch)), counts)
+    # the frequency of every label among the neighbors of every node
+    pairs, freq = np.unique(owner * n + labels[indices[edges]], return_counts=True)
+    owner, label = pairs // n, pairs % n
+    first = np.flatnonzero(np.diff(owner, prepend=-1))
+    max_freq = np.maximum.reduceat(freq, first)
+    best = freq == max_freq[owner]
+    current = labels[batch]
+    # keep the current label if it is among the most frequent, else take the
+    # largest of them
+    keep = np.zeros(len(batch), dtype=bool)
+    keep[owner[best & (label == current[owner])]] = True
+    largest = np.maximum.reduceat(np.where(best, label, -1), first)
+    return np.where(keep, current, largest)
+
+
 def _color_network(G):
     """Colors the network so that neighboring nodes all have distinct colors.
 
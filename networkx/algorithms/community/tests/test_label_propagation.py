@@ -6,6 +6,7 @@ import pytest
 import networkx as nx
 from networkx.algorithms.community import label_propagation_communities
 from networkx.algorithms.community import asyn_lpa_communities
+from networkx.algorithms.community.label_propagation import _labeling_complete
 
 
 def test_directed_not_supported():
@@ -117,6 +118,70 @@ def test_termination():
     asyn_lpa_communities(test2)
 
 
+def _check_complete(G, communities):
+    labeling = {v: i for i, c in enumerate(communities) for v in c}
+    assert set(labeling) == set(G)
+    assert _labeling_complete(labeling, G)
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        nx.Graph(),
+        nx.empty_graph(3),
+        nx.karate_club_graph(),
+        nx.les_miserables_graph(),
+        nx.barabasi_albert_graph(200, 3, seed=1),
+    ],
+)
+def test_parallel_complete(G):
+    pytest.importorskip("numpy")
+    communities = list(label_propagation_communities(G, method="parallel"))
+    _check_complete(G, communities)
+
+
+def test_parallel_communities():
+    pytest.importorskip("numpy")
+    G = nx.caveman_graph(4, 5)
+    G.add_edge(0, 0)
+    communities = label_propagation_communities(G, method="parallel")
+    expected = {frozenset(range(k, k + 5)) for k in range(0, 20, 5)}
+    assert {frozenset(c) for c in communities} == expected
+
+
+def test_parallel_executor(monkeypatch):
+    pytest.importorskip("numpy")
+    from concurrent.futures import ThreadPoolExecutor
+
+    from networkx.algorithms.community import label_propagation
+
+    G = nx.barabasi_albert_graph(300, 2, seed=3)
+    expected = {
+        frozenset(c) for c in label_propagation_communities(G, method="parallel")
+    }
+    monkeypatch.setattr(label_propagation, "_CHUNK_SIZE", 10)
+    with ThreadPoolExecutor(2) as executor:
+        communities = label_propagation_communities(
+            G, method="parallel", executor=executor
+        )
+        assert {frozenset(c) for c in communities} == expected
+
+
+def test_parallel_csrgraph():
+    pytest.importorskip("numpy")
+    G = nx.karate_club_graph()
+    expected = {
+        frozenset(c) for c in label_propagation_communities(G, method="parallel")
+    }
+    communities = label_propagation_communities(nx.CSRGraph(G), method="parallel")
+    assert {frozenset(c) for c in communities} == expected
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        label_propagation_communities(nx.path_graph(3), method="spam")
+
+
 class TestAsynLpaCommunities:
     def _check_communities(self, G, expected):
         """Checks that the communities computed from the given graph ``G``
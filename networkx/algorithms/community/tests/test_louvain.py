@@ -1,6 +1,9 @@
+import pytest
+
 import networkx as nx
 from networkx.algorithms.community import (
     louvain_communities,
+    louvain_partitions,
     modularity,
     is_partition,
     partition_quality,
@@ -126,3 +129,71 @@ def test_threshold():
     mod2 = modularity(G, partition2)
 
     assert mod1 < mod2
+
+
+def test_parallel_quality():
+    pytest.importorskip("scipy")
+    G = nx.LFR_benchmark_graph(
+        250, 3, 1.5, 0.009, average_degree=5, min_community=20, seed=10
+    )
+    H = nx.gn_graph(200, seed=1234)
+    for graph in [G, H, nx.MultiGraph(G), nx.MultiDiGraph(H)]:
+        partition = louvain_communities(graph, seed=1, method="parallel")
+        sequential = louvain_communities(graph, seed=1)
+        assert is_partition(graph, partition)
+        assert modularity(graph, partition) >= modularity(graph, sequential) - 0.02
+
+
+def test_parallel_directed_quality():
+    pytest.importorskip("scipy")
+    # the gain of a directed move counts the edges in both directions
+    G = nx.gnp_random_graph(300, 0.03, seed=3, directed=True)
+    partition = louvain_communities(G, seed=1, method="parallel")
+    undirected = louvain_communities(G.to_undirected(), seed=1, method="parallel")
+    assert is_partition(G, partition)
+    assert modularity(G, partition) >= modularity(G, undirected) - 0.02
+
+
+def test_parallel_partitions():
+    pytest.importorskip("scipy")
+    G = nx.karate_club_graph()
+    partitions = list(louvain_partitions(G, seed=3, method="parallel"))
+    mods = [modularity(G, p) for p in partitions]
+    assert all(is_partition(G, p) for p in partitions)
+    assert mods == sorted(mods)
+    assert mods[-1] > 0.4
+    # every level merges communities of the level before
+    for finer, coarser in zip(partitions, partitions[1:]):
+        assert all(any(c <= d for d in coarser) for c in finer)
+
+
+def test_parallel_weights_and_resolution():
+    pytest.importorskip("scipy")
+    G = nx.LFR_benchmark_graph(
+        250, 3, 1.5, 0.009, average_degree=5, min_community=20, seed=10
+    )
+    partition1 = louvain_communities(G, resolution=0.5, seed=12, method="parallel")
+    partition2 = louvain_communities(G, seed=12, method="parallel")
+    partition3 = louvain_communities(G, resolution=2, seed=12, method="parallel")
+    assert len(partition1) <= len(partition2) <= len(partition3)
+
+    H = nx.Graph([(0, 1), (1, 2), (2, 3), (3, 0)])
+    nx.set_edge_attributes(H, {(0, 1): 10, (2, 3): 10}, "foo")
+    expected = [{0, 1}, {2, 3}]
+    assert louvain_communities(H, weight="foo", seed=1, method="parallel") == expected
+    H.add_edge(0, 0, foo=1)
+    assert louvain_communities(H, weight="foo", seed=1, method="parallel") == expected
+
+
+def test_parallel_small_graphs():
+    pytest.importorskip("scipy")
+    assert list(louvain_partitions(nx.Graph(), method="parallel")) == [[]]
+    partitions = list(louvain_partitions(nx.empty_graph(3), method="parallel"))
+    assert partitions == [[{0}, {1}, {2}]]
+    G = nx.DiGraph([(0, 1), (1, 0), (2, 3)])
+    assert louvain_communities(G, method="parallel") == [{0, 1}, {2, 3}]
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        louvain_communities(nx.karate_club_graph(), method="fast")
@@ -1,5 +1,10 @@
 """Connected components."""
 import networkx as nx
+from networkx.classes.csrgraph import (
+    CSRAdjacency,
+    _csr_bfs_levels,
+    _csr_component_labels,
+)
 from networkx.utils.decorators import not_implemented_for
 from ...utils import arbitrary_element
 
@@ -58,6 +63,9 @@ def connected_components(G):
     For undirected graphs only.
 
     """
+    if isinstance(G._adj, CSRAdjacency):
+        yield from _csr_connected_components(G._adj)
+        return
     seen = set()
     for v in G:
         if v not in seen:
@@ -172,8 +180,24 @@ def node_connected_component(G, n):
     return _plain_bfs(G, n)
 
 
+def _csr_connected_components(csr):
+    """Yields the components of a CSRAdjacency in the order of their first node"""
+    import numpy as np
+
+    labels = _csr_component_labels(csr)
+    order = np.argsort(labels, kind="stable")
+    bounds = np.flatnonzero(np.diff(labels[order])) + 1
+    nodes = csr.nodes
+    for component in np.split(order, bounds):
+        yield {nodes[i] for i in component.tolist()}
+
+
 def _plain_bfs(G, source):
     """A fast BFS node generator"""
+    if isinstance(G._adj, CSRAdjacency):
+        nodes = G._adj.nodes
+        levels = _csr_bfs_levels(G._adj, [source])
+        return {nodes[i] for frontier in levels for i in frontier.tolist()}
     G_adj = G.adj
     seen = set()
     nextlevel = {source}
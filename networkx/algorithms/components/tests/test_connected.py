@@ -95,6 +95,16 @@ class TestConnected:
         G.add_nodes_from([1, 2])
         assert not nx.is_connected(G)
 
+    def test_connected_components_csr(self):
+        pytest.importorskip("numpy")
+        G = nx.union(self.G, nx.empty_graph(range(20, 23)))
+        H = nx.CSRGraph(G)
+        assert list(nx.connected_components(H)) == list(nx.connected_components(G))
+        assert nx.number_connected_components(H) == 6
+        assert nx.node_connected_component(H, 4) == {4, 5, 6, 7, 8, 9}
+        assert nx.is_connected(nx.CSRGraph(self.grid))
+        assert not nx.is_connected(H)
+
     def test_connected_raise(self):
         with pytest.raises(NetworkXNotImplemented):
             next(nx.connected_components(self.DG))
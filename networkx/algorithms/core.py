@@ -28,7 +28,11 @@ Scientific Reports 6, 31708 (2016)
 http://doi.org/10.1038/srep31708
 
 """
+from collections import defaultdict
+from heapq import heappop, heappush
+
 import networkx as nx
+from networkx.classes.csrgraph import CSRAdjacency
 from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 
@@ -40,7 +44,9 @@ __all__ = [
     "k_crust",
     "k_corona",
     "k_truss",
+    "truss_number",
     "onion_layers",
+    "CoreMaintainer",
 ]
 
 
@@ -76,6 +82,14 @@ def core_number(G):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
+    The algorithm of [1]_ keeps the nodes in an array sorted by their
+    current degree, with the start of every degree bin, so it takes
+    $O(m)$ time.
+
+    See Also
+    --------
+    CoreMaintainer
+
     References
     ----------
     .. [1] An O(m) Algorithm for Cores Decomposition of Networks
@@ -88,31 +102,62 @@ def core_number(G):
             "Consider using G.remove_edges_from(nx.selfloop_edges(G))."
         )
         raise NetworkXError(msg)
-    degrees = dict(G.degree())
-    # Sort nodes by degree.
-    nodes = sorted(degrees, key=degrees.get)
-    bin_boundaries = [0]
-    curr_degree = 0
-    for i, v in enumerate(nodes):
-        if degrees[v] > curr_degree:
-            bin_boundaries.extend([i] * (degrees[v] - curr_degree))
-            curr_degree = degrees[v]
-    node_pos = {v: pos for pos, v in enumerate(nodes)}
+    nodes, core, _ = _core_order(G)
+    return dict(zip(nodes, core))
+
+
+def _core_order(G):
+    """Returns the list of nodes, the list of their core numbers and the
+    order in which the algorithm removes them, as indices into the list."""
+    if not G.is_directed() and isinstance(G._adj, CSRAdjacency):
+        nodes = G._adj.nodes
+        indptr = G._adj.indptr.tolist()
+        indices = G._adj.indices.tolist()
+    else:
+        nodes = list(G)
+        index = {v: i for i, v in enumerate(nodes)}
+        indptr = [0]
+        indices = []
+        for v in nodes:
+            indices.extend(index[u] for u in nx.all_neighbors(G, v))
+            indptr.append(len(indices))
+    n = len(nodes)
     # The initial guess for the core number of a node is its degree.
-    core = degrees
-    nbrs = {v: list(nx.all_neighbors(G, v)) for v in G}
-    for v in nodes:
-        for u in nbrs[v]:
-            if core[u] > core[v]:
-                nbrs[u].remove(v)
-                pos = node_pos[u]
-                bin_start = bin_boundaries[core[u]]
-                node_pos[u] = bin_start
-                node_pos[nodes[bin_start]] = pos
-                nodes[bin_start], nodes[pos] = nodes[pos], nodes[bin_start]
-                bin_boundaries[core[u]] += 1
-                core[u] -= 1
-    return core
+    core = [indptr[i + 1] - indptr[i] for i in range(n)]
+    # Sort nodes by degree with a bucket sort; bin_start[d] is the position
+    # in vert of the first node of degree d, and pos is the inverse of vert.
+    bin_start = [0] * (max(core, default=0) + 1)
+    for d in core:
+        bin_start[d] += 1
+    start = 0
+    for d, num in enumerate(bin_start):
+        bin_start[d] = start
+        start += num
+    pos = [0] * n
+    vert = [0] * n
+    for v, d in enumerate(core):
+        pos[v] = bin_start[d]
+        vert[pos[v]] = v
+        bin_start[d] += 1
+    for d in range(len(bin_start) - 1, 0, -1):
+        bin_start[d] = bin_start[d - 1]
+    if bin_start:
+        bin_start[0] = 0
+    for v in vert:
+        core_v = core[v]
+        for u in indices[indptr[v] : indptr[v + 1]]:
+            core_u = core[u]
+            if core_u > core_v:
+                # move u to the start of its bin and shrink the bin
+                pu = pos[u]
+                pw = bin_start[core_u]
+                w = vert[pw]
+                if u != w:
+                    pos[u], pos[w] = pw, pu
+                    vert[pu], vert[pw] = w, u
+                bin_start[core_u] += 1
+                core[u] = core_u - 1
+    return nodes, core, vert
 
 
 def find_cores(G):
@@ -380,7 +425,7 @@ def k_corona(G, k, core_number=None):
 
 @not_implemented_for("directed")
 @not_implemented_for("multigraph")
-def k_truss(G, k):
+def k_truss(G, k, truss_number=None):
     """Returns the k-truss of `G`.
 
     The k-truss is the maximal induced subgraph of `G` which contains at least
@@ -392,6 +437,9 @@ def k_truss(G, k):
       An undirected graph
     k : int
       The order of the truss
+    truss_number : dictionary, optional
+      Precomputed truss numbers keyed by edge for the graph G, as returned
+      by :func:`truss_number`.
 
     Returns
     -------
@@ -413,6 +461,10 @@ def k_truss(G, k):
 
     Graph, node, and edge attributes are copied to the subgraph.
 
+    The k-truss consists of the edges whose truss number is at least `k`,
+    so once the truss numbers are known the k-truss is found in linear
+    time for any `k`.
+
     K-trusses were originally defined in [2] which states that the k-truss
     is the maximal induced subgraph where each edge belongs to at least
     `k-2` triangles. A more recent paper, [1], uses a slightly different
@@ -425,28 +477,137 @@ def k_truss(G, k):
        David G. Harris, 2018. https://arxiv.org/abs/1806.05523v2
     .. [2] Trusses: Cohesive Subgraphs for Social Network Analysis. Jonathan
        Cohen, 2005.
-    """
-    H = G.copy()
-
-    n_dropped = 1
-    while n_dropped > 0:
-        n_dropped = 0
-        to_drop = []
-        seen = set()
-        for u in H:
-            nbrs_u = set(H[u])
-            seen.add(u)
-            new_nbrs = [v for v in nbrs_u if v not in seen]
-            for v in new_nbrs:
-                if len(nbrs_u & set(H[v])) < (k - 2):
-                    to_drop.append((u, v))
-        H.remove_edges_from(to_drop)
-        n_dropped = len(to_drop)
-        H.remove_nodes_from(list(nx.isolates(H)))
 
+    See Also
+    --------
+    truss_number
+    """
+    if truss_number is None:
+        truss_number = nx.truss_number(G)
+    edges = [e for e, t in truss_number.items() if t >= k]
+    nodes = {n for e in edges for n in e}
+    # CSRGraph() without data is a mutable Graph
+    H = G.__class__()
+    H.graph.update(G.graph)
+    H.add_nodes_from((n, d) for n, d in G._node.items() if n in nodes)
+    H.add_edges_from((u, v, G._adj[u][v]) for u, v in edges)
     return H
 
 
+@not_implemented_for("directed")
+@not_implemented_for("multigraph")
+def truss_number(G):
+    """Returns the truss number of each edge.
+
+    The truss number of an edge is the largest value k of a k-truss
+    containing that edge, see :func:`k_truss`. Edges in no triangle have
+    truss number 2.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph
+
+    Returns
+    -------
+    truss_number : dictionary
+       A dictionary keyed by edge, as ordered in ``G.edges``, to the truss
+       number.
+
+    Raises
+    ------
+    NetworkXError
+        The truss number is not implemented for graphs with self loops.
+
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    Examples
+    --------
+    >>> G = nx.complete_graph(4)
+    >>> G.add_edge(3, 4)
+    >>> nx.truss_number(G)
+    {(0, 1): 4, (0, 2): 4, (0, 3): 4, (1, 2): 4, (1, 3): 4, (2, 3): 4, (3, 4): 2}
+
+    Notes
+    -----
+    The support of an edge, the number of triangles that contain it, is
+    counted once. Then the edges are removed in order of increasing
+    support with a bucket queue, and every removal decrements the
+    support of the other edges of its triangles [1]_. This takes
+    $O(m^{3/2})$ time.
+
+    See Also
+    --------
+    k_truss
+
+    References
+    ----------
+    .. [1] Truss Decomposition in Massive Networks. Jia Wang and James
+       Cheng, Proceedings of the VLDB Endowment 5(9), pp. 812-823, 2012.
+       https://doi.org/10.14778/2311906.2311909
+    """
+    if nx.number_of_selfloops(G) > 0:
+        msg = (
+            "Input graph has self loops which is not permitted; "
+            "Consider using G.remove_edges_from(nx.selfloop_edges(G))."
+        )
+        raise NetworkXError(msg)
+    edges = list(G.edges())
+    nbrs = {v: set(G._adj[v]) for v in G}
+    # the index of every edge, from both ends
+    edge_id = {v: {} for v in G}
+    for i, (u, v) in enumerate(edges):
+        edge_id[u][v] = edge_id[v][u] = i
+    m = len(edges)
+    support = [len(nbrs[u] & nbrs[v]) for u, v in edges]
+    # Sort edges by support with a bucket sort; bin_start[s] is the position
+    # in order of the first edge of support s, and pos is the inverse of order.
+    bin_start = [0] * (max(support, default=0) + 1)
+    for s in support:
+        bin_start[s] += 1
+    start = 0
+    for s, num in enumerate(bin_start):
+        bin_start[s] = start
+        start += num
+    pos = [0] * m
+    order = [0] * m
+    for e, s in enumerate(support):
+        pos[e] = bin_start[s]
+        order[pos[e]] = e
+        bin_start[s] += 1
+    for s in range(len(bin_start) - 1, 0, -1):
+        bin_start[s] = bin_start[s - 1]
+    if bin_start:
+        bin_start[0] = 0
+    for e in order:
+        s = support[e]
+        u, v = edges[e]
+        nbrs_u, nbrs_v = nbrs[u], nbrs[v]
+        if len(nbrs_u) > len(nbrs_v):
+            u, v, nbrs_u, nbrs_v = v, u, nbrs_v, nbrs_u
+        ids_u, ids_v = edge_id[u], edge_id[v]
+        for w in nbrs_u:
+            if w not in nbrs_v:
+                continue
+            for f in (ids_u[w], ids_v[w]):
+                s_f = support[f]
+                if s_f > s:
+                    # move f to the start of its bin and shrink the bin
+                    pf = pos[f]
+                    pg = bin_start[s_f]
+                    g = order[pg]
+                    if f != g:
+                        pos[f], pos[g] = pg, pf
+                        order[pf], order[pg] = g, f
+                    bin_start[s_f] += 1
+                    support[f] = s_f - 1
+        # remove the edge
+        nbrs_u.discard(v)
+        nbrs_v.discard(u)
+    return {e: s + 2 for e, s in zip(edges, support)}
+
+
 @not_implemented_for("multigraph")
 @not_implemented_for("directed")
 def onion_layers(G):
@@ -542,3 +703,348 @@ def onion_layers(G):
         current_layer = current_layer + 1
     # Returns the dictionaries containing the onion layer of each vertices.
     return od_layers
+
+
+class CoreMaintainer:
+    """Maintains the core numbers of a graph while edges are added and removed.
+
+    The maintainer computes the core numbers of `G` once and then updates
+    them after the edge insertions and deletions given to :meth:`add_edges`
+    and :meth:`remove_edges`, which also apply them to `G`. Adding or
+    removing an edge changes the core number of a node by at most one, and
+    only of nodes of the subcore of its endpoint of smaller core number
+    $k$: the nodes with core number $k$ that are connected to it through
+    nodes with core number $k$ [1]_. A removal visits only the nodes of the
+    subcore that leave the $k$-core and their neighbors, as in the traversal
+    algorithm of [1]_. An insertion visits the nodes of the subcore that
+    come after its endpoint in the order in which the core decomposition
+    removes the nodes, which is maintained as in [2]_. An update is usually
+    much faster than calling :func:`core_number` again.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph without self loops, modified in place by
+       :meth:`add_edges` and :meth:`remove_edges`.
+
+    Attributes
+    ----------
+    core_number : dict
+       The current core number of every node of `G`. It can be given to
+       :func:`k_core`, :func:`k_shell`, :func:`k_crust` and
+       :func:`k_corona` instead of computing the core numbers again.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed or a multigraph.
+
+    NetworkXError
+        If `G` has self loops.
+
+    Examples
+    --------
+    >>> G = nx.cycle_graph(4)
+    >>> maintainer = nx.CoreMaintainer(G)
+    >>> maintainer.add_edges([(0, 2), (1, 3)])
+    >>> maintainer.core_number
+    {0: 3, 1: 3, 2: 3, 3: 3}
+    >>> maintainer.remove_edges([(0, 1)])
+    >>> maintainer.core_number == nx.core_number(G)
+    True
+    >>> sorted(nx.k_shell(G, 2, core_number=maintainer.core_number))
+    [0, 1, 2, 3]
+
+    See Also
+    --------
+    core_number
+
+    References
+    ----------
+    .. [1] A. E. Sarıyüce, B. Gedik, G. Jacques-Silva, K.-L. Wu and
+       Ü. V. Çatalyürek, "Streaming Algorithms for k-core Decomposition",
+       Proceedings of the VLDB Endowment 6(6), pp. 433-444, 2013.
+       https://doi.org/10.14778/2536336.2536344
+    .. [2] Y. Zhang, J. X. Yu, Y. Zhang and L. Qin, "A Fast Order-Based
+       Approach for Core Maintenance", ICDE 2017, pp. 337-348.
+       https://doi.org/10.1109/ICDE.2017.93
+    """
+
+    def __init__(self, G):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented("not implemented for directed type")
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented("not implemented for multigraph type")
+        if nx.number_of_selfloops(G) > 0:
+            msg = (
+                "Input graph has self loops which is not permitted; "
+                "Consider using G.remove_edges_from(nx.selfloop_edges(G))."
+            )
+            raise NetworkXError(msg)
+        self.G = G
+        nodes, core, vert = _core_order(G)
+        self.core_number = dict(zip(nodes, core))
+        # The nodes in the order the core decomposition removes them, with
+        # the nodes of every core number in a doubly linked list and
+        # increasing labels to compare their positions.
+        self._label = {}
+        self._prev = {}
+        self._next = {}
+        self._head = {}
+        self._tail = {}
+        for i in vert:
+            self._append(nodes[i])
+        # the number of neighbors of every node after it in the order
+        position = {nodes[i]: p for p, i in enumerate(vert)}
+        adj = G._adj
+        self._deg_plus = {
+            v: sum(1 for x in adj[v] if position[x] > position[v]) for v in position
+        }
+
+    def add_edges(self, ebunch_to_add):
+        """Adds the edges in `ebunch_to_add` to the graph and updates the
+        core numbers.
+
+        Parameters
+        ----------
+        ebunch_to_add : container of edges
+            Edges as accepted by :meth:`Graph.add_edges_from`. Nodes that
+            are not in the graph are added.
+
+        Raises
+        ------
+        NetworkXError
+            If an edge is a self loop.
+        """
+        G = self.G
+        core = self.core_number
+        for e in ebunch_to_add:
+            u, v = e[:2]
+            if u == v:
+                raise NetworkXError(f"Self loop ({u}, {v}) is not permitted")
+            new = not G.has_edge(u, v)
+            G.add_edges_from([e])
+            for w in (u, v):
+                if w not in core:
+                    core[w] = 0
+                    self._deg_plus[w] = 0
+                    self._append(w)
+            if new:
+                self._insert(u, v)
+
+    def remove_edges(self, ebunch):
+        """Removes the edges in `ebunch` from the graph and updates the
+        core numbers.
+
+        Parameters
+        ----------
+        ebunch : list or container of edge tuples
+            Edges as accepted by :meth:`Graph.remove_edges_from`. Edges that
+            are not in the graph are ignored.
+        """
+        G = self.G
+        for e in ebunch:
+            u, v = e[:2]
+            if G.has_edge(u, v):
+                G.remove_edge(u, v)
+                self._remove(u, v)
+
+    def _before(self, u, v):
+        """Returns True if u comes before v in the order."""
+        core = self.core_number
+        label = self._label
+        return (core[u], label[u]) < (core[v], label[v])
+
+    def _insert(self, u, v):
+        """Increments the core numbers that the new edge (u, v) increases.
+
+        The nodes of core number k after u are visited in order, as if the
+        core decomposition removed them again, while the candidates for the
+        (k + 1)-core are moved to the end of the order [2]_.
+        """
+        adj = self.G._adj
+        core = self.core_number
+        label = self._label
+        deg_plus = self._deg_plus
+        if self._before(v, u):
+            u, v = v, u
+        k = core[u]
+        deg_plus[u] += 1
+        if deg_plus[u] <= k:
+            return
+        # the number of neighbors of every node that became candidates
+        # before it
+        deg_star = defaultdict(int)
+        candidates = {}  # in the order they were found
+        visited = set()
+        # the nodes that stay in the k-core, with the candidates that are
+        # moved back right after them
+        moved_back = []
+        heap = []
+        w = u
+        while w is not None:
+            visited.add(w)
+            if deg_plus[w] + deg_star[w] > k:
+                candidates[w] = None
+                for x in adj[w]:
+                    if core[x] == k and label[x] > label[w] and x not in visited:
+                        if deg_star[x] == 0:
+                            heappush(heap, (label[x], x))
+                        deg_star[x] += 1
+            elif deg_star[w] > 0:
+                deg_plus[w] += deg_star.pop(w)
+                queue = []
+                queued = set()
+                for x in adj[w]:
+                    if x in candidates:
+                        deg_plus[x] -= 1
+                        if deg_plus[x] + deg_star[x] <= k and x not in queued:
+                            queue.append(x)
+                            queued.add(x)
+                # candidates without enough neighbors left stay in the k-core
+                after = []
+                for y in queue:
+                    del candidates[y]
+                    after.append(y)
+                    deg_plus[y] += deg_star.pop(y, 0)
+                    for x in adj[y]:
+                        if x in candidates:
+                            if label[x] < label[y]:
+                                deg_plus[x] -= 1
+                            else:
+                                deg_star[x] -= 1
+                            if deg_plus[x] + deg_star[x] <= k and x not in queued:
+                                queue.append(x)
+                                queued.add(x)
+                        elif core[x] == k and label[x] > label[y] and x not in visited:
+                            deg_star[x] -= 1
+                if after:
+                    moved_back.append((w, after))
+            # the next node whose neighbors became candidates
+            w = None
+            while heap:
+                _, x = heappop(heap)
+                if x not in visited and deg_star[x] > 0:
+                    w = x
+                    break
+        for w, after in moved_back:
+            for y in after:
+                self._unlink(y)
+                self._insert_after(w, y)
+                w = y
+        for w in candidates:
+            self._unlink(w)
+        for w in reversed(candidates):
+            core[w] = k + 1
+            self._prepend(w)
+
+    def _remove(self, u, v):
+        """Decrements the core numbers that removing the edge (u, v)
+        decreases."""
+        adj = self.G._adj
+        core = self.core_number
+        deg_plus = self._deg_plus
+        deg_plus[u if self._before(u, v) else v] -= 1
+        k = min(core[u], core[v])
+        # the number of neighbors of every visited node of core number k
+        # that are still in the k-core
+        cd = {}
+        dropped = {}  # in the order they leave the k-core
+        stack = []
+        for w in (u, v):
+            if core[w] == k and w not in cd:
+                cd[w] = sum(1 for y in adj[w] if core[y] >= k)
+                if cd[w] < k:
+                    dropped[w] = None
+                    stack.append(w)
+        while stack:
+            w = stack.pop()
+            for x in adj[w]:
+                if core[x] != k or x in dropped:
+                    continue
+                if x not in cd:
+                    cd[x] = sum(1 for y in adj[x] if core[y] >= k)
+                cd[x] -= 1
+                if cd[x] < k:
+                    dropped[x] = None
+                    stack.append(x)
+        # move the dropped nodes to the end of the nodes of core number k - 1
+        for w in dropped:
+            for x in adj[w]:
+                if core[x] == k and x not in dropped and self._before(x, w):
+                    deg_plus[x] -= 1
+        for w in dropped:
+            self._unlink(w)
+            core[w] = k - 1
+            self._append(w)
+        rank = {w: i for i, w in enumerate(dropped)}
+        for w in dropped:
+            deg_plus[w] = sum(
+                1 for x in adj[w] if core[x] >= k or rank.get(x, -1) > rank[w]
+            )
+
+    # The order of the nodes of every core number is a doubly linked list
+    # with increasing integer labels, relabeled when two labels are adjacent.
+
+    def _unlink(self, v):
+        k = self.core_number[v]
+        prev, next = self._prev.pop(v), self._next.pop(v)
+        if prev is None:
+            self._head[k] = next
+        else:
+            self._next[prev] = next
+        if next is None:
+            self._tail[k] = prev
+        else:
+            self._prev[next] = prev
+
+    def _append(self, v):
+        k = self.core_number[v]
+        tail = self._tail.get(k)
+        self._prev[v] = tail
+        self._next[v] = None
+        self._tail[k] = v
+        if tail is None:
+            self._head[k] = v
+            self._label[v] = 0
+        else:
+            self._next[tail] = v
+            self._label[v] = self._label[tail] + _LABEL_GAP
+
+    def _prepend(self, v):
+        k = self.core_number[v]
+        head = self._head.get(k)
+        self._prev[v] = None
+        self._next[v] = head
+        self._head[k] = v
+        if head is None:
+            self._tail[k] = v
+            self._label[v] = 0
+        else:
+            self._prev[head] = v
+            self._label[v] = self._label[head] - _LABEL_GAP
+
+    def _insert_after(self, p, v):
+        k = self.core_number[p]
+        next = self._next[p]
+        if next is None:
+            self._append(v)
+            return
+        label = self._label
+        if label[next] - label[p] < 2:
+            self._relabel(k)
+        self._prev[v], self._next[v] = p, next
+        self._next[p] = self._prev[next] = v
+        label[v] = (label[p] + label[next]) // 2
+
+    def _relabel(self, k):
+        v = self._head[k]
+        i = 0
+        while v is not None:
+            self._label[v] = i
+            i += _LABEL_GAP
+            v = self._next[v]
+
+
+# the distance between the labels of consecutive nodes in a new order
+_LABEL_GAP = 1 << 20
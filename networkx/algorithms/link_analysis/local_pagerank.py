@@ -0,0 +1,169 @@
+"""Local approximation of personalized PageRank by pushing residual mass."""
+from collections import deque
+from heapq import nlargest
+from operator import itemgetter
+
+import networkx as nx
+
+__all__ = ["local_pagerank"]
+
+
+def local_pagerank(G, seeds, alpha=0.85, epsilon=1.0e-6, weight="weight", k=None):
+    r"""Returns an approximation of the personalized PageRank of seed nodes.
+
+    Unlike :func:`pagerank`, which iterates over the whole graph, this
+    function only visits the nodes near the seeds that receive a significant
+    part of the PageRank mass [1]_. Its running time depends on `alpha` and
+    `epsilon` but not on the size of the graph, which makes it suitable for
+    "related nodes" queries on large graphs.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs are treated as directed graphs
+      with two directed edges for each undirected edge.
+
+    seeds : node, iterable of nodes or dict
+      The node or nodes the random walk restarts from, with equal
+      probabilities, or a personalization dict keyed by node as for
+      :func:`pagerank`.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    epsilon : float, optional
+      Error tolerance. A node is processed only while its residual mass
+      is at least ``epsilon`` times its (weighted) out-degree.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    k : integer, optional
+      If not None, only return the `k` nodes with the highest values.
+
+    Returns
+    -------
+    pagerank : dictionary
+       Dictionary of the nodes with a non-zero approximate PageRank,
+       with the approximation as value. If `k` is not None, the `k` nodes
+       with the highest values in decreasing order of value.
+
+    Raises
+    ------
+    NodeNotFound
+        If a seed is not in `G`.
+
+    ZeroDivisionError
+        If all personalization values are zero.
+
+    Examples
+    --------
+    >>> G = nx.karate_club_graph()
+    >>> ppr = nx.local_pagerank(G, 0, epsilon=1e-4, k=3)
+    >>> list(ppr)
+    [0, 1, 2]
+    >>> pr = nx.pagerank(G, personalization={0: 1}, tol=1e-10)
+    >>> all(abs(pr[n] - ppr[n]) <= 1e-4 * G.degree(n, weight="weight") for n in ppr)
+    True
+
+    Notes
+    -----
+    Every node $u$ has a residual $r(u)$, initially the personalization
+    vector, and an estimate $p(u)$, initially zero. While some node has
+    $r(u) \ge \epsilon d(u)$, where $d(u)$ is its out-degree, a fraction
+    $1 - \alpha$ of its residual is moved to $p(u)$ and the rest is pushed
+    to its out-neighbors in proportion to the edge weights. Residual mass
+    of nodes without out-edges is pushed back to the seeds, as
+    :func:`pagerank` does by default. Each push removes at least
+    $(1 - \alpha)\epsilon$ of residual mass, so there are at most
+    $1/((1 - \alpha)\epsilon)$ pushes.
+
+    The estimates never exceed the personalized PageRank and their total
+    error is the remaining residual mass, one minus the sum of the
+    returned values. For undirected graphs the error of every node $v$ is
+    at most $\epsilon d(v)$ [1]_.
+
+    See Also
+    --------
+    pagerank, PageRankOperator
+
+    References
+    ----------
+    .. [1] R. Andersen, F. Chung and K. Lang,
+       "Local Graph Partitioning using PageRank Vectors",
+       Proceedings of FOCS 2006, pp. 475-486.
+       https://doi.org/10.1109/FOCS.2006.44
+    """
+    if isinstance(seeds, dict):
+        personalization = seeds
+    elif seeds in G:
+        personalization = {seeds: 1}
+    else:
+        try:
+            personalization = dict.fromkeys(seeds, 1)
+        except TypeError as err:
+            raise nx.NodeNotFound(f"Seed {seeds} is not in G") from err
+    for n in personalization:
+        if n not in G:
+            raise nx.NodeNotFound(f"Seed {n} is not in G")
+    total = sum(personalization.values())
+    if total == 0:
+        raise ZeroDivisionError
+    restart = [(n, value / total) for n, value in personalization.items() if value]
+
+    succ = G._succ if G.is_directed() else G._adj
+    multigraph = G.is_multigraph()
+    out_edges = {}  # node: ([(nbr, fraction of out-weight)], out-degree)
+
+    def edges_of(u):
+        if u not in out_edges:
+            if multigraph and weight is None:
+                nbr_weights = [(v, len(kd)) for v, kd in succ[u].items()]
+            elif multigraph:
+                nbr_weights = [
+                    (v, sum(d.get(weight, 1) for d in kd.values()))
+                    for v, kd in succ[u].items()
+                ]
+            elif weight is None:
+                nbr_weights = [(v, 1) for v in succ[u]]
+            else:
+                nbr_weights = [(v, d.get(weight, 1)) for v, d in succ[u].items()]
+            degree = sum(w for v, w in nbr_weights)
+            if degree == 0:
+                # mass of dangling nodes goes back to the seeds
+                out_edges[u] = (restart, 0)
+            else:
+                out_edges[u] = ([(v, w / degree) for v, w in nbr_weights], degree)
+        return out_edges[u]
+
+    def threshold(u):
+        # the degree of a simple unweighted graph is known without its edges
+        if u in out_edges or multigraph or weight is not None:
+            degree = edges_of(u)[1]
+        else:
+            degree = len(succ[u])
+        return epsilon * max(degree, 1)
+
+    pagerank = {}
+    residual = dict(restart)
+    queue = deque(residual)
+    queued = set(queue)
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        r = residual[u]
+        if r < threshold(u):
+            continue
+        nbr_fractions = edges_of(u)[0]
+        pagerank[u] = pagerank.get(u, 0.0) + (1 - alpha) * r
+        residual[u] = 0.0
+        push = alpha * r
+        for v, fraction in nbr_fractions:
+            rv = residual.get(v, 0.0) + push * fraction
+            residual[v] = rv
+            if v not in queued and rv >= threshold(v):
+                queue.append(v)
+                queued.add(v)
+    if k is not None:
+        return dict(nlargest(k, pagerank.items(), key=itemgetter(1)))
+    return pagerank
@@ -1,9 +1,17 @@
 """PageRank analysis of graph structure. """
+from collections import deque
 from warnings import warn
 
 import networkx as nx
 
-__all__ = ["pagerank", "pagerank_numpy", "pagerank_scipy", "google_matrix"]
+__all__ = [
+    "pagerank",
+    "pagerank_numpy",
+    "pagerank_scipy",
+    "google_matrix",
+    "PageRankOperator",
+    "PageRankTracker",
+]
 
 
 def pagerank(
@@ -506,3 +514,537 @@ def pagerank_scipy(
         if err < N * tol:
             return dict(zip(nodelist, map(float, x)))
     raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+class PageRankOperator:
+    """The PageRank transition operator of a graph, built once and reused.
+
+    Building the sparse transition matrix of `G` is a large part of the cost
+    of :func:`pagerank` on a big graph. A PageRankOperator builds it once and
+    then computes personalized PageRank for many personalization vectors at
+    once with :meth:`solve`, iterating on a dense block with one column per
+    vector.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, i.e., nodes without
+      any outedges. By default, dangling nodes are given outedges according to
+      the personalization vector of each column. See :func:`pagerank`.
+
+    nodelist : list, optional
+      The rows of the results are ordered according to the nodes in nodelist.
+      If nodelist is None, then the ordering is produced by G.nodes().
+
+    Attributes
+    ----------
+    nodelist : list
+      The node of every row of the results.
+
+    index : dict
+      The row of every node of the results.
+
+    Examples
+    --------
+    >>> G = nx.karate_club_graph()
+    >>> op = nx.PageRankOperator(G)
+    >>> R = op.solve([{0: 1}, [32, 33], {5: 2, 6: 1}])
+    >>> R.shape
+    (34, 3)
+    >>> round(float(R[op.index[0], 0]), 3)
+    0.259
+    >>> pr = nx.pagerank(G, personalization={0: 1})
+    >>> bool(abs(R[op.index[0], 0] - pr[0]) < 1e-4)
+    True
+
+    Notes
+    -----
+    Every column converges on its own: it is checked against the tolerance
+    of :func:`pagerank` after each iteration and removed from the block once
+    it has converged, so the remaining iterations only work on the columns
+    that need them.
+
+    See Also
+    --------
+    pagerank, google_matrix
+    """
+
+    def __init__(self, G, alpha=0.85, weight="weight", dangling=None, nodelist=None):
+        import numpy as np
+        import scipy as sp
+        import scipy.sparse  # call as sp.sparse
+
+        if nodelist is None:
+            nodelist = list(G)
+        self.nodelist = list(nodelist)
+        self.index = {n: i for i, n in enumerate(self.nodelist)}
+        self.alpha = alpha
+        N = len(self.nodelist)
+        if N == 0:
+            A = sp.sparse.csr_array((0, 0))
+        else:
+            A = nx.to_scipy_sparse_array(
+                G, nodelist=nodelist, weight=weight, dtype=float
+            )
+        S = A.sum(axis=1)
+        S[S != 0] = 1.0 / S[S != 0]
+        Q = sp.sparse.csr_array(sp.sparse.spdiags(S.T, 0, *A.shape))
+        # stored transposed so that an iteration is a sparse @ dense product
+        self._AT = (Q @ A).T.tocsr()
+        self._is_dangling = np.where(S == 0)[0]
+        if dangling is None:
+            self._dangling_weights = None
+        else:
+            # Convert the dangling dictionary into an array in nodelist order
+            dangling_weights = np.array(
+                [dangling.get(n, 0) for n in self.nodelist], dtype=float
+            )
+            dangling_weights /= dangling_weights.sum()
+            self._dangling_weights = dangling_weights[:, np.newaxis]
+        self._N = N
+
+    def personalization_matrix(self, personalizations):
+        """Returns the personalization vectors as the columns of an array.
+
+        Parameters
+        ----------
+        personalizations : iterable or NumPy array
+          An iterable of personalizations, each either a dict keyed by node
+          like the `personalization` argument of :func:`pagerank` or a
+          collection of seed nodes which get equal values, or an array
+          with one column per personalization and rows in `nodelist` order.
+          Nodes not in `nodelist` are ignored.
+
+        Returns
+        -------
+        P : NumPy array
+          An array of shape ``(len(nodelist), k)`` whose columns sum to one.
+
+        Raises
+        ------
+        ZeroDivisionError
+          If a personalization has no non-zero value.
+        """
+        import numpy as np
+
+        if isinstance(personalizations, np.ndarray):
+            P = np.array(personalizations, dtype=float, ndmin=2)
+            if P.shape[0] != self._N:
+                raise nx.NetworkXError(
+                    f"personalizations has {P.shape[0]} rows, expected {self._N}"
+                )
+        else:
+            personalizations = list(personalizations)
+            P = np.zeros((self._N, len(personalizations)))
+            index = self.index
+            for j, p in enumerate(personalizations):
+                if isinstance(p, dict):
+                    for n, value in p.items():
+                        if n in index:
+                            P[index[n], j] = value
+                else:
+                    P[[index[n] for n in p if n in index], j] = 1.0
+        total = P.sum(axis=0)
+        if (total == 0).any():
+            raise ZeroDivisionError
+        return P / total
+
+    def solve(self, personalizations, max_iter=100, tol=1.0e-6):
+        """Returns the personalized PageRank of every personalization.
+
+        Parameters
+        ----------
+        personalizations : iterable or NumPy array
+          The personalization vectors, see :meth:`personalization_matrix`.
+
+        max_iter : integer, optional
+          Maximum number of iterations in power method eigenvalue solver.
+
+        tol : float, optional
+          Error tolerance used to check convergence in power method solver.
+
+        Returns
+        -------
+        R : NumPy array
+          An array of shape ``(len(nodelist), k)`` whose column ``j`` is the
+          PageRank for personalization ``j``, with rows in `nodelist` order.
+
+        Raises
+        ------
+        PowerIterationFailedConvergence
+          If some column does not converge to the specified tolerance
+          within the specified number of iterations of the power iteration
+          method.
+        """
+        import numpy as np
+
+        P = self.personalization_matrix(personalizations)
+        N, k = P.shape
+        R = np.empty((N, k))
+        if N == 0 or k == 0:
+            return R
+        alpha = self.alpha
+        AT = self._AT
+        is_dangling = self._is_dangling
+        active = np.arange(k)  # the column of R of every column of x
+        x = np.full((N, k), 1.0 / N)
+        for _ in range(max_iter):
+            xlast = x
+            if self._dangling_weights is None:
+                dangling_weights = P
+            else:
+                dangling_weights = self._dangling_weights
+            x = alpha * (AT @ x + x[is_dangling].sum(axis=0) * dangling_weights)
+            x += (1 - alpha) * P
+            # check convergence per column, l1 norm
+            err = np.absolute(x - xlast).sum(axis=0)
+            converged = err < N * tol
+            if converged.any():
+                R[:, active[converged]] = x[:, converged]
+                remaining = ~converged
+                active = active[remaining]
+                if not len(active):
+                    return R
+                x = x[:, remaining]
+                P = P[:, remaining]
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+class PageRankTracker:
+    r"""Maintains the PageRank of a graph while edges are added and removed.
+
+    The tracker computes the PageRank of `G` once and then repairs it after
+    every batch of edge insertions or deletions given to :meth:`add_edges`
+    and :meth:`remove_edges`, which also apply the batch to `G`. Only the
+    nodes whose out-edges changed and the nodes the resulting change of
+    PageRank mass reaches are visited, so the cost of an update depends on
+    the size of the change and not on the size of the graph.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph, modified in place by :meth:`add_edges` and
+      :meth:`remove_edges`. Undirected graphs are treated as directed graphs
+      with two directed edges for each undirected edge.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    personalization: dict, optional
+      The "personalization vector" as for :func:`pagerank`, which is also
+      used for the outedges of dangling nodes. By default, a uniform
+      distribution over the nodes of `G`, also after nodes are added.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    epsilon : float, optional
+      Error tolerance. An update stops when the residual of every node is
+      less than `epsilon` times its number of out-edges (or `epsilon` for
+      nodes without out-edges).
+
+    nstart : dictionary, optional
+      Starting value of the initial PageRank iteration for each node, for
+      instance the PageRank of an earlier version of `G`.
+
+    Attributes
+    ----------
+    pagerank : dict
+      The current PageRank of every node of `G`.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> tracker = nx.PageRankTracker(G)
+    >>> tracker.add_edges([(3, 4), (4, 0)])
+    >>> tracker.remove_edges([(1, 0)])
+    >>> pr = nx.pagerank(G, tol=1e-10)
+    >>> all(abs(tracker.pagerank[n] - pr[n]) < 1e-6 for n in G)
+    True
+
+    Notes
+    -----
+    The PageRank $x$ solves $x = b + \alpha x P$, where $P$ is the
+    transition matrix of `G` and $b$ is $1 - \alpha$ times the
+    personalization vector. Besides its estimate $p$ the tracker keeps the
+    residual $r = b + \alpha p P - p$, so that $x = p + r (I - \alpha P)^{-1}$.
+    A change of the out-edges of a node $u$ changes row $u$ of $P$ and
+    hence the residual of the neighbors of $u$ by $\alpha p(u)$ times the
+    change of the row. The residual is then pushed back to zero as in [1]_:
+    a node $u$ with a large residual adds it to $p(u)$ and passes $\alpha$
+    times it on to its out-neighbors. The $l_1$ error of the estimate is
+    at most the $l_1$ norm of the residual divided by $1 - \alpha$, see
+    :attr:`error_bound`.
+
+    The residual that nodes without out-edges pass on to the whole
+    personalization vector is collected in one number and spread over the
+    nodes only when it is large enough to matter, so dangling nodes do not
+    make updates proportional to the number of nodes.
+
+    For a long series of updates the estimate can be recomputed from the
+    graph with :meth:`refresh`, a power iteration started from the current
+    estimate.
+
+    See Also
+    --------
+    pagerank, local_pagerank
+
+    References
+    ----------
+    .. [1] H. Zhang, P. Lofgren and A. Goel,
+       "Approximate Personalized PageRank on Dynamic Graphs",
+       Proceedings of KDD 2016, pp. 1315-1324.
+       https://doi.org/10.1145/2939672.2939804
+    """
+
+    def __init__(
+        self,
+        G,
+        alpha=0.85,
+        personalization=None,
+        weight="weight",
+        epsilon=1.0e-9,
+        nstart=None,
+    ):
+        if G.is_multigraph():
+            raise nx.NetworkXNotImplemented("not implemented for multigraph type")
+        self.G = G
+        self.alpha = alpha
+        self.weight = weight
+        self.epsilon = epsilon
+        if personalization is None:
+            self._personalization = None
+        else:
+            s = float(sum(personalization.get(n, 0) for n in G))
+            if s == 0:
+                raise ZeroDivisionError
+            self._personalization = {
+                n: value / s for n, value in personalization.items() if n in G and value
+            }
+        self._succ = G._succ if G.is_directed() else G._adj
+        self.refresh(nstart=nstart)
+
+    def _restart(self, n):
+        """The personalization (and dangling) probability of node n"""
+        if self._personalization is None:
+            return 1.0 / len(self.G)
+        return self._personalization.get(n, 0.0)
+
+    def _row(self, u):
+        """Returns the list of (nbr, transition probability) of u, or None"""
+        weight = self.weight
+        if weight is None:
+            nbr_weights = [(v, 1) for v in self._succ[u]]
+        else:
+            nbr_weights = [(v, d.get(weight, 1)) for v, d in self._succ[u].items()]
+        total = sum(w for v, w in nbr_weights)
+        if total == 0:
+            return None
+        return [(v, w / total) for v, w in nbr_weights]
+
+    @property
+    def error_bound(self):
+        """An upper bound of the l1 distance of :attr:`pagerank` to the PageRank."""
+        r = sum(abs(value) for value in self._residual.values()) + abs(self._pending)
+        return r / (1 - self.alpha)
+
+    def refresh(self, max_iter=1000, tol=None, nstart=None):
+        """Recomputes the PageRank of the graph with a power iteration.
+
+        The iteration starts from `nstart`, by default the current estimate,
+        and is followed by a recomputation of all residuals.
+
+        Parameters
+        ----------
+        max_iter : integer, optional
+          Maximum number of iterations in power method eigenvalue solver.
+
+        tol : float, optional
+          Error tolerance used to check convergence in power method solver,
+          by default `epsilon`.
+
+        nstart : dictionary, optional
+          Starting value of PageRank iteration for each node.
+
+        Raises
+        ------
+        PowerIterationFailedConvergence
+            If the algorithm fails to converge to the specified tolerance
+            within the specified number of iterations of the power iteration
+            method.
+        """
+        G = self.G
+        alpha = self.alpha
+        if nstart is None and getattr(self, "pagerank", None):
+            nstart = self.pagerank
+        if tol is None:
+            tol = self.epsilon
+        if len(G) == 0:
+            p = {}
+        else:
+            p = pagerank(
+                G,
+                alpha,
+                self._personalization,
+                max_iter,
+                tol,
+                nstart,
+                self.weight,
+            )
+        # r = b + alpha p P - p
+        residual = {n: -p[n] for n in G}
+        dangling_sum = 0.0
+        for u in G:
+            row = self._row(u)
+            if row is None:
+                dangling_sum += p[u]
+            else:
+                pu = alpha * p[u]
+                for v, fraction in row:
+                    residual[v] += pu * fraction
+        restart = (1 - alpha) + alpha * dangling_sum
+        for n in G:
+            residual[n] += restart * self._restart(n)
+        self.pagerank = p
+        self._residual = residual
+        # residual still to be spread over the personalization vector
+        self._pending = 0.0
+        self._dangling_sum = dangling_sum
+        self._push(list(G))
+
+    def add_edges(self, ebunch_to_add):
+        """Adds the edges in `ebunch_to_add` to the graph and updates the PageRank.
+
+        Parameters
+        ----------
+        ebunch_to_add : container of edges
+            Edges as accepted by :meth:`Graph.add_edges_from`. Nodes that
+            are not in the graph are added.
+        """
+        ebunch = [tuple(e) for e in ebunch_to_add]
+        new_nodes = {n for e in ebunch for n in e[:2] if n not in self.G}
+        if new_nodes:
+            self._add_nodes(new_nodes)
+        self._update(ebunch, self.G.add_edges_from)
+
+    def remove_edges(self, ebunch):
+        """Removes the edges in `ebunch` from the graph and updates the PageRank.
+
+        Parameters
+        ----------
+        ebunch : list or container of edge tuples
+            Edges as accepted by :meth:`Graph.remove_edges_from`. Edges that
+            are not in the graph are ignored.
+        """
+        self._update([tuple(e) for e in ebunch], self.G.remove_edges_from)
+
+    def _add_nodes(self, nodes):
+        G = self.G
+        p = self.pagerank
+        residual = self._residual
+        n = len(G)
+        G.add_nodes_from(nodes)
+        for node in nodes:
+            p[node] = 0.0
+            residual[node] = 0.0
+        if self._personalization is not None:
+            # the new nodes have no personalization
+            return
+        if n == 0:
+            self._pending = 1 - self.alpha
+            return
+        # a uniform personalization vector changes for all nodes
+        new_n = len(G)
+        restart = (1 - self.alpha) + self.alpha * self._dangling_sum
+        shift = restart * (1.0 / new_n - 1.0 / n)
+        pending = new_n * (self._pending / n + shift)
+        for node in nodes:
+            residual[node] = (restart - pending) / new_n
+        self._pending = pending
+
+    def _update(self, ebunch, apply):
+        G = self.G
+        sources = {e[0] for e in ebunch}
+        if not G.is_directed():
+            sources.update(e[1] for e in ebunch)
+        old_rows = {u: self._row(u) for u in sources if u in G}
+        apply(ebunch)
+        alpha = self.alpha
+        p = self.pagerank
+        residual = self._residual
+        touched = set(old_rows)
+        for u, old_row in old_rows.items():
+            new_row = self._row(u)
+            pu = alpha * p[u]
+            if old_row is None:
+                self._pending -= pu
+                self._dangling_sum -= p[u]
+            else:
+                for v, fraction in old_row:
+                    residual[v] -= pu * fraction
+                    touched.add(v)
+            if new_row is None:
+                self._pending += pu
+                self._dangling_sum += p[u]
+            else:
+                for v, fraction in new_row:
+                    residual[v] += pu * fraction
+                    touched.add(v)
+        self._push(touched)
+
+    def _threshold(self, u):
+        return self.epsilon * max(len(self._succ[u]), 1)
+
+    def _push(self, nodes):
+        """Pushes residuals until all are below their thresholds"""
+        alpha = self.alpha
+        p = self.pagerank
+        residual = self._residual
+        queue = deque(n for n in nodes if abs(residual[n]) >= self._threshold(n))
+        queued = set(queue)
+        while True:
+            while queue:
+                u = queue.popleft()
+                queued.discard(u)
+                ru = residual[u]
+                if abs(ru) < self._threshold(u):
+                    continue
+                p[u] += ru
+                residual[u] = 0.0
+                row = self._row(u)
+                if row is None:
+                    self._pending += alpha * ru
+                    self._dangling_sum += ru
+                    continue
+                push = alpha * ru
+                for v, fraction in row:
+                    rv = residual[v] + push * fraction
+                    residual[v] = rv
+                    if v not in queued and abs(rv) >= self._threshold(v):
+                        queue.append(v)
+                        queued.add(v)
+            # spread the dangling residual once it matters for some node
+            if self._personalization is None:
+                support = self.G
+                largest = 1.0 / len(self.G) if len(self.G) else 0.0
+            else:
+                support = self._personalization
+                largest = max(support.values())
+            if abs(self._pending) * largest < self.epsilon:
+                return
+            pending, self._pending = self._pending, 0.0
+            for v in support:
+                residual[v] += pending * self._restart(v)
+                if v not in queued and abs(residual[v]) >= self._threshold(v):
+                    queue.append(v)
+                    queued.add(v)
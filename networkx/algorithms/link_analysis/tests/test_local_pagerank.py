@@ -0,0 +1,66 @@
+import pytest
+
+import networkx as nx
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+
+class TestLocalPageRank:
+    @pytest.mark.parametrize("weight", (None, "weight"))
+    def test_undirected_error_bound(self, weight):
+        G = nx.les_miserables_graph()
+        epsilon = 1e-5
+        for seed in ("Valjean", "Napoleon"):
+            ppr = nx.local_pagerank(G, seed, epsilon=epsilon, weight=weight)
+            pr = nx.pagerank(
+                G, personalization={seed: 1}, tol=1e-12, max_iter=1000, weight=weight
+            )
+            for n in G:
+                error = pr[n] - ppr.get(n, 0)
+                assert -1e-9 <= error <= epsilon * G.degree(n, weight=weight)
+            assert sum(pr[n] - ppr.get(n, 0) for n in G) == pytest.approx(
+                1 - sum(ppr.values()), abs=1e-8
+            )
+
+    def test_directed_dangling(self):
+        G = nx.DiGraph([(1, 2), (1, 3), (3, 1), (3, 2), (3, 5), (4, 5), (5, 4)])
+        G.add_edges_from([(4, 6), (5, 6), (6, 4)])
+        pr = nx.pagerank(G, personalization={1: 1, 3: 1}, tol=1e-12, max_iter=1000)
+        ppr = nx.local_pagerank(G, [1, 3], epsilon=1e-10)
+        for n in G:
+            assert ppr[n] == pytest.approx(pr[n], abs=1e-8)
+        personalization = {1: 2, 2: 1}
+        pr = nx.pagerank(G, personalization=personalization, tol=1e-12, max_iter=1000)
+        ppr = nx.local_pagerank(G, personalization, epsilon=1e-10)
+        for n in G:
+            assert ppr[n] == pytest.approx(pr[n], abs=1e-8)
+
+    def test_multigraph(self):
+        G = nx.MultiGraph([(1, 2), (1, 2), (1, 2), (2, 3), (2, 3), ("3", 3)])
+        pr = nx.pagerank(G, personalization={2: 1}, tol=1e-12, max_iter=1000)
+        ppr = nx.local_pagerank(G, 2, epsilon=1e-10)
+        for n in G:
+            assert ppr[n] == pytest.approx(pr[n], abs=1e-8)
+
+    def test_locality(self):
+        G = nx.path_graph(10000)
+        ppr = nx.local_pagerank(G, 0, alpha=0.5, epsilon=1e-3)
+        assert len(ppr) < 20
+        assert list(ppr) == sorted(ppr)
+
+    def test_top_k(self):
+        G = nx.karate_club_graph()
+        ppr = nx.local_pagerank(G, 33, epsilon=1e-6)
+        top = nx.local_pagerank(G, 33, epsilon=1e-6, k=5)
+        assert list(top) == sorted(ppr, key=ppr.get, reverse=True)[:5]
+        assert all(top[n] == ppr[n] for n in top)
+
+    def test_errors(self):
+        G = nx.path_graph(3)
+        with pytest.raises(nx.NodeNotFound):
+            nx.local_pagerank(G, 5)
+        with pytest.raises(nx.NodeNotFound):
+            nx.local_pagerank(G, [0, 5])
+        with pytest.raises(ZeroDivisionError):
+            nx.local_pagerank(G, {0: 0})
@@ -209,6 +209,123 @@ class TestPageRankScipy(TestPageRank):
         assert nx.pagerank_scipy(G) == {}
 
 
+class TestPageRankOperator:
+    def test_solve(self):
+        G = TestPageRank.G
+        op = nx.PageRankOperator(G, alpha=0.9)
+        assert op.nodelist == list(G)
+        personalizations = [{n: random.random() for n in G}, {3: 1}, [4, 5], {}]
+        R = op.solve(personalizations[:3] + [dict.fromkeys(G, 1)], tol=1.0e-08)
+        assert R.shape == (len(G), 4)
+        for j, p in enumerate(personalizations[:2]):
+            pr = nx.pagerank(G, alpha=0.9, tol=1.0e-08, personalization=p)
+            for n in G:
+                assert R[op.index[n], j] == pytest.approx(pr[n], abs=1e-6)
+        pr = nx.pagerank(G, alpha=0.9, tol=1.0e-08, personalization={4: 1, 5: 1})
+        for n in G:
+            assert R[op.index[n], 2] == pytest.approx(pr[n], abs=1e-6)
+            assert R[op.index[n], 3] == pytest.approx(G.pagerank[n], abs=1e-4)
+        with pytest.raises(ZeroDivisionError):
+            op.solve(personalizations)
+
+    def test_solve_array(self):
+        G = nx.karate_club_graph()
+        nodelist = sorted(G, reverse=True)
+        op = nx.PageRankOperator(G, nodelist=nodelist)
+        P = np.zeros((len(G), 2))
+        P[0, 0] = P[1:5, 1] = 1
+        R = op.solve(P)
+        assert R.sum(axis=0) == pytest.approx([1, 1])
+        pr = nx.pagerank(G, personalization={nodelist[0]: 1})
+        assert R[:, 0] == pytest.approx([pr[n] for n in nodelist], abs=1e-4)
+        with pytest.raises(nx.NetworkXError):
+            op.solve(P[1:])
+
+    def test_dangling(self):
+        G = TestPageRank.G
+        dangling = TestPageRank.dangling_edges
+        op = nx.PageRankOperator(G, dangling=dangling)
+        R = op.solve([G, {3: 1}])
+        for n in G:
+            assert R[op.index[n], 0] == pytest.approx(G.dangling_pagerank[n], abs=1e-4)
+        pr = nx.pagerank(G, personalization={3: 1}, dangling=dangling)
+        for n in G:
+            assert R[op.index[n], 1] == pytest.approx(pr[n], abs=1e-4)
+
+    def test_max_iter(self):
+        op = nx.PageRankOperator(TestPageRank.G)
+        with pytest.raises(nx.PowerIterationFailedConvergence):
+            op.solve([{1: 1}], max_iter=0)
+
+    def test_empty(self):
+        op = nx.PageRankOperator(nx.Graph())
+        assert op.solve([]).shape == (0, 0)
+
+
+class TestPageRankTracker:
+    @staticmethod
+    def check(G, tracker, personalization=None, weight="weight"):
+        pr = nx.pagerank(
+            G,
+            personalization=personalization,
+            weight=weight,
+            tol=1e-12,
+            max_iter=1000,
+        )
+        error = sum(abs(pr[n] - tracker.pagerank[n]) for n in G)
+        assert error <= tracker.error_bound + 1e-9
+        assert tracker.error_bound < 1e-5
+
+    @pytest.mark.parametrize("directed", (True, False))
+    @pytest.mark.parametrize("personalization", (None, {0: 1, 3: 2}))
+    @pytest.mark.parametrize("weight", (None, "weight"))
+    def test_updates(self, directed, personalization, weight):
+        rng = random.Random(42)
+        G = nx.gnp_random_graph(50, 0.05, seed=42, directed=directed)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = rng.random()
+        tracker = nx.PageRankTracker(G, personalization=personalization, weight=weight)
+        self.check(G, tracker, personalization, weight)
+        for _ in range(10):
+            # also adds new nodes and changes weights of existing edges
+            ebunch = [(rng.randrange(55), rng.randrange(55)) for _ in range(3)]
+            tracker.add_edges((u, v, {"weight": rng.random()}) for u, v in ebunch)
+            self.check(G, tracker, personalization, weight)
+            tracker.remove_edges(rng.sample(list(G.edges()), 3) + [(0, 100)])
+            self.check(G, tracker, personalization, weight)
+        assert len(G) > 50
+
+    def test_dangling(self):
+        G = TestPageRank.G.copy()
+        tracker = nx.PageRankTracker(G, alpha=0.9)
+        tracker.remove_edges([(4, 5), (4, 6)])
+        assert G.out_degree(4) == 0
+        tracker.add_edges([(2, 1)])
+        pr = nx.pagerank(G, alpha=0.9, tol=1e-12, max_iter=1000)
+        for n in G:
+            assert tracker.pagerank[n] == pytest.approx(pr[n], abs=1e-7)
+
+    def test_refresh(self):
+        G = nx.DiGraph(nx.path_graph(4))
+        tracker = nx.PageRankTracker(G, epsilon=1e-4)
+        G.add_edge(3, 0)
+        tracker.refresh()
+        self.check(G, tracker)
+        with pytest.raises(nx.PowerIterationFailedConvergence):
+            tracker.refresh(max_iter=0)
+
+    def test_empty(self):
+        G = nx.DiGraph()
+        tracker = nx.PageRankTracker(G)
+        assert tracker.pagerank == {}
+        tracker.add_edges([(0, 1), (1, 2)])
+        self.check(G, tracker)
+
+    def test_multigraph(self):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.PageRankTracker(nx.MultiGraph([(0, 1)]))
+
+
 @pytest.mark.parametrize("pagerank_alg", (nx.pagerank_numpy, nx.pagerank_scipy))
 def test_deprecation_warnings(pagerank_alg):
     """Make sure deprecation warnings are raised.
@@ -3,3 +3,4 @@ from networkx.algorithms.shortest_paths.unweighted import *
 from networkx.algorithms.shortest_paths.weighted import *
 from networkx.algorithms.shortest_paths.astar import *
 from networkx.algorithms.shortest_paths.dense import *
+from networkx.algorithms.shortest_paths.contraction import *
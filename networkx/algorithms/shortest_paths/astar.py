@@ -1,12 +1,14 @@
 """Shortest paths and path lengths using the A* ("A star") algorithm.
 """
-from heapq import heappush, heappop
+from array import array
+from heapq import heappush, heappop, nlargest
 from itertools import count
 
 import networkx as nx
 from networkx.algorithms.shortest_paths.weighted import _weight_function
+from networkx.utils import py_random_state
 
-__all__ = ["astar_path", "astar_path_length"]
+__all__ = ["astar_path", "astar_path_length", "LandmarkHeuristic"]
 
 
 def astar_path(G, source, target, heuristic=None, weight="weight"):
@@ -61,10 +63,17 @@ def astar_path(G, source, target, heuristic=None, weight="weight"):
     >>> print(nx.astar_path(G, (0, 0), (2, 2), heuristic=dist, weight="cost"))
     [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)]
 
+    For graphs without coordinates, a :class:`LandmarkHeuristic` gives
+    a good heuristic after preprocessing the graph:
+
+    >>> G = nx.grid_2d_graph(20, 20)
+    >>> h = nx.LandmarkHeuristic(G, 4, seed=42)
+    >>> len(nx.astar_path(G, (0, 0), (19, 19), heuristic=h))
+    39
 
     See Also
     --------
-    shortest_path, dijkstra_path
+    shortest_path, dijkstra_path, LandmarkHeuristic
 
     """
     if source not in G or target not in G:
@@ -175,7 +184,7 @@ def astar_path_length(G, source, target, heuristic=None, weight="weight"):
 
     See Also
     --------
-    astar_path
+    astar_path, LandmarkHeuristic
 
     """
     if source not in G or target not in G:
@@ -185,3 +194,189 @@ def astar_path_length(G, source, target, heuristic=None, weight="weight"):
     weight = _weight_function(G, weight)
     path = astar_path(G, source, target, heuristic, weight)
     return sum(weight(u, v, G[u][v]) for u, v in zip(path[:-1], path[1:]))
+
+
+class LandmarkHeuristic:
+    """A lower bound of shortest path lengths computed from landmarks.
+
+    For a few nodes of `G`, the landmarks, the lengths of the shortest paths
+    from every node to each landmark and from each landmark to every node
+    are computed in advance. By the triangle inequality, the length of a
+    shortest path from `u` to `v` is at least ``d(L, v) - d(L, u)`` and
+    ``d(u, L) - d(v, L)`` for every landmark `L`, and the largest of these
+    bounds is an admissible heuristic for A* [1]_. Landmarks far away
+    behind the target give the tightest bounds.
+
+    Instances are callable with two nodes, as the `heuristic` argument of
+    :func:`astar_path` and :func:`astar_path_length`.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    landmarks : int or iterable of nodes, optional (default=16)
+        The number of landmarks to choose, or the landmarks.
+
+    strategy : "farthest", "degree" or "random", optional (default="farthest")
+        How landmarks are chosen. "farthest" starts from a random node and
+        repeatedly adds the node farthest from the landmarks chosen so far,
+        preferring nodes they do not reach. "degree" chooses the nodes of
+        highest degree and "random" chooses nodes uniformly at random.
+        Ignored if `landmarks` is an iterable of nodes.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to indicate a hidden edge.
+        A* must be called with the same weight.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Attributes
+    ----------
+    landmarks : list
+        The landmarks.
+
+    Raises
+    ------
+    NodeNotFound
+        If a landmark is not in `G`.
+
+    ValueError
+        If `strategy` is not one of the supported strategies.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(30, 30)
+    >>> nx.set_edge_attributes(G, {e: (e[0][0] % 3) + 1 for e in G.edges}, "cost")
+    >>> h = nx.LandmarkHeuristic(G, 8, weight="cost", seed=1)
+    >>> h((0, 0), (29, 29)) <= nx.dijkstra_path_length(G, (0, 0), (29, 29), "cost")
+    True
+    >>> path = nx.astar_path(G, (0, 0), (29, 29), heuristic=h, weight="cost")
+    >>> nx.path_weight(G, path, "cost")
+    86
+
+    Notes
+    -----
+    The distances to and from each landmark are kept in one array of
+    floats per landmark, indexed by the position of the nodes in `G`. For
+    undirected graphs both are the same array. Nodes added to `G` later
+    get a lower bound of zero, but the bounds are only valid as long as
+    the edges and weights of `G` do not change.
+
+    The heuristic is consistent, so A* never explores a node twice. For
+    negative edge weights the bounds are not valid.
+
+    See Also
+    --------
+    astar_path, astar_path_length
+
+    References
+    ----------
+    .. [1] A. V. Goldberg and C. Harrelson,
+       "Computing the Shortest Path: A* Search Meets Graph Theory",
+       Proceedings of SODA 2005, pp. 156-165.
+    """
+
+    @py_random_state("seed")
+    def __init__(
+        self, G, landmarks=16, strategy="farthest", weight="weight", seed=None
+    ):
+        self._index = {n: i for i, n in enumerate(G)}
+        self._G = G
+        self._weight = _weight_function(G, weight)
+        self._from = []
+        self._to = []
+        if isinstance(landmarks, int):
+            k = min(landmarks, len(G))
+            if strategy == "random":
+                self.landmarks = seed.sample(list(G), k)
+            elif strategy == "degree":
+                top = nlargest(k, G.degree, key=lambda nd: nd[1])
+                self.landmarks = [n for n, d in top]
+            elif strategy == "farthest":
+                self.landmarks = []
+                # distance between every node and the closest landmark so far
+                nearest = [float("inf")] * len(G)
+                far = seed.choice(list(G)) if k else None
+                for _ in range(k):
+                    self.landmarks.append(far)
+                    self._add_landmark(far)
+                    for i, d in enumerate(self._from[-1]):
+                        if d < nearest[i]:
+                            nearest[i] = d
+                    for i, d in enumerate(self._to[-1]):
+                        if d < nearest[i]:
+                            nearest[i] = d
+                    far = max(self._index, key=lambda n: nearest[self._index[n]])
+            else:
+                raise ValueError(f"Unknown landmark strategy {strategy!r}")
+        else:
+            self.landmarks = list(landmarks)
+        for L in self.landmarks[len(self._from) :]:
+            if L not in G:
+                raise nx.NodeNotFound(f"Landmark {L} is not in G")
+            self._add_landmark(L)
+        del self._G, self._weight
+        self._target = None
+        self._from_bounds = []
+        self._to_bounds = []
+
+    def _distances(self, G, source, weight):
+        dist = array("d", [float("inf")]) * len(self._index)
+        index = self._index
+        lengths = nx.single_source_dijkstra_path_length(G, source, weight=weight)
+        for n, d in lengths.items():
+            dist[index[n]] = d
+        return dist
+
+    def _add_landmark(self, landmark):
+        G, weight = self._G, self._weight
+        self._from.append(self._distances(G, landmark, weight))
+        if G.is_directed():
+
+            def reverse_weight(u, v, d):
+                return weight(v, u, d)
+
+            R = G.reverse(copy=False)
+            self._to.append(self._distances(R, landmark, reverse_weight))
+        else:
+            self._to.append(self._from[-1])
+
+    def __call__(self, u, v):
+        """Returns a lower bound of the length of a shortest path from u to v."""
+        if v != self._target:
+            j = self._index.get(v)
+            # skip landmarks not connected with the target, to avoid
+            # subtracting infinite distances
+            inf = float("inf")
+            if j is None:
+                self._from_bounds = self._to_bounds = []
+            else:
+                self._from_bounds = [(L, L[j]) for L in self._from if L[j] != inf]
+                self._to_bounds = [(L, L[j]) for L in self._to if L[j] != inf]
+            self._target = v
+        i = self._index.get(u)
+        h = 0
+        if i is None:
+            return h
+        for from_L, from_target in self._from_bounds:
+            # d(L, v) - d(L, u)
+            d = from_target - from_L[i]
+            if d > h:
+                h = d
+        for to_L, to_target in self._to_bounds:
+            # d(u, L) - d(v, L)
+            d = to_L[i] - to_target
+            if d > h:
+                h = d
+        return h
@@ -0,0 +1,369 @@
+"""Contraction hierarchies for repeated point-to-point shortest path queries."""
+from heapq import heappush, heappop
+from itertools import count
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+
+__all__ = ["ContractionHierarchy"]
+
+
+class ContractionHierarchy:
+    """A contraction hierarchy index of the shortest paths of a weighted graph.
+
+    Building the index contracts the nodes of `G` one at a time, in order of
+    importance, and adds a "shortcut" edge between two neighbors of a
+    contracted node whenever the only shortest path between them runs
+    through it [1]_. Afterwards a shortest path between any two nodes can be
+    found by two Dijkstra searches, from the source and (backwards) from the
+    target, that only follow edges to more important nodes. These searches
+    visit a few hundred nodes on road networks with millions of nodes.
+
+    The index is built once and does not follow later changes of `G`. It
+    holds only dicts of nodes and numbers, so it can be stored with
+    :mod:`pickle` and loaded again without the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to indicate a hidden edge.
+
+    witness_limit : int, optional (default=500)
+        The largest number of nodes a search for a path that makes a
+        shortcut unnecessary may visit. Smaller values build the index
+        faster but add more shortcuts. The index is exact for any value.
+
+    Attributes
+    ----------
+    rank : dict
+        The position of every node in the contraction order.
+
+    Raises
+    ------
+    ValueError
+        If an edge weight is negative.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> nx.set_edge_attributes(G, {e: (e[0][0] + 1) for e in G.edges}, "weight")
+    >>> ch = nx.ContractionHierarchy(G)
+    >>> ch.dijkstra_path_length((0, 0), (9, 9))
+    54
+    >>> path = ch.dijkstra_path((0, 0), (9, 9))
+    >>> nx.path_weight(G, path, "weight")
+    54
+
+    The index can be saved and loaded with pickle:
+
+    >>> import pickle
+    >>> ch = pickle.loads(pickle.dumps(ch))
+    >>> ch.bidirectional_dijkstra((0, 0), (0, 1))
+    (1, [(0, 0), (0, 1)])
+
+    Notes
+    -----
+    Nodes are contracted in increasing order of the number of shortcuts
+    their contraction adds minus the number of edges it removes, plus the
+    number of neighbors already contracted, which spreads the contraction
+    over the graph. Priorities are updated lazily: the node with the
+    lowest priority is contracted only if its recomputed priority is still
+    the lowest.
+
+    For undirected graphs every edge is treated as two directed edges. For
+    multigraphs only the lightest of parallel edges is used.
+
+    See Also
+    --------
+    dijkstra_path
+    bidirectional_dijkstra
+
+    References
+    ----------
+    .. [1] R. Geisberger, P. Sanders, D. Schultes and D. Delling,
+       "Contraction Hierarchies: Faster and Simpler Hierarchical Routing in
+       Road Networks", WEA 2008, LNCS 5038, pp. 319-333.
+       https://doi.org/10.1007/978-3-540-68552-4_24
+    """
+
+    def __init__(self, G, weight="weight", witness_limit=500):
+        weight = _weight_function(G, weight)
+        succ = G._succ if G.is_directed() else G._adj
+        # remaining graph during the contraction
+        out = {u: {} for u in G}
+        inc = {u: {} for u in G}
+        for u, nbrs in succ.items():
+            for v, d in nbrs.items():
+                if u == v:
+                    continue
+                wt = weight(u, v, d)
+                if wt is None:
+                    continue
+                if wt < 0:
+                    raise ValueError(f"Negative weight {wt} on edge ({u}, {v})")
+                if wt < out[u].get(v, float("inf")):
+                    out[u][v] = inc[v][u] = wt
+        self._witness_limit = witness_limit
+        self._out = out
+        self._inc = inc
+        # middle node of every shortcut, for unpacking paths
+        self._middle = {}
+        self.rank = {}
+        self._up = {u: {} for u in G}
+        self._down = {u: {} for u in G}
+        self._contract_all()
+        del self._out, self._inc
+
+    def _witness_search(self, source, excluded, targets, limit):
+        """Returns upper bounds of distances from source that avoid excluded"""
+        out = self._out
+        dist = {source: 0}
+        c = count()
+        fringe = [(0, next(c), source)]
+        settled = 0
+        remaining = len(targets)
+        while fringe:
+            d, _, u = heappop(fringe)
+            if d > dist[u]:
+                continue
+            if d > limit or settled == self._witness_limit:
+                break
+            settled += 1
+            if u in targets:
+                remaining -= 1
+                if remaining == 0:
+                    break
+            for w, wt in out[u].items():
+                if w == excluded:
+                    continue
+                vw_dist = d + wt
+                if vw_dist < dist.get(w, float("inf")):
+                    dist[w] = vw_dist
+                    heappush(fringe, (vw_dist, next(c), w))
+        return dist
+
+    def _shortcuts(self, v):
+        """Returns the shortcuts (u, w, length) needed to contract v"""
+        shortcuts = []
+        out_v = self._out[v]
+        if not out_v:
+            return shortcuts
+        for u, uv_wt in self._inc[v].items():
+            targets = {w: uv_wt + vw_wt for w, vw_wt in out_v.items() if w != u}
+            if not targets:
+                continue
+            dist = self._witness_search(u, v, targets, max(targets.values()))
+            for w, length in targets.items():
+                if dist.get(w, float("inf")) > length:
+                    shortcuts.append((u, w, length))
+        return shortcuts
+
+    def _priority(self, v, contracted_nbrs):
+        removed = len(self._out[v]) + len(self._inc[v])
+        return len(self._shortcuts(v)) - removed + contracted_nbrs[v]
+
+    def _contract_all(self):
+        out, inc = self._out, self._inc
+        contracted_nbrs = dict.fromkeys(out, 0)
+        c = count()
+        heap = [(self._priority(v, contracted_nbrs), next(c), v) for v in out]
+        heap.sort()
+        while heap:
+            _, _, v = heappop(heap)
+            if v in self.rank:
+                continue
+            priority = self._priority(v, contracted_nbrs)
+            if heap and priority > heap[0][0]:
+                heappush(heap, (priority, next(c), v))
+                continue
+            # contract v
+            for u, w, length in self._shortcuts(v):
+                if length < out[u].get(w, float("inf")):
+                    out[u][w] = inc[w][u] = length
+                    self._middle[u, w] = v
+            self.rank[v] = len(self.rank)
+            self._up[v] = out.pop(v)
+            self._down[v] = inc.pop(v)
+            nbrs = set(self._up[v]) | set(self._down[v])
+            for u in self._down[v]:
+                del out[u][v]
+            for w in self._up[v]:
+                del inc[w][v]
+            for u in nbrs:
+                contracted_nbrs[u] += 1
+
+    def _search(self, source, target):
+        """Returns the length and the meeting node of a shortest path, or None"""
+        if source not in self.rank:
+            raise nx.NodeNotFound(f"Node {source} not found in graph")
+        if target not in self.rank:
+            raise nx.NodeNotFound(f"Node {target} not found in graph")
+        dists = [{source: 0}, {target: 0}]
+        preds = [{source: None}, {target: None}]
+        graphs = [self._up, self._down]
+        c = count()
+        fringes = [[(0, next(c), source)], [(0, next(c), target)]]
+        best, meet = float("inf"), None
+        direction = 1
+        while fringes[0] or fringes[1]:
+            # alternate directions, skipping a finished one
+            direction = 1 - direction
+            if not fringes[direction]:
+                direction = 1 - direction
+            fringe = fringes[direction]
+            d, _, v = heappop(fringe)
+            if d >= best:
+                # nothing in this direction can improve the path
+                fringe.clear()
+                continue
+            dist = dists[direction]
+            if d > dist[v]:
+                continue
+            other = dists[1 - direction].get(v)
+            if other is not None and d + other < best:
+                best, meet = d + other, v
+            pred = preds[direction]
+            for w, wt in graphs[direction][v].items():
+                vw_dist = d + wt
+                if vw_dist < dist.get(w, float("inf")):
+                    dist[w] = vw_dist
+                    pred[w] = v
+                    heappush(fringe, (vw_dist, next(c), w))
+        if meet is None:
+            return None
+        return best, meet, preds
+
+    def _unpack(self, u, w):
+        """Returns the path of edge (u, w) without shortcuts, excluding u"""
+        path = []
+        stack = [(u, w)]
+        while stack:
+            u, w = stack.pop()
+            v = self._middle.get((u, w))
+            if v is None:
+                path.append(w)
+            else:
+                stack.append((v, w))
+                stack.append((u, v))
+        return path
+
+    def bidirectional_dijkstra(self, source, target):
+        """Returns the length and the path of a shortest path from source to target.
+
+        Parameters
+        ----------
+        source : node
+            Starting node for path.
+
+        target : node
+            Ending node for path.
+
+        Returns
+        -------
+        length, path : number and list
+            The length of a shortest path and the list of its nodes.
+
+        Raises
+        ------
+        NodeNotFound
+            If `source` or `target` is not in the graph.
+
+        NetworkXNoPath
+            If no path exists between source and target.
+
+        See Also
+        --------
+        networkx.algorithms.shortest_paths.weighted.bidirectional_dijkstra
+        """
+        found = self._search(source, target)
+        if found is None:
+            raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+        length, meet, (pred, succ) = found
+        upward = [meet]
+        while pred[upward[-1]] is not None:
+            upward.append(pred[upward[-1]])
+        upward.reverse()
+        downward = [meet]
+        while succ[downward[-1]] is not None:
+            downward.append(succ[downward[-1]])
+        path = [source]
+        for u, w in zip(upward, upward[1:]):
+            path.extend(self._unpack(u, w))
+        for u, w in zip(downward, downward[1:]):
+            path.extend(self._unpack(u, w))
+        return length, path
+
+    def dijkstra_path(self, source, target):
+        """Returns a shortest path from source to target.
+
+        Parameters
+        ----------
+        source : node
+            Starting node for path.
+
+        target : node
+            Ending node for path.
+
+        Returns
+        -------
+        path : list
+            List of nodes in a shortest path.
+
+        Raises
+        ------
+        NodeNotFound
+            If `source` or `target` is not in the graph.
+
+        NetworkXNoPath
+            If no path exists between source and target.
+
+        See Also
+        --------
+        networkx.algorithms.shortest_paths.weighted.dijkstra_path
+        """
+        return self.bidirectional_dijkstra(source, target)[1]
+
+    def dijkstra_path_length(self, source, target):
+        """Returns the length of a shortest path from source to target.
+
+        Parameters
+        ----------
+        source : node
+            Starting node for path.
+
+        target : node
+            Ending node for path.
+
+        Returns
+        -------
+        length : number
+            Shortest path length.
+
+        Raises
+        ------
+        NodeNotFound
+            If `source` or `target` is not in the graph.
+
+        NetworkXNoPath
+            If no path exists between source and target.
+
+        See Also
+        --------
+        networkx.algorithms.shortest_paths.weighted.dijkstra_path_length
+        """
+        found = self._search(source, target)
+        if found is None:
+            raise nx.NetworkXNoPath(f"Node {target} not reachable from {source}")
+        return found[0]
@@ -1,5 +1,8 @@
-"""Floyd-Warshall algorithm for shortest paths.
+"""Floyd-Warshall algorithm for shortest paths, and all-pairs shortest path
+lengths written to a memory-mapped distance matrix.
 """
+import os
+
 import networkx as nx
 
 __all__ = [
@@ -7,6 +10,8 @@ __all__ = [
     "floyd_warshall_predecessor_and_distance",
     "reconstruct_path",
     "floyd_warshall_numpy",
+    "floyd_warshall_blocked",
+    "all_pairs_shortest_path_length_memmap",
 ]
 
 
@@ -73,6 +78,209 @@ def floyd_warshall_numpy(G, nodelist=None, weight="weight"):
     return A
 
 
+def floyd_warshall_blocked(
+    G, nodelist=None, weight="weight", dtype=None, out=None, block_size=256, n_jobs=None
+):
+    """Find all-pairs shortest path lengths and predecessors with NumPy.
+
+    This is a blocked (tiled) version of Floyd's algorithm [1]_. The
+    distance matrix is split into square tiles of `block_size` rows and
+    columns, and each round relaxes the tiles through the nodes of one
+    diagonal tile: first the row and column of tiles crossing it, then all
+    other tiles, which only read the crossing ones and can be updated in
+    parallel threads. Each step works on a slice of a few tiles, which
+    stays in the CPU cache, so unlike :func:`floyd_warshall_numpy` the
+    whole matrix is not streamed through memory for every node.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    nodelist : list, optional (default=G.nodes)
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes.
+       Nodelist should include all nodes in G.
+
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight. If an edge has no
+       such attribute, its weight is one. Of parallel edges the lightest
+       is used.
+
+    dtype : NumPy data-type, optional (default=numpy.float64)
+       The data type of the distance matrix, for example ``float32`` to
+       halve its size or an integer type for integer weights. Ignored if
+       `out` is given.
+
+    out : tuple of two arrays, optional
+       The ``len(G)`` by ``len(G)`` predecessor and distance arrays to fill
+       in place, for example memory-mapped arrays from
+       :func:`numpy.lib.format.open_memmap` for matrices that do not fit
+       in memory. The predecessor array must have a signed integer type.
+
+    block_size : int, optional (default=256)
+       The number of rows and columns of a tile.
+
+    n_jobs : int, optional (default=None)
+       The number of threads to use. None or 1 uses the calling thread
+       and -1 uses all CPUs. NumPy releases the GIL while it computes, so
+       the threads run in parallel.
+
+    Returns
+    -------
+    predecessor, distance : 2D numpy.ndarray
+        ``distance[i, j]`` is the length of a shortest path from
+        ``nodelist[i]`` to ``nodelist[j]``, Inf for floating point types
+        and the largest value of the type for integer types if there is
+        no path. ``predecessor[i, j]`` is the index of the node before
+        ``nodelist[j]`` on that path, or -1 if ``i == j`` or there is no
+        path.
+
+    Raises
+    ------
+    NetworkXError
+        If nodelist is not a list of the nodes in G.
+
+    ValueError
+        If the arrays in `out` do not have the right shape, if `n_jobs`
+        is not a positive integer or -1, or if the distance type is an
+        integer type and an edge weight is not an integer.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph()
+    >>> G.add_weighted_edges_from([(0, 1, 5), (1, 2, 1), (0, 3, 2), (3, 1, 1)])
+    >>> pred, dist = nx.floyd_warshall_blocked(G, block_size=2)
+    >>> dist[0].tolist()
+    [0.0, 3.0, 4.0, 2.0]
+    >>> pred[0].tolist()
+    [-1, 3, 1, 0]
+    >>> path = [2]
+    >>> while pred[0, path[-1]] >= 0:
+    ...     path.append(int(pred[0, path[-1]]))
+    >>> [list(G)[i] for i in reversed(path)]
+    [0, 3, 1, 2]
+
+    Notes
+    -----
+    The running time is $O(n^3)$ like Floyd's algorithm, and the memory
+    use is the two $n \\times n$ arrays. For integer types, path lengths
+    must be smaller than half the largest value of the type, which is
+    used for nodes without a path during the computation.
+
+    Negative edge weights are allowed. A negative cycle through a node
+    gives a negative distance from the node to itself.
+
+    See Also
+    --------
+    floyd_warshall_numpy
+    floyd_warshall_predecessor_and_distance
+
+    References
+    ----------
+    .. [1] G. Venkataraman, S. Sahni and S. Mukhopadhyaya,
+       "A Blocked All-Pairs Shortest-Paths Algorithm",
+       Journal of Experimental Algorithmics 8, 2003.
+       https://doi.org/10.1145/996546.996553
+    """
+    import numpy as np
+
+    if nodelist is None:
+        nodelist = list(G)
+    elif not (len(nodelist) == len(G) == len(set(nodelist))):
+        raise nx.NetworkXError(
+            "nodelist must contain every node in G with no repeats."
+            "If you wanted a subgraph of G use G.subgraph(nodelist)"
+        )
+    n = len(nodelist)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, not {n_jobs}")
+    if out is None:
+        dist = np.empty((n, n), dtype=np.float64 if dtype is None else dtype)
+        pred = np.empty((n, n), dtype=np.int32 if n < 2**31 else np.int64)
+    else:
+        pred, dist = out
+        if pred.shape != (n, n) or dist.shape != (n, n):
+            raise ValueError(f"The arrays in out must have shape ({n}, {n})")
+    integral = dist.dtype.kind != "f"
+    if integral:
+        largest = np.iinfo(dist.dtype).max
+        # the sum of two of these does not overflow
+        inf = largest // 2
+    else:
+        inf = largest = np.inf
+
+    dist[:] = inf
+    pred[:] = -1
+    index = {node: i for i, node in enumerate(nodelist)}
+    edges = G.edges(data=weight, default=1)
+    for u, v, d in edges:
+        if integral and d % 1:
+            raise ValueError(f"Weight {d} of edge ({u}, {v}) is not an integer")
+        i, j = index[u], index[v]
+        if d < dist[i, j]:
+            dist[i, j] = d
+            pred[i, j] = i
+        if not G.is_directed() and d < dist[j, i]:
+            dist[j, i] = d
+            pred[j, i] = j
+    np.fill_diagonal(dist, 0)
+    np.fill_diagonal(pred, -1)
+
+    def relax(rows, cols, k):
+        # relax dist[rows, cols] through node k
+        D = dist[rows, cols]
+        through_k = dist[rows, k, None] + dist[k, cols]
+        shorter = through_k < D
+        if integral:
+            # a negative weight added to the "no path" value goes below it
+            shorter &= (dist[rows, k, None] < inf) & (dist[k, cols] < inf)
+        np.copyto(D, through_k, where=shorter)
+        np.copyto(pred[rows, cols], pred[k, cols], where=shorter)
+
+    def relax_rows(start, stop, K):
+        # relax all tiles in rows start:stop, column by column of tiles
+        for col in range(0, n, block_size):
+            cols = slice(col, min(col + block_size, n))
+            for k in range(K.start, K.stop):
+                relax(slice(start, stop), cols, k)
+
+    if n_jobs is not None and n_jobs > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        pool = ThreadPoolExecutor(n_jobs)
+    else:
+        pool = None
+    try:
+        for start in range(0, n, block_size):
+            K = slice(start, min(start + block_size, n))
+            # the row and column of tiles crossing the diagonal tile
+            for k in range(K.start, K.stop):
+                relax(K, slice(None), k)
+                relax(slice(None), K, k)
+            # all other tiles only read the crossing ones
+            row_blocks = [
+                (row, min(row + block_size, n))
+                for row in range(0, n, block_size)
+                if row != start
+            ]
+            if pool is None:
+                for row, stop in row_blocks:
+                    relax_rows(row, stop, K)
+            else:
+                for future in [
+                    pool.submit(relax_rows, row, stop, K) for row, stop in row_blocks
+                ]:
+                    future.result()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    if integral:
+        dist[dist == inf] = largest
+    return pred, dist
+
+
 def floyd_warshall_predecessor_and_distance(G, weight="weight"):
     """Find all-pairs shortest path lengths using Floyd's algorithm.
 
@@ -231,3 +439,222 @@ def floyd_warshall(G, weight="weight"):
     """
     # could make this its own function to reduce memory costs
     return floyd_warshall_predecessor_and_distance(G, weight=weight)[1]
+
+
+def all_pairs_shortest_path_length_memmap(
+    G,
+    filename,
+    nodelist=None,
+    weight=None,
+    dtype=None,
+    chunksize=None,
+    n_jobs=None,
+    resume=True,
+):
+    """Writes all-pairs shortest path lengths to a memory-mapped ``.npy`` file.
+
+    Unlike :func:`all_pairs_shortest_path_length` and
+    :func:`all_pairs_dijkstra_path_length`, which yield a dict for every
+    source, the distance matrix is written to disk a block of rows at a
+    time, so graphs whose distance matrix does not fit in memory can be
+    handled. The searches from the sources of a block are run by
+    :func:`scipy.sparse.csgraph.dijkstra`, optionally in several processes
+    that write their rows directly into the file.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    filename : str or path-like
+        The ``.npy`` file to write. It can be read back with
+        ``numpy.load(filename, mmap_mode="r")``.
+
+    nodelist : list, optional (default=G.nodes)
+       The rows and columns are ordered by the nodes in nodelist.
+       If nodelist is None then the ordering is produced by G.nodes.
+       Nodelist should include all nodes in G.
+
+    weight : string, optional (default=None)
+       Edge data key corresponding to the edge weight. If None, every
+       edge has length one. If an edge has no such attribute, its weight
+       is one. Of parallel edges the lightest is used.
+
+    dtype : NumPy data-type, optional
+       The data type of the matrix. The default is ``uint16`` if `weight`
+       is None and ``float32`` otherwise. Lengths are cast to `dtype`.
+
+    chunksize : int, optional
+       The number of rows computed at once, and the granularity of the
+       checkpoints. The default keeps the intermediate float64 block of
+       each process at about 32 MB.
+
+    n_jobs : int, optional (default=None)
+       The number of processes to use. None or 1 computes the rows in
+       this process and -1 uses all CPUs.
+
+    resume : bool, optional (default=True)
+       If True and an interrupted earlier call left its checkpoint file
+       ``filename + ".progress.npy"`` behind, only the missing rows are
+       computed. The earlier call must have used the same graph,
+       `nodelist` and `dtype`. Otherwise, or if `filename` is missing,
+       the matrix is computed anew.
+
+    Returns
+    -------
+    distance : numpy.memmap
+        The ``len(G)`` by ``len(G)`` matrix of shortest path lengths from
+        the node of each row to the node of each column, backed by
+        `filename`. Nodes without a path between them have distance Inf
+        for floating point types and the largest value of `dtype` for
+        integer types.
+
+    Raises
+    ------
+    NetworkXError
+        If nodelist is not a list of the nodes in G.
+
+    ValueError
+        If an edge weight is negative, if a finite length does not fit in
+        an integer `dtype`, or if `n_jobs` is not a positive integer or -1.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> G = nx.cycle_graph(5)
+    >>> with tempfile.TemporaryDirectory() as tmp:
+    ...     path = os.path.join(tmp, "dist.npy")
+    ...     D = nx.all_pairs_shortest_path_length_memmap(G, path)
+    ...     print(D.dtype, D[0].tolist())
+    ...     del D
+    uint16 [0, 1, 2, 2, 1]
+
+    Notes
+    -----
+    The file is written in the ``.npy`` format. Every completed block of
+    rows is flushed to disk and recorded in the checkpoint file, which is
+    deleted when the matrix is complete.
+
+    With ``n_jobs > 1`` the graph is converted to a sparse matrix once
+    and sent to every process. Memory use is then about ``n_jobs`` times
+    the sparse matrix plus one block of rows per process, independent of
+    the size of the distance matrix.
+
+    See Also
+    --------
+    all_pairs_shortest_path_length
+    all_pairs_dijkstra_path_length
+    floyd_warshall_numpy
+    """
+    import numpy as np
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    if nodelist is None:
+        nodelist = list(G)
+    elif not (len(nodelist) == len(G) == len(set(nodelist))):
+        raise nx.NetworkXError(
+            "nodelist must contain every node in G with no repeats."
+            "If you wanted a subgraph of G use G.subgraph(nodelist)"
+        )
+    if dtype is None:
+        dtype = np.uint16 if weight is None else np.float32
+    dtype = np.dtype(dtype)
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+    if n_jobs is not None and n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, not {n_jobs}")
+    n = len(nodelist)
+    if chunksize is None:
+        chunksize = max(1, 2**22 // max(n, 1))
+
+    # sparse matrix of the lightest edge between every pair of nodes;
+    # explicit zeros are edges of weight zero
+    index = {node: i for i, node in enumerate(nodelist)}
+    edges = G.edges(data=weight, default=1) if weight is not None else G.edges
+    rows, cols, data = [], [], []
+    for u, v, *wt in edges:
+        rows.append(index[u])
+        cols.append(index[v])
+        data.append(wt[0] if wt else 1)
+    rows = np.array(rows, dtype=np.int64)
+    cols = np.array(cols, dtype=np.int64)
+    data = np.array(data, dtype=np.float64)
+    if (data < 0).any():
+        raise ValueError("Graph has negative edge weights")
+    if not G.is_directed():
+        rows, cols = np.concatenate([rows, cols]), np.concatenate([cols, rows])
+        data = np.concatenate([data, data])
+    order = np.lexsort((data, cols, rows))
+    rows, cols, data = rows[order], cols[order], data[order]
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+    A = sp.sparse.csr_array((data[first], (rows[first], cols[first])), shape=(n, n))
+
+    filename = os.fspath(filename)
+    progress_file = filename + ".progress.npy"
+    # without the matrix the checkpoint is of no use, so start over
+    if resume and os.path.exists(progress_file) and os.path.exists(filename):
+        done = np.load(progress_file, mmap_mode="r+")
+        distance = np.load(filename, mmap_mode="r+")
+        if distance.shape != (n, n) or distance.dtype != dtype or len(done) != n:
+            raise ValueError(f"{filename} does not match the graph and dtype")
+    else:
+        done = np.lib.format.open_memmap(progress_file, "w+", bool, (n,))
+        distance = np.lib.format.open_memmap(filename, "w+", dtype, (n, n))
+    todo = np.flatnonzero(~done)
+    chunks = [todo[i : i + chunksize] for i in range(0, len(todo), chunksize)]
+    task = (A, filename, weight is None)
+
+    if n_jobs is None or n_jobs == 1 or len(chunks) <= 1:
+        _init_distance_worker(*task)
+        try:
+            for chunk in chunks:
+                done[_write_distance_rows(chunk)] = True
+                done.flush()
+        finally:
+            _init_distance_worker(None, None, None)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(
+            n_jobs, initializer=_init_distance_worker, initargs=task
+        ) as pool:
+            futures = [pool.submit(_write_distance_rows, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                done[future.result()] = True
+                done.flush()
+    del done
+    os.remove(progress_file)
+    return distance
+
+
+_distance_worker = None
+
+
+def _init_distance_worker(A, filename, unweighted):
+    import numpy as np
+
+    global _distance_worker
+    if A is None:
+        _distance_worker = None
+    else:
+        _distance_worker = (A, np.load(filename, mmap_mode="r+"), unweighted)
+
+
+def _write_distance_rows(sources):
+    """Writes the rows of sources to the distance matrix and returns sources."""
+    import numpy as np
+    import scipy as sp
+    import scipy.sparse.csgraph  # call as sp.sparse.csgraph
+
+    A, distance, unweighted = _distance_worker
+    block = sp.sparse.csgraph.dijkstra(A, indices=sources, unweighted=unweighted)
+    if distance.dtype.kind in "iu":
+        unreachable = np.isinf(block)
+        largest = np.iinfo(distance.dtype).max
+        if (block[~unreachable] >= largest).any():
+            raise ValueError(f"Shortest path lengths do not fit in {distance.dtype}")
+        block[unreachable] = largest
+    distance[sources] = block
+    distance.flush()
+    return sources
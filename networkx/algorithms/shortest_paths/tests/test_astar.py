@@ -175,3 +175,70 @@ class TestAStar:
         G.add_edges_from(pairwise(nodes, cyclic=True))
         path = nx.astar_path(G, nodes[0], nodes[2])
         assert len(path) == 3
+
+
+class TestLandmarkHeuristic:
+    @pytest.mark.parametrize("strategy", ["farthest", "degree", "random"])
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_admissible(self, strategy, directed):
+        G = nx.gnp_random_graph(60, 0.06, seed=7, directed=directed)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = (u * v) % 7 + 1
+        h = nx.LandmarkHeuristic(G, 4, strategy=strategy, seed=1)
+        assert len(h.landmarks) == len(set(h.landmarks)) == 4
+        lengths = dict(nx.all_pairs_dijkstra_path_length(G))
+        for u in G:
+            for v in G:
+                assert h(u, v) <= lengths[u].get(v, float("inf"))
+                assert h(u, v) >= 0
+            for L in h.landmarks:
+                if u in lengths[L]:
+                    assert h(L, u) == lengths[L][u]
+            for v in lengths[u]:
+                path_length = nx.astar_path_length(G, u, v, heuristic=h)
+                assert path_length == lengths[u][v]
+
+    def test_given_landmarks(self):
+        G = nx.path_graph(10)
+        h = nx.LandmarkHeuristic(G, [0])
+        assert h.landmarks == [0]
+        assert h(3, 7) == 4
+        assert h(7, 3) == 4
+        assert nx.astar_path(G, 2, 8, heuristic=h) == list(range(2, 9))
+        with pytest.raises(nx.NodeNotFound):
+            nx.LandmarkHeuristic(G, [0, 10])
+
+    def test_weight_function(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+        nx.set_edge_attributes(G, {(0, 1): 5}, "cost")
+
+        def cost(u, v, d):
+            return d.get("cost", 1)
+
+        h = nx.LandmarkHeuristic(G, [0], weight=cost)
+        # d(1, 0) - d(0, 0) and d(0, 0) - d(0, 1)
+        assert h(1, 0) == 2
+        assert h(0, 1) == 5
+        assert nx.astar_path_length(G, 1, 0, heuristic=h, weight=cost) == 2
+
+    def test_disconnected(self):
+        G = nx.DiGraph([(0, 1), (2, 3)])
+        h = nx.LandmarkHeuristic(G, 2, seed=3)
+        # the second landmark is in the other component
+        assert sorted(h.landmarks) in ([0, 2], [1, 3], [0, 3], [1, 2])
+        assert nx.LandmarkHeuristic(G, [0])(1, 0) == float("inf")
+        with pytest.raises(nx.NetworkXNoPath):
+            nx.astar_path(G, 0, 3, heuristic=h)
+        # nodes added later get no bound
+        G.add_edge(1, 4)
+        assert h(4, 0) == 0
+        assert nx.astar_path(G, 0, 4, heuristic=h) == [0, 1, 4]
+
+    def test_small_graphs(self):
+        assert nx.LandmarkHeuristic(nx.Graph()).landmarks == []
+        h = nx.LandmarkHeuristic(nx.path_graph(3))
+        assert sorted(h.landmarks) == [0, 1, 2]
+
+    def test_bad_strategy(self):
+        with pytest.raises(ValueError):
+            nx.LandmarkHeuristic(nx.path_graph(3), strategy="closest")
@@ -0,0 +1,117 @@
+import pickle
+import random
+
+import pytest
+
+import networkx as nx
+
+
+def _check_queries(G, ch, weight="weight", queries=100, seed=42):
+    rng = random.Random(seed)
+    nodes = list(G)
+    for _ in range(queries):
+        s, t = rng.choice(nodes), rng.choice(nodes)
+        try:
+            expected = nx.dijkstra_path_length(G, s, t, weight=weight)
+        except nx.NetworkXNoPath:
+            with pytest.raises(nx.NetworkXNoPath):
+                ch.dijkstra_path(s, t)
+            continue
+        length, path = ch.bidirectional_dijkstra(s, t)
+        assert length == pytest.approx(expected)
+        assert ch.dijkstra_path_length(s, t) == pytest.approx(expected)
+        assert path[0] == s and path[-1] == t
+        assert nx.path_weight(G, path, weight) == pytest.approx(expected)
+
+
+class TestContractionHierarchy:
+    @classmethod
+    def setup_class(cls):
+        cls.XG = nx.DiGraph()
+        cls.XG.add_weighted_edges_from(
+            [
+                ("s", "u", 10),
+                ("s", "x", 5),
+                ("u", "v", 1),
+                ("u", "x", 2),
+                ("v", "y", 1),
+                ("x", "u", 3),
+                ("x", "v", 5),
+                ("x", "y", 2),
+                ("y", "s", 7),
+                ("y", "v", 6),
+            ]
+        )
+
+    def test_small(self):
+        ch = nx.ContractionHierarchy(self.XG)
+        assert ch.bidirectional_dijkstra("s", "v") == (9, ["s", "x", "u", "v"])
+        assert ch.dijkstra_path_length("v", "s") == 8
+        assert ch.dijkstra_path("s", "s") == ["s"]
+        assert sorted(ch.rank.values()) == list(range(len(self.XG)))
+
+    def test_random_directed(self):
+        rng = random.Random(1)
+        G = nx.gnp_random_graph(150, 0.03, seed=1, directed=True)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = rng.randint(1, 10)
+        _check_queries(G, nx.ContractionHierarchy(G))
+
+    def test_random_undirected(self):
+        rng = random.Random(2)
+        G = nx.grid_2d_graph(12, 12)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = rng.random()
+        _check_queries(G, nx.ContractionHierarchy(G))
+        _check_queries(G, nx.ContractionHierarchy(G, witness_limit=1))
+
+    def test_multigraph(self):
+        G = nx.MultiDiGraph()
+        G.add_weighted_edges_from([(0, 1, 5), (0, 1, 1), (1, 2, 1), (0, 2, 3)])
+        ch = nx.ContractionHierarchy(G)
+        assert ch.bidirectional_dijkstra(0, 2) == (2, [0, 1, 2])
+
+    def test_weight_function(self):
+        G = nx.cycle_graph(6)
+        nx.set_edge_attributes(G, {(0, 1): 10}, "cost")
+
+        def cost(u, v, d):
+            # hide the edge (3, 4)
+            return None if {u, v} == {3, 4} else d.get("cost", 1)
+
+        ch = nx.ContractionHierarchy(G, weight=cost)
+        assert ch.bidirectional_dijkstra(0, 4) == (2, [0, 5, 4])
+        assert ch.bidirectional_dijkstra(0, 3) == (12, [0, 1, 2, 3])
+
+    def test_no_path(self):
+        G = nx.DiGraph([(0, 1), (2, 3)])
+        G.add_node(4)
+        ch = nx.ContractionHierarchy(G)
+        with pytest.raises(nx.NetworkXNoPath):
+            ch.dijkstra_path(0, 3)
+        with pytest.raises(nx.NetworkXNoPath):
+            ch.dijkstra_path_length(1, 0)
+        with pytest.raises(nx.NetworkXNoPath):
+            ch.bidirectional_dijkstra(0, 4)
+
+    def test_node_not_found(self):
+        ch = nx.ContractionHierarchy(nx.path_graph(3))
+        with pytest.raises(nx.NodeNotFound):
+            ch.dijkstra_path(0, 5)
+        with pytest.raises(nx.NodeNotFound):
+            ch.dijkstra_path_length(5, 0)
+
+    def test_negative_weight(self):
+        G = nx.DiGraph()
+        G.add_edge(0, 1, weight=-1)
+        with pytest.raises(ValueError):
+            nx.ContractionHierarchy(G)
+
+    def test_pickle(self):
+        ch = nx.ContractionHierarchy(self.XG)
+        ch2 = pickle.loads(pickle.dumps(ch))
+        for s in self.XG:
+            for t in self.XG:
+                assert ch2.bidirectional_dijkstra(s, t) == ch.bidirectional_dijkstra(
+                    s, t
+                )
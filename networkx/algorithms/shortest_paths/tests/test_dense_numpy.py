@@ -87,3 +87,188 @@ def test_nodelist():
     assert dist[6, 2] == 4
     pytest.raises(nx.NetworkXError, nx.floyd_warshall_numpy, G, [1, 3])
     pytest.raises(nx.NetworkXError, nx.floyd_warshall_numpy, G, list(range(9)))
+
+
+class TestFloydWarshallBlocked:
+    def check(self, G, pred, dist, weight="weight"):
+        nodes = list(G)
+        expected = nx.floyd_warshall_numpy(G, weight=weight)
+        unreachable = np.isinf(expected)
+        if dist.dtype.kind in "iu":
+            expected[unreachable] = np.iinfo(dist.dtype).max
+        np.testing.assert_allclose(dist, expected)
+        for i in range(len(G)):
+            for j in range(len(G)):
+                if i == j or unreachable[i, j]:
+                    assert pred[i, j] == -1
+                    continue
+                path = [j]
+                while path[-1] != i:
+                    path.append(pred[i, path[-1]])
+                path = [nodes[k] for k in reversed(path)]
+                assert nx.path_weight(G, path, weight) == pytest.approx(dist[i, j])
+
+    @pytest.mark.parametrize("directed", [False, True])
+    @pytest.mark.parametrize("block_size", [1, 7, 256])
+    def test_random(self, directed, block_size):
+        G = nx.gnp_random_graph(40, 0.08, seed=5, directed=directed)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = (u * v) % 9 + 1
+        pred, dist = nx.floyd_warshall_blocked(G, block_size=block_size)
+        assert dist.dtype == np.float64
+        self.check(G, pred, dist)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.int32, np.uint16])
+    def test_dtype(self, dtype):
+        G = nx.gnp_random_graph(30, 0.1, seed=2, directed=True)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = (u + v) % 4
+        pred, dist = nx.floyd_warshall_blocked(G, dtype=dtype, block_size=8)
+        assert dist.dtype == dtype
+        self.check(G, pred, dist)
+
+    def test_negative_weights(self):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, 3), (1, 2, -2), (0, 2, 2), (2, 3, 1)])
+        pred, dist = nx.floyd_warshall_blocked(G, block_size=2)
+        self.check(G, pred, dist)
+        assert dist[0, 3] == 2
+        # no path through a negative edge does not become a path
+        pred, dist = nx.floyd_warshall_blocked(G, dtype=np.int32, block_size=2)
+        self.check(G, pred, dist)
+        assert dist[3, 2] == dist[1, 0] == np.iinfo(np.int32).max
+        assert pred[3, 2] == pred[1, 0] == -1
+
+    def test_integer_dtype_fractional_weights(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 0.4), (1, 2, 0.6)])
+        with pytest.raises(ValueError):
+            nx.floyd_warshall_blocked(G, dtype=np.int32)
+        G.add_weighted_edges_from([(0, 1, 2.0), (1, 2, 1.0)])
+        pred, dist = nx.floyd_warshall_blocked(G, dtype=np.int32)
+        assert dist[0].tolist() == [0, 2, 3]
+
+    def test_multigraph_nodelist(self):
+        G = nx.MultiGraph()
+        G.add_weighted_edges_from([(0, 1, 4), (0, 1, 1), (1, 2, 1), (0, 2, 5)])
+        pred, dist = nx.floyd_warshall_blocked(G, nodelist=[2, 1, 0])
+        assert dist.tolist() == [[0, 1, 2], [1, 0, 1], [2, 1, 0]]
+        assert pred.tolist() == [[-1, 0, 1], [1, -1, 1], [1, 2, -1]]
+        with pytest.raises(nx.NetworkXError):
+            nx.floyd_warshall_blocked(G, nodelist=[0, 1])
+
+    def test_out(self, tmp_path):
+        G = nx.les_miserables_graph()
+        n = len(G)
+        dist = np.lib.format.open_memmap(tmp_path / "d.npy", "w+", np.float32, (n, n))
+        pred = np.lib.format.open_memmap(tmp_path / "p.npy", "w+", np.int16, (n, n))
+        result = nx.floyd_warshall_blocked(G, out=(pred, dist), block_size=16)
+        assert result[0] is pred and result[1] is dist
+        dist.flush()
+        pred.flush()
+        self.check(G, np.load(tmp_path / "p.npy"), np.load(tmp_path / "d.npy"))
+        with pytest.raises(ValueError):
+            nx.floyd_warshall_blocked(G, out=(pred[1:], dist))
+
+    def test_n_jobs(self):
+        G = nx.les_miserables_graph()
+        pred, dist = nx.floyd_warshall_blocked(G, block_size=10, n_jobs=3)
+        self.check(G, pred, dist)
+        with pytest.raises(ValueError):
+            nx.floyd_warshall_blocked(G, n_jobs=0)
+
+    def test_empty(self):
+        pred, dist = nx.floyd_warshall_blocked(nx.Graph())
+        assert dist.shape == pred.shape == (0, 0)
+
+
+class TestAllPairsShortestPathLengthMemmap:
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("scipy")
+
+    def check(self, G, D, weight=None, nodelist=None):
+        nodelist = list(G) if nodelist is None else nodelist
+        if weight is None:
+            lengths = dict(nx.all_pairs_shortest_path_length(G))
+        else:
+            lengths = dict(nx.all_pairs_dijkstra_path_length(G, weight=weight))
+        unreachable = np.inf if D.dtype.kind == "f" else np.iinfo(D.dtype).max
+        for i, u in enumerate(nodelist):
+            for j, v in enumerate(nodelist):
+                assert D[i, j] == pytest.approx(lengths[u].get(v, unreachable))
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_unweighted(self, tmp_path, directed):
+        G = nx.gnp_random_graph(40, 0.05, seed=3, directed=directed)
+        filename = tmp_path / "dist.npy"
+        D = nx.all_pairs_shortest_path_length_memmap(G, filename, chunksize=7)
+        assert D.dtype == np.uint16
+        self.check(G, D)
+        self.check(G, np.load(filename))
+        assert not (tmp_path / "dist.npy.progress.npy").exists()
+
+    def test_weighted(self, tmp_path):
+        G = nx.MultiDiGraph()
+        G.add_weighted_edges_from(
+            [(0, 1, 2.5), (0, 1, 0.5), (1, 2, 0), (2, 0, 1), (3, 0, 1)]
+        )
+        nodelist = [3, 2, 1, 0]
+        D = nx.all_pairs_shortest_path_length_memmap(
+            G, tmp_path / "dist.npy", nodelist=nodelist, weight="weight"
+        )
+        assert D.dtype == np.float32
+        assert D[0].tolist() == [0, 1.5, 1.5, 1]
+        assert D[1].tolist() == [np.inf, 0, 1.5, 1]
+        self.check(G, D, "weight", nodelist)
+
+    def test_n_jobs(self, tmp_path):
+        G = nx.les_miserables_graph()
+        D = nx.all_pairs_shortest_path_length_memmap(
+            G, tmp_path / "dist.npy", weight="weight", chunksize=10, n_jobs=2
+        )
+        self.check(G, D, "weight")
+        with pytest.raises(ValueError):
+            nx.all_pairs_shortest_path_length_memmap(G, tmp_path / "d.npy", n_jobs=0)
+
+    def test_resume(self, tmp_path):
+        G = nx.path_graph(10)
+        filename = tmp_path / "dist.npy"
+        D = nx.all_pairs_shortest_path_length_memmap(G, filename, dtype=np.int32)
+        # pretend the computation stopped after the first four rows
+        D[:4] = -1
+        D[4:] = 0
+        D.flush()
+        done = np.zeros(10, dtype=bool)
+        done[:4] = True
+        np.save(tmp_path / "dist.npy.progress.npy", done)
+        D = nx.all_pairs_shortest_path_length_memmap(G, filename, dtype=np.int32)
+        assert (D[:4] == -1).all()
+        assert D[4].tolist() == [4, 3, 2, 1, 0, 1, 2, 3, 4, 5]
+        assert not (tmp_path / "dist.npy.progress.npy").exists()
+        # a complete matrix is computed anew
+        D = nx.all_pairs_shortest_path_length_memmap(G, filename, dtype=np.int32)
+        self.check(G, D)
+        # so is a matrix whose file is gone
+        del D
+        np.save(tmp_path / "dist.npy.progress.npy", done)
+        filename.unlink()
+        D = nx.all_pairs_shortest_path_length_memmap(G, filename, dtype=np.int32)
+        self.check(G, D)
+        assert not (tmp_path / "dist.npy.progress.npy").exists()
+
+    def test_errors(self, tmp_path):
+        filename = tmp_path / "dist.npy"
+        G = nx.path_graph(300)
+        with pytest.raises(ValueError, match="do not fit"):
+            nx.all_pairs_shortest_path_length_memmap(G, filename, dtype=np.uint8)
+        G = nx.DiGraph()
+        G.add_edge(0, 1, weight=-1)
+        with pytest.raises(ValueError, match="negative"):
+            nx.all_pairs_shortest_path_length_memmap(G, filename, weight="weight")
+        with pytest.raises(nx.NetworkXError):
+            nx.all_pairs_shortest_path_length_memmap(G, filename, nodelist=[0])
+
+    def test_empty(self, tmp_path):
+        D = nx.all_pairs_shortest_path_length_memmap(nx.Graph(), tmp_path / "d.npy")
+        assert D.shape == (0, 0)
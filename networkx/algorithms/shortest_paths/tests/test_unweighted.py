@@ -1,3 +1,5 @@
+import pytest
+
 import networkx as nx
 
 
@@ -114,3 +116,18 @@ class TestUnweightedPath:
         p, s = nx.predecessor(G, 0, 3, cutoff=2, return_seen=True)
         assert p == []
         assert s == -1
+
+    def test_shortest_path_length_csr(self):
+        pytest.importorskip("numpy")
+        G = nx.gnp_random_graph(100, 0.05, seed=42, directed=True)
+        H = nx.CSRDiGraph(G)
+        for cutoff in (None, 2):
+            assert nx.single_source_shortest_path_length(
+                H, 0, cutoff=cutoff
+            ) == nx.single_source_shortest_path_length(G, 0, cutoff=cutoff)
+        assert dict(nx.single_target_shortest_path_length(H, 0)) == dict(
+            nx.single_target_shortest_path_length(G, 0)
+        )
+        assert dict(nx.all_pairs_shortest_path_length(nx.CSRGraph(self.grid))) == (
+            dict(nx.all_pairs_shortest_path_length(self.grid))
+        )
@@ -493,6 +493,88 @@ class TestMultiSourceDijkstra:
         assert paths == {n: list(range(n + 1)) for n in G}
 
 
+class TestBucketQueueDijkstra:
+    """Unit tests for Dijkstra's algorithm with ``queue="bucket"``."""
+
+    @pytest.mark.parametrize("directed", [False, True])
+    def test_random(self, directed):
+        G = nx.gnp_random_graph(80, 0.08, seed=11, directed=directed)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = (3 * u + v) % 5  # includes zero weights
+        for s in [0, 17, 42]:
+            dist, paths = nx.single_source_dijkstra(G, s)
+            bdist, bpaths = nx.single_source_dijkstra(G, s, queue="bucket")
+            assert bdist == dist
+            for t, path in bpaths.items():
+                validate_path(G, s, t, dist[t], path)
+            for t in [1, 50, 79]:
+                if t not in dist:
+                    with pytest.raises(nx.NetworkXNoPath):
+                        nx.bidirectional_dijkstra(G, s, t, queue="bucket")
+                    continue
+                length, path = nx.bidirectional_dijkstra(G, s, t, queue="bucket")
+                validate_length_path(G, s, t, dist[t], length, path)
+                length, path = nx.single_source_dijkstra(G, s, t, queue="bucket")
+                validate_length_path(G, s, t, dist[t], length, path)
+
+    def test_multi_source(self):
+        edges = [(0, 1, 1), (1, 2, 1), (2, 3, 10), (3, 4, 1)]
+        G = nx.Graph()
+        G.add_weighted_edges_from(edges)
+        distances, paths = nx.multi_source_dijkstra(G, {0, 4}, queue="bucket")
+        assert distances == {0: 0, 1: 1, 2: 2, 3: 1, 4: 0}
+        assert paths == {0: [0], 1: [0, 1], 2: [0, 1, 2], 3: [4, 3], 4: [4]}
+        distances, _ = nx.multi_source_dijkstra(G, {0}, cutoff=2, queue="bucket")
+        assert distances == {0: 0, 1: 1, 2: 2}
+
+    def test_multigraph_and_weight_function(self):
+        G = nx.MultiDiGraph()
+        G.add_weighted_edges_from([(0, 1, 4), (0, 1, 2), (1, 2, 1), (0, 2, 5)])
+        assert nx.bidirectional_dijkstra(G, 0, 2, queue="bucket") == (3, [0, 1, 2])
+
+        def weight(u, v, d):
+            return None if v == 1 else 2
+
+        assert nx.single_source_dijkstra(G, 0, weight=weight, queue="bucket") == (
+            {0: 0, 2: 2},
+            {0: [0], 2: [0, 2]},
+        )
+
+    def test_integral_floats(self):
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, 1.0), (1, 2, 2.0)])
+        assert nx.single_source_dijkstra(G, 0, 2, queue="bucket") == (3.0, [0, 1, 2])
+
+    @pytest.mark.parametrize("w", [0.5, -1])
+    def test_bad_weights(self, w):
+        G = nx.DiGraph()
+        G.add_weighted_edges_from([(0, 1, w), (1, 2, 1)])
+        with pytest.raises(ValueError):
+            nx.single_source_dijkstra(G, 0, queue="bucket")
+        with pytest.raises(ValueError):
+            nx.bidirectional_dijkstra(G, 0, 2, queue="bucket")
+
+    @pytest.mark.parametrize("w", [0.5, -1, float("nan")])
+    def test_bad_weights_target(self, w):
+        # the search reaches the target before the bad weight would be
+        # noticed by the scan of the buckets
+        G = nx.Graph()
+        G.add_weighted_edges_from([(0, 1, w), (1, 2, 0.5), (0, 2, 2)])
+        with pytest.raises(ValueError):
+            nx.single_source_dijkstra(G, 0, 2, queue="bucket")
+        with pytest.raises(ValueError):
+            nx.single_source_dijkstra(G, 0, target=1, queue="bucket")
+        with pytest.raises(ValueError):
+            nx.bidirectional_dijkstra(G, 0, 2, queue="bucket")
+
+    def test_unknown_queue(self):
+        G = nx.path_graph(3)
+        with pytest.raises(ValueError):
+            nx.single_source_dijkstra(G, 0, queue="fibonacci")
+        with pytest.raises(ValueError):
+            nx.bidirectional_dijkstra(G, 0, 2, queue="fibonacci")
+
+
 class TestBellmanFordAndGoldbergRadzik(WeightedTestBase):
     def test_single_node_graph(self):
         G = nx.DiGraph()
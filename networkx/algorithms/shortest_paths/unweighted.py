@@ -2,6 +2,7 @@
 Shortest path algorithms for unweighted graphs.
 """
 import networkx as nx
+from networkx.classes.csrgraph import CSRAdjacency, _csr_bfs_levels
 
 __all__ = [
     "bidirectional_shortest_path",
@@ -72,6 +73,14 @@ def _single_shortest_path_length(adj, firstlevel, cutoff):
         cutoff : int or float
             level at which we stop the process
     """
+    csr = getattr(adj, "_atlas", adj)
+    if isinstance(csr, CSRAdjacency):
+        nodes = csr.nodes
+        cutoff = None if cutoff == float("inf") else cutoff
+        for level, frontier in enumerate(_csr_bfs_levels(csr, firstlevel, cutoff)):
+            for i in frontier.tolist():
+                yield (nodes[i], level)
+        return
     seen = {}  # level (number of hops) when seen in BFS
     level = 0  # the current level
     nextlevel = set(firstlevel)  # set of nodes to check at next level
@@ -373,7 +373,9 @@ def single_source_dijkstra_path_length(G, source, cutoff=None, weight="weight"):
     return multi_source_dijkstra_path_length(G, {source}, cutoff=cutoff, weight=weight)
 
 
-def single_source_dijkstra(G, source, target=None, cutoff=None, weight="weight"):
+def single_source_dijkstra(
+    G, source, target=None, cutoff=None, weight="weight", queue="heap"
+):
     """Find shortest weighted paths and lengths from a source node.
 
     Compute the shortest path length between source and all other
@@ -410,6 +412,13 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight="weight")
         dictionary of edge attributes for that edge. The function must
         return a number.
 
+    queue : "heap" or "bucket", optional (default="heap")
+        The priority queue of the nodes to visit. "bucket" keeps the nodes
+        in a dict of lists keyed by their integer distance, a bucket queue
+        as in Dial's algorithm, which avoids the tuples and the logarithmic
+        cost of a heap. It requires nonnegative integer edge weights and is
+        fastest for small ones.
+
     Returns
     -------
     distance, path : pair of dictionaries, or numeric and list.
@@ -426,6 +435,10 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight="weight")
     NodeNotFound
         If `source` is not in `G`.
 
+    ValueError
+        If `queue` is "bucket" and an edge weight is not a nonnegative
+        integer.
+
     Examples
     --------
     >>> G = nx.path_graph(5)
@@ -447,6 +460,11 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight="weight")
     >>> path
     [0, 1]
 
+    For small integer weights a bucket queue is faster:
+
+    >>> nx.single_source_dijkstra(G, 0, 4, queue="bucket")
+    (4, [0, 1, 2, 3, 4])
+
     Notes
     -----
     Edge weight attributes must be numerical.
@@ -470,7 +488,7 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight="weight")
     single_source_bellman_ford
     """
     return multi_source_dijkstra(
-        G, {source}, cutoff=cutoff, target=target, weight=weight
+        G, {source}, cutoff=cutoff, target=target, weight=weight, queue=queue
     )
 
 
@@ -628,7 +646,9 @@ def multi_source_dijkstra_path_length(G, sources, cutoff=None, weight="weight"):
     return _dijkstra_multisource(G, sources, weight, cutoff=cutoff)
 
 
-def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight"):
+def multi_source_dijkstra(
+    G, sources, target=None, cutoff=None, weight="weight", queue="heap"
+):
     """Find shortest weighted paths and lengths from a given set of
     source nodes.
 
@@ -666,6 +686,13 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight")
         dictionary of edge attributes for that edge. The function must
         return a number.
 
+    queue : "heap" or "bucket", optional (default="heap")
+        The priority queue of the nodes to visit. "bucket" keeps the nodes
+        in a dict of lists keyed by their integer distance, a bucket queue
+        as in Dial's algorithm, which avoids the tuples and the logarithmic
+        cost of a heap. It requires nonnegative integer edge weights and is
+        fastest for small ones.
+
     Returns
     -------
     distance, path : pair of dictionaries, or numeric and list
@@ -717,7 +744,8 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight")
     Raises
     ------
     ValueError
-        If `sources` is empty.
+        If `sources` is empty, or if `queue` is "bucket" and an edge weight
+        is not a nonnegative integer.
     NodeNotFound
         If any of `sources` is not in `G`.
 
@@ -737,7 +765,7 @@ def multi_source_dijkstra(G, sources, target=None, cutoff=None, weight="weight")
     weight = _weight_function(G, weight)
     paths = {source: [source] for source in sources}  # dictionary of paths
     dist = _dijkstra_multisource(
-        G, sources, weight, paths=paths, cutoff=cutoff, target=target
+        G, sources, weight, paths=paths, cutoff=cutoff, target=target, queue=queue
     )
     if target is None:
         return (dist, paths)
@@ -762,7 +790,7 @@ def _dijkstra(G, source, weight, pred=None, paths=None, cutoff=None, target=None
 
 
 def _dijkstra_multisource(
-    G, sources, weight, pred=None, paths=None, cutoff=None, target=None
+    G, sources, weight, pred=None, paths=None, cutoff=None, target=None, queue="heap"
 ):
     """Uses Dijkstra's algorithm to find shortest weighted paths
 
@@ -795,6 +823,9 @@ def _dijkstra_multisource(
         Length (sum of edge weights) at which the search is stopped.
         If cutoff is provided, only return paths with summed weight <= cutoff.
 
+    queue : "heap" or "bucket", optional (default="heap")
+        The priority queue of the nodes to visit.
+
     Returns
     -------
     distance : dictionary
@@ -806,6 +837,10 @@ def _dijkstra_multisource(
     NodeNotFound
         If any of `sources` is not in `G`.
 
+    ValueError
+        If `queue` is unknown, or if it is "bucket" and an edge weight is
+        not a nonnegative integer.
+
     Notes
     -----
     The optional predecessor and path dictionaries can be accessed by
@@ -813,6 +848,12 @@ def _dijkstra_multisource(
     as arguments. No need to explicitly return pred or paths.
 
     """
+    if queue == "bucket":
+        return _dijkstra_multisource_bucket(
+            G, sources, weight, pred=pred, paths=paths, cutoff=cutoff, target=target
+        )
+    if queue != "heap":
+        raise ValueError(f"Unknown queue {queue!r}, use 'heap' or 'bucket'")
     G_succ = G._succ if G.is_directed() else G._adj
 
     push = heappush
@@ -863,6 +904,80 @@ def _dijkstra_multisource(
     return dist
 
 
+def _dijkstra_multisource_bucket(
+    G, sources, weight, pred=None, paths=None, cutoff=None, target=None
+):
+    """Dijkstra's algorithm with a bucket queue, for integer weights.
+
+    Takes the same arguments as :func:`_dijkstra_multisource`. The nodes to
+    visit are kept in lists keyed by their distance, and the distances are
+    scanned one by one from zero, as in Dial's algorithm [1]_. Nodes whose
+    distance is found to be shorter are added again and skipped later.
+
+    References
+    ----------
+    .. [1] R. B. Dial, "Algorithm 360: Shortest-path forest with topological
+       ordering", Communications of the ACM 12(11), 632-633, 1969.
+    """
+    G_succ = G._succ if G.is_directed() else G._adj
+
+    dist = {}  # dictionary of final distances
+    seen = {}
+    buckets = {0: []}  # lists of nodes keyed by distance
+    for source in sources:
+        seen[source] = 0
+        buckets[0].append(source)
+    pending = len(buckets[0])  # number of nodes in all buckets
+    d = 0
+    while pending:
+        bucket = buckets.pop(d, None)
+        if bucket is None:
+            d += 1
+            continue
+        pending -= len(bucket)
+        for v in bucket:
+            if v in dist:
+                continue  # already searched this node.
+            dist[v] = seen[v]
+            if v == target:
+                return dist
+            for u, e in G_succ[v].items():
+                cost = weight(v, u, e)
+                if cost is None:
+                    continue
+                # checked on every edge, a wrong weight can be passed before
+                # the target is found; integral floats are allowed
+                if cost < 0 or cost % 1:
+                    raise ValueError("Bucket queue needs nonnegative integer weights")
+                vu_dist = dist[v] + cost
+                if cutoff is not None:
+                    if vu_dist > cutoff:
+                        continue
+                if u in dist:
+                    u_dist = dist[u]
+                    if vu_dist < u_dist:
+                        raise ValueError(
+                            "Contradictory paths found:", "negative weights?"
+                        )
+                    elif pred is not None and vu_dist == u_dist:
+                        pred[u].append(v)
+                elif u not in seen or vu_dist < seen[u]:
+                    seen[u] = vu_dist
+                    if vu_dist in buckets:
+                        buckets[vu_dist].append(u)
+                    else:
+                        buckets[vu_dist] = [u]
+                    pending += 1
+                    if paths is not None:
+                        paths[u] = paths[v] + [u]
+                    if pred is not None:
+                        pred[u] = [v]
+                elif vu_dist == seen[u]:
+                    if pred is not None:
+                        pred[u].append(v)
+    return dist
+
+
 def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight="weight"):
     """Compute weighted shortest path length and predecessors.
 
@@ -2226,7 +2341,7 @@ def find_negative_cycle(G, source, weight="weight"):
     raise nx.NetworkXUnbounded(msg)
 
 
-def bidirectional_dijkstra(G, source, target, weight="weight"):
+def bidirectional_dijkstra(G, source, target, weight="weight", queue="heap"):
     r"""Dijkstra's algorithm for shortest paths using bidirectional search.
 
     Parameters
@@ -2252,6 +2367,13 @@ def bidirectional_dijkstra(G, source, target, weight="weight"):
         dictionary of edge attributes for that edge. The function must
         return a number.
 
+    queue : "heap" or "bucket", optional (default="heap")
+        The priority queue of the nodes to visit. "bucket" keeps the nodes
+        in a dict of lists keyed by their integer distance, a bucket queue
+        as in Dial's algorithm, which avoids the tuples and the logarithmic
+        cost of a heap. It requires nonnegative integer edge weights and is
+        fastest for small ones.
+
     Returns
     -------
     length, path : number and list
@@ -2266,6 +2388,10 @@ def bidirectional_dijkstra(G, source, target, weight="weight"):
     NetworkXNoPath
         If no path exists between source and target.
 
+    ValueError
+        If `queue` is "bucket" and an edge weight is not a nonnegative
+        integer.
+
     Examples
     --------
     >>> G = nx.path_graph(5)
@@ -2307,10 +2433,15 @@ def bidirectional_dijkstra(G, source, target, weight="weight"):
         msg = f"Either source {source} or target {target} is not in G"
         raise nx.NodeNotFound(msg)
 
+    if queue not in ("heap", "bucket"):
+        raise ValueError(f"Unknown queue {queue!r}, use 'heap' or 'bucket'")
+
     if source == target:
         return (0, [source])
 
     weight = _weight_function(G, weight)
+    if queue == "bucket":
+        return _bidirectional_dijkstra_bucket(G, source, target, weight)
     push = heappush
     pop = heappop
     # Init:  [Forward, Backward]
@@ -2373,6 +2504,68 @@ def bidirectional_dijkstra(G, source, target, weight="weight"):
     raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
 
 
+def _bidirectional_dijkstra_bucket(G, source, target, weight):
+    """Bidirectional Dijkstra with a bucket queue in each direction.
+
+    Like :func:`_dijkstra_multisource_bucket`, every direction keeps lists
+    of nodes keyed by their integer distance and scans them in order.
+    """
+    dists = [{}, {}]  # dictionary of final distances
+    paths = [{source: [source]}, {target: [target]}]  # dictionary of paths
+    seen = [{source: 0}, {target: 0}]  # dict of distances to seen nodes
+    buckets = [{0: [source]}, {0: [target]}]  # lists of nodes keyed by distance
+    pending = [1, 1]  # number of nodes in the buckets of each direction
+    current = [0, 0]  # distance of the bucket being scanned
+    if G.is_directed():
+        neighs = [G._succ, G._pred]
+    else:
+        neighs = [G._adj, G._adj]
+    finalpath = []
+    dir = 1
+    while pending[0] and pending[1]:
+        dir = 1 - dir
+        fringe = buckets[dir]
+        d = current[dir]
+        while not fringe.get(d):
+            fringe.pop(d, None)
+            d += 1
+        current[dir] = d
+        v = fringe[d].pop()
+        pending[dir] -= 1
+        if v in dists[dir]:
+            continue
+        dists[dir][v] = seen[dir][v]
+        if v in dists[1 - dir]:
+            return (finaldist, finalpath)
+
+        for w, e in neighs[dir][v].items():
+            cost = weight(v, w, e) if dir == 0 else weight(w, v, e)
+            if cost is None:
+                continue
+            if cost < 0 or cost % 1:
+                raise ValueError("Bucket queue needs nonnegative integer weights")
+            vwLength = dists[dir][v] + cost
+            if w in dists[dir]:
+                if vwLength < dists[dir][w]:
+                    raise ValueError("Contradictory paths found: negative weights?")
+            elif w not in seen[dir] or vwLength < seen[dir][w]:
+                seen[dir][w] = vwLength
+                if vwLength in fringe:
+                    fringe[vwLength].append(w)
+                else:
+                    fringe[vwLength] = [w]
+                pending[dir] += 1
+                paths[dir][w] = paths[dir][v] + [w]
+                if w in seen[0] and w in seen[1]:
+                    totaldist = seen[0][w] + seen[1][w]
+                    if finalpath == [] or finaldist > totaldist:
+                        finaldist = totaldist
+                        revpath = paths[1][w][:]
+                        revpath.reverse()
+                        finalpath = paths[0][w] + revpath[1:]
+    raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+
+
 def johnson(G, weight="weight"):
     r"""Uses Johnson's Algorithm to compute shortest paths.
 
@@ -352,6 +352,50 @@ class TestTransitivity:
         assert nx.transitivity(G) == 0.875
 
 
+class TestArrayTriangles:
+    """Whole-graph queries counted with NumPy agree with the node iterators,
+    which are used when `nodes` is given."""
+
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("numpy")
+
+    def _graphs(self, directed):
+        for seed in range(8):
+            G = nx.gnp_random_graph(40, 0.05 * seed, seed=seed, directed=directed)
+            G.add_edges_from([(0, 0), (1, 1)])
+            for i, (u, v, d) in enumerate(G.edges(data=True)):
+                d["weight"] = [2, -1, 0.5, 1, 0, 3.5][i % 6]
+            yield G
+
+    @pytest.mark.parametrize("weight", [None, "weight"])
+    def test_clustering(self, weight):
+        for directed in (False, True):
+            for G in self._graphs(directed):
+                expected = nx.clustering(G, list(G), weight=weight)
+                result = nx.clustering(G, weight=weight)
+                assert list(result) == list(expected)
+                for v in G:
+                    assert result[v] == pytest.approx(expected[v], abs=1e-12)
+
+    def test_triangles(self):
+        for G in self._graphs(False):
+            assert nx.triangles(G) == nx.triangles(G, list(G))
+            H = nx.CSRGraph(G)
+            assert nx.triangles(H) == nx.triangles(G)
+
+    def test_transitivity(self):
+        G = nx.barabasi_albert_graph(100, 3, seed=1)
+        t = nx.triangles(G, list(G))
+        d = dict(G.degree)
+        expected = sum(t.values()) / sum(k * (k - 1) / 2 for k in d.values())
+        assert nx.transitivity(G) == pytest.approx(expected)
+
+    def test_multigraph(self):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.clustering(nx.MultiGraph([(0, 1)]))
+
+
 class TestSquareClustering:
     def test_clustering(self):
         G = nx.Graph()
@@ -1,5 +1,9 @@
+import random
+
+import pytest
+
 import networkx as nx
-from networkx.utils import nodes_equal
+from networkx.utils import edges_equal, nodes_equal
 
 
 class TestCore:
@@ -79,6 +83,9 @@ class TestCore:
         G.add_edges_from(more_edges)
         assert nx.core_number(G) == {1: 3, 2: 3, 3: 3, 4: 3, 5: 3, 6: 3}
 
+    def test_core_number_csrgraph(self):
+        assert nx.core_number(nx.CSRGraph(self.G)) == nx.core_number(self.G)
+
     def test_main_core(self):
         main_core_subgraph = nx.k_core(self.H)
         assert sorted(main_core_subgraph.nodes()) == [2, 4, 5, 6]
@@ -158,6 +165,74 @@ class TestCore:
         k_truss_subgraph = nx.k_truss(self.G, 5)
         assert sorted(k_truss_subgraph.nodes()) == []
 
+    def test_truss_number(self):
+        truss = nx.truss_number(self.G)
+        assert set(truss) == set(self.G.edges)
+        assert truss[(1, 2)] == 4
+        assert truss[(9, 10)] == 3
+        assert truss[(12, 19)] == 2
+        assert nx.truss_number(nx.complete_graph(6)) == dict.fromkeys(
+            nx.complete_graph(6).edges, 6
+        )
+        assert nx.truss_number(nx.empty_graph(3)) == {}
+
+    def test_k_truss_csrgraph(self):
+        pytest.importorskip("numpy")
+        G = self.G.copy()
+        G.graph["name"] = "G"
+        nx.set_edge_attributes(G, 1, "weight")
+        H = nx.CSRGraph(G)
+        for k in range(2, 6):
+            expected = nx.k_truss(G, k)
+            truss = nx.k_truss(H, k)
+            assert type(truss) is nx.Graph
+            assert nodes_equal(truss, expected)
+            assert edges_equal(truss.edges(data=True), expected.edges(data=True))
+            assert truss.graph == {"name": "G"}
+        truss.add_edge(0, 1)
+
+    def test_k_truss_subclass(self):
+        class MyGraph(nx.Graph):
+            pass
+
+        G = MyGraph(self.G)
+        for k in range(2, 6):
+            truss = nx.k_truss(G, k)
+            assert type(truss) is MyGraph
+            assert type(nx.k_core(G, k)) is MyGraph
+            assert edges_equal(truss.edges, nx.k_truss(self.G, k).edges)
+
+    def test_k_truss_truss_number(self):
+        truss = nx.truss_number(self.G)
+        for k in range(-1, 6):
+            H = nx.k_truss(self.G, k, truss_number=truss)
+            assert nodes_equal(H, nx.k_truss(self.G, k))
+            assert edges_equal(H.edges, nx.k_truss(self.G, k).edges)
+
+    def test_truss_number_random(self):
+        # compare with removing the edges in too few triangles one at a time
+        for seed in range(5):
+            G = nx.gnp_random_graph(30, 0.3, seed=seed)
+            truss = nx.truss_number(G)
+            for k in range(3, max(truss.values()) + 2):
+                H = G.copy()
+                weak = True
+                while weak:
+                    weak = [
+                        (u, v)
+                        for u, v in H.edges
+                        if len(H._adj[u].keys() & H._adj[v].keys()) < k - 2
+                    ]
+                    H.remove_edges_from(weak)
+                expected = {frozenset(e) for e in H.edges}
+                assert {frozenset(e) for e, t in truss.items() if t >= k} == expected
+
+    def test_truss_number_self_loops(self):
+        G = nx.cycle_graph(3)
+        G.add_edge(0, 0)
+        with pytest.raises(nx.NetworkXError):
+            nx.truss_number(G)
+
     def test_onion_layers(self):
         layers = nx.onion_layers(self.G)
         nodes_by_layer = [
@@ -169,3 +244,71 @@ class TestCore:
         assert nodes_equal(nodes_by_layer[3], [9, 11])
         assert nodes_equal(nodes_by_layer[4], [1, 2, 4, 5, 6, 8])
         assert nodes_equal(nodes_by_layer[5], [3, 7])
+
+
+class TestCoreMaintainer:
+    def _check(self, maintainer):
+        G = maintainer.G
+        assert maintainer.core_number == nx.core_number(G)
+        # the maintained order is one in which the core decomposition can
+        # remove the nodes
+        core, label = maintainer.core_number, maintainer._label
+        order = sorted(G, key=lambda v: (core[v], label[v]))
+        position = {v: i for i, v in enumerate(order)}
+        for v in G:
+            later = sum(1 for x in G[v] if position[x] > position[v])
+            assert maintainer._deg_plus[v] == later
+            assert later <= maintainer.core_number[v]
+
+    def test_random_updates(self):
+        rng = random.Random(42)
+        for seed in range(10):
+            G = nx.gnp_random_graph(30, 0.05 * (1 + seed % 5), seed=seed)
+            maintainer = nx.CoreMaintainer(G)
+            self._check(maintainer)
+            for _ in range(100):
+                u, v = rng.sample(range(35), 2)
+                if rng.random() < 0.5:
+                    maintainer.add_edges([(u, v)])
+                else:
+                    maintainer.remove_edges([(u, v)])
+                self._check(maintainer)
+
+    def test_relabel(self, monkeypatch):
+        # labels run out of room and are spread again
+        monkeypatch.setattr(nx.algorithms.core, "_LABEL_GAP", 2)
+        rng = random.Random(1)
+        G = nx.barabasi_albert_graph(50, 3, seed=1)
+        maintainer = nx.CoreMaintainer(G)
+        for _ in range(200):
+            u, v = rng.sample(range(50), 2)
+            maintainer.add_edges([(u, v)])
+            maintainer.remove_edges([rng.choice(list(G.edges))])
+        self._check(maintainer)
+
+    def test_batches(self):
+        G = nx.Graph()
+        maintainer = nx.CoreMaintainer(G)
+        maintainer.add_edges(nx.complete_graph(5).edges)
+        assert maintainer.core_number == dict.fromkeys(range(5), 4)
+        maintainer.add_edges([(0, 1, {"weight": 3}), (4, 5)])
+        assert G[0][1]["weight"] == 3
+        assert maintainer.core_number[5] == 1
+        maintainer.remove_edges([(0, 1), (0, 2), (7, 8)])
+        self._check(maintainer)
+        core = maintainer.core_number
+        assert nodes_equal(nx.k_core(G, core_number=core), [1, 2, 3, 4])
+        assert nodes_equal(nx.k_shell(G, 2, core_number=core), [0])
+        assert nodes_equal(nx.k_crust(G, 1, core_number=core), [5])
+
+    def test_not_implemented(self):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.CoreMaintainer(nx.DiGraph())
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.CoreMaintainer(nx.MultiGraph())
+        G = nx.Graph([(0, 0)])
+        with pytest.raises(nx.NetworkXError):
+            nx.CoreMaintainer(G)
+        maintainer = nx.CoreMaintainer(nx.path_graph(3))
+        with pytest.raises(nx.NetworkXError):
+            maintainer.add_edges([(1, 1)])
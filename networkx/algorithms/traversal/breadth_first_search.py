@@ -1,6 +1,7 @@
 """Basic algorithms for breadth-first searching the nodes of a graph."""
 import networkx as nx
 from collections import deque
+from networkx.classes.csrgraph import CSRAdjacency, _csr_bfs_edges
 
 __all__ = [
     "bfs_edges",
@@ -65,13 +66,29 @@ def generic_bfs_edges(G, source, neighbors=None, depth_limit=None, sort_neighbor
     .. _PADS: http://www.ics.uci.edu/~eppstein/PADS/BFS.py
     .. _Depth-limited-search: https://en.wikipedia.org/wiki/Depth-limited_search
     """
+    if neighbors is None:
+        neighbors = G.neighbors
+    if depth_limit is None:
+        depth_limit = len(G)
+    if sort_neighbors is None:
+        # array backed graphs are searched one level at a time
+        if neighbors == G.neighbors:
+            csr = G._adj
+        elif G.is_directed() and neighbors == G.predecessors:
+            csr = G._pred
+        else:
+            csr = None
+        if isinstance(csr, CSRAdjacency) and source in csr:
+            nodes = csr.nodes
+            for parents, children in _csr_bfs_edges(csr, source, depth_limit):
+                for u, v in zip(parents.tolist(), children.tolist()):
+                    yield nodes[u], nodes[v]
+            return
     if callable(sort_neighbors):
         _neighbors = neighbors
         neighbors = lambda node: iter(sort_neighbors(_neighbors(node)))
 
     visited = {source}
-    if depth_limit is None:
-        depth_limit = len(G)
     queue = deque([(source, depth_limit, neighbors(source))])
     while queue:
         parent, depth_now, children = queue[0]
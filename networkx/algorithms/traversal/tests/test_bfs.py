@@ -54,6 +54,21 @@ class TestBFS:
         for distance, descendants in enumerate([{0}, {1}, {2, 3}, {4}]):
             assert nx.descendants_at_distance(self.G, 0, distance) == descendants
 
+    def test_bfs_edges_csr(self):
+        pytest.importorskip("numpy")
+        G = nx.gnp_random_graph(100, 0.05, seed=42)
+        H = nx.CSRGraph(G)
+        for source in (0, 50):
+            assert list(nx.bfs_edges(H, source)) == list(nx.bfs_edges(G, source))
+            edges = nx.bfs_edges(H, source, depth_limit=2)
+            assert list(edges) == list(nx.bfs_edges(G, source, depth_limit=2))
+        D = nx.gnp_random_graph(100, 0.05, seed=42, directed=True)
+        H = nx.CSRDiGraph(D)
+        edges = nx.bfs_edges(H, 0, reverse=True)
+        assert list(edges) == list(nx.bfs_edges(D, 0, reverse=True))
+        edges = nx.bfs_edges(H, 0, sort_neighbors=sorted)
+        assert list(edges) == list(nx.bfs_edges(D, 0, sort_neighbors=sorted))
+
     def test_descendants_at_distance_missing_source(self):
         with pytest.raises(nx.NetworkXError):
             nx.descendants_at_distance(self.G, "abc", 0)
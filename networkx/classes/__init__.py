@@ -2,6 +2,7 @@ from .graph import Graph
 from .digraph import DiGraph
 from .multigraph import MultiGraph
 from .multidigraph import MultiDiGraph
+from .csrgraph import CSRGraph, CSRDiGraph
 from .ordered import *
 
 from .function import *
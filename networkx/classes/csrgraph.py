@@ -0,0 +1,590 @@
+"""Immutable graph classes backed by compressed sparse row (CSR) arrays.
+
+A :class:`CSRGraph` or :class:`CSRDiGraph` is built once from any graph and
+then only read. Nodes are numbered ``0 .. n-1`` in the order of the input
+graph, the neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``
+in increasing order and edge attributes are stored as one array per attribute name instead of
+one dict per edge. The adjacency is exposed through read-only Mappings with
+the same layout as the dict-of-dict-of-dict of :class:`~networkx.Graph`, so
+the algorithms of NetworkX run on these classes unchanged.
+"""
+import copy as _copy
+from bisect import bisect_left
+from collections.abc import ItemsView, Mapping, ValuesView
+
+import networkx as nx
+from networkx.classes.digraph import DiGraph
+from networkx.classes.function import frozen
+from networkx.classes.graph import Graph
+
+__all__ = ["CSRGraph", "CSRDiGraph"]
+
+
+def _index_dtype(size):
+    import numpy as np
+
+    return np.int32 if size < 2**31 else np.int64
+
+
+def _columns(dicts):
+    """Returns {name: (values, present)} arrays for a list of attribute dicts.
+
+    ``present`` is a boolean mask of the dicts that have the attribute, or None
+    if all of them have it. Attributes whose values are all bools, ints or
+    floats are stored in arrays of that type, any other in object arrays.
+    """
+    import numpy as np
+
+    names = {}
+    for d in dicts:
+        for name in d:
+            names.setdefault(name)
+    columns = {}
+    for name in names:
+        present = np.fromiter((name in d for d in dicts), bool, count=len(dicts))
+        types = {type(d[name]) for d in dicts if name in d}
+        values = None
+        for kind, fill in ((bool, False), (int, 0), (float, 0.0)):
+            if types == {kind}:
+                try:
+                    values = np.array([d.get(name, fill) for d in dicts], dtype=kind)
+                except OverflowError:
+                    pass
+        if values is None:
+            values = np.empty(len(dicts), dtype=object)
+            for i, d in enumerate(dicts):
+                values[i] = d.get(name)
+        columns[name] = (values, None if present.all() else present)
+    return columns
+
+
+class _CSRAttrs(Mapping):
+    """Read-only attribute dict of one node or edge, read from columnar arrays."""
+
+    __slots__ = ("_columns", "_id")
+
+    def __init__(self, columns, id):
+        self._columns = columns
+        self._id = id
+
+    def __getitem__(self, name):
+        values, present = self._columns[name]
+        if present is not None and not present[self._id]:
+            raise KeyError(name)
+        value = values[self._id]
+        return value if values.dtype.kind == "O" else value.item()
+
+    def __iter__(self):
+        for name, (values, present) in self._columns.items():
+            if present is None or present[self._id]:
+                yield name
+
+    def __len__(self):
+        return sum(1 for name in self)
+
+    def copy(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return _copy.deepcopy(dict(self), memo)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class _CSRNodeAtlas(Mapping):
+    """Read-only Mapping of node to node attributes."""
+
+    __slots__ = ("_nodes", "_index", "_columns")
+
+    def __init__(self, nodes, index, columns):
+        self._nodes = nodes
+        self._index = index
+        self._columns = columns
+
+    def __getitem__(self, n):
+        return _CSRAttrs(self._columns, self._index[n])
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+
+class _CSRItems(ItemsView):
+    def __iter__(self):
+        return self._mapping._items()
+
+
+class _CSRValues(ValuesView):
+    def __iter__(self):
+        return (d for n, d in self._mapping._items())
+
+
+class _CSRNeighbors(Mapping):
+    """Read-only Mapping of the neighbors of one node to the edge attributes."""
+
+    __slots__ = ("_adj", "_i")
+
+    def __init__(self, adj, i):
+        self._adj = adj
+        self._i = i
+
+    def _find(self, n):
+        adj = self._adj
+        try:
+            j = adj.index[n]
+        except (KeyError, TypeError):
+            return -1
+        start, stop = int(adj.indptr[self._i]), int(adj.indptr[self._i + 1])
+        # the rows are sorted
+        p = bisect_left(adj.indices, j, start, stop)
+        return p if p < stop and adj.indices[p] == j else -1
+
+    def __getitem__(self, n):
+        p = self._find(n)
+        if p < 0:
+            raise KeyError(n)
+        return _CSRAttrs(self._adj.edge_columns, self._adj.edge_index[p])
+
+    def __contains__(self, n):
+        return self._find(n) >= 0
+
+    def __iter__(self):
+        adj = self._adj
+        nodes = adj.nodes
+        start, stop = adj.indptr[self._i], adj.indptr[self._i + 1]
+        return (nodes[j] for j in adj.indices[start:stop].tolist())
+
+    def __len__(self):
+        return int(self._adj.indptr[self._i + 1] - self._adj.indptr[self._i])
+
+    def _items(self):
+        adj = self._adj
+        nodes = adj.nodes
+        columns = adj.edge_columns
+        start, stop = adj.indptr[self._i], adj.indptr[self._i + 1]
+        edges = adj.edge_index[start:stop].tolist()
+        for j, e in zip(adj.indices[start:stop].tolist(), edges):
+            yield nodes[j], _CSRAttrs(columns, e)
+
+    def items(self):
+        return _CSRItems(self)
+
+    def values(self):
+        return _CSRValues(self)
+
+    def copy(self):
+        return {n: d.copy() for n, d in self._items()}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self._items())!r})"
+
+
+class CSRAdjacency(Mapping):
+    """Read-only dict-of-dict-of-dict adjacency stored as CSR arrays.
+
+    Attributes
+    ----------
+    nodes : list
+        The node of every index.
+    index : dict
+        The index of every node.
+    indptr, indices : NumPy arrays
+        The neighbors of node ``nodes[i]`` are ``nodes[j]`` for ``j`` in
+        ``indices[indptr[i]:indptr[i + 1]]``, which is sorted.
+    edge_index : NumPy array
+        The edge id of every entry of ``indices``. Both directions of an
+        undirected edge have the same id.
+    edge_columns : dict
+        ``{name: (values, present)}``, the attribute ``name`` of edge ``e``
+        is ``values[e]`` if ``present`` is None or ``present[e]`` is True.
+    """
+
+    __slots__ = ("nodes", "index", "indptr", "indices", "edge_index", "edge_columns")
+
+    def __init__(self, nodes, index, indptr, indices, edge_index, edge_columns):
+        self.nodes = nodes
+        self.index = index
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_index = edge_index
+        self.edge_columns = edge_columns
+
+    def __getitem__(self, n):
+        return _CSRNeighbors(self, self.index[n])
+
+    def __contains__(self, n):
+        try:
+            return n in self.index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _items(self):
+        return ((n, _CSRNeighbors(self, i)) for i, n in enumerate(self.nodes))
+
+    def items(self):
+        return _CSRItems(self)
+
+    def values(self):
+        return _CSRValues(self)
+
+    def copy(self):
+        return {n: nbrs.copy() for n, nbrs in self._items()}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.nodes)} nodes)"
+
+
+def _csr_arrays(adj, nodes, index, data=False):
+    """Returns indptr, indices and the row of every entry of the adjacency adj.
+
+    Every row of indices is sorted. If `data` is True, also returns the edge
+    data of every entry, in the same order.
+    """
+    import numpy as np
+
+    n_nodes = len(nodes)
+    degree = np.fromiter((len(adj[n]) for n in nodes), dtype=np.int64, count=n_nodes)
+    indptr = np.zeros(n_nodes + 1, dtype=_index_dtype(degree.sum()))
+    np.cumsum(degree, out=indptr[1:])
+    size = int(indptr[-1])
+    indices = np.fromiter(
+        (index[v] for n in nodes for v in adj[n]),
+        dtype=_index_dtype(n_nodes),
+        count=size,
+    )
+    rows = np.repeat(np.arange(n_nodes, dtype=indices.dtype), degree)
+    order = np.lexsort((indices, rows))
+    indices = indices[order]
+    if not data:
+        return indptr, indices, rows
+    dicts = [d for n in nodes for d in adj[n].values()]
+    return indptr, indices, rows, [dicts[p] for p in order.tolist()]
+
+
+def _entry_keys(rows, indices, n_nodes):
+    """Returns a key of every (row, index) entry, increasing for sorted rows"""
+    import numpy as np
+
+    return rows.astype(np.int64) * n_nodes + indices
+
+
+class CSRGraph(Graph):
+    """An immutable undirected graph stored in compressed sparse row arrays.
+
+    A CSRGraph holds the same nodes, edges and attributes as the graph it is
+    built from, with a fraction of the memory of a :class:`Graph`: the
+    adjacency is two integer arrays (int32 when they fit) and every edge
+    attribute is one array over the edges. It implements the read-only part
+    of the :class:`Graph` API (``adj``, ``nodes``, ``edges``, ``degree``,
+    ``neighbors``, subgraph views, ...), so algorithms that do not modify
+    their input run on it unchanged.
+
+    The graph cannot be modified: methods that add or remove nodes and edges
+    raise :exc:`NetworkXError`, and node and edge attribute dicts are
+    read-only. :meth:`copy` returns a mutable :class:`Graph`. So does the
+    class called without data, as algorithms that build their result with
+    ``G.__class__()`` do; use ``CSRGraph([])`` for an empty CSRGraph.
+
+    The neighbors of every node are in the order of the nodes, which can
+    differ from the order of the input graph.
+
+    Parameters
+    ----------
+    incoming_graph_data : input graph (optional, default: None)
+        Any data accepted by :class:`Graph`, usually a NetworkX graph.
+        A directed graph is converted as by ``nx.Graph(G)``.
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    Attributes
+    ----------
+    csr : CSRAdjacency
+        The arrays of the graph (``nodes``, ``index``, ``indptr``,
+        ``indices``, ``edge_index`` and ``edge_columns``).
+
+    See Also
+    --------
+    CSRDiGraph
+    freeze
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> G.add_edge(0, 3, weight=2.5)
+    >>> H = nx.CSRGraph(G)
+    >>> list(H.edges(data="weight", default=1))
+    [(0, 1, 1), (0, 3, 2.5), (1, 2, 1), (2, 3, 1)]
+    >>> H.csr.indptr
+    array([0, 2, 4, 6, 8], dtype=int32)
+    >>> nx.shortest_path_length(H, 0, 3, weight="weight")
+    2.5
+    >>> H.add_edge(1, 3)
+    Traceback (most recent call last):
+    ...
+    networkx.exception.NetworkXError: Frozen graph can't be modified
+    """
+
+    add_node = frozen
+    add_nodes_from = frozen
+    remove_node = frozen
+    remove_nodes_from = frozen
+    add_edge = frozen
+    add_edges_from = frozen
+    add_weighted_edges_from = frozen
+    remove_edge = frozen
+    remove_edges_from = frozen
+    update = frozen
+    clear = frozen
+    clear_edges = frozen
+    frozen = True
+
+    _mutable_class = Graph
+
+    def __new__(cls, incoming_graph_data=None, **attr):
+        if incoming_graph_data is None:
+            return cls._mutable_class(**attr)
+        return super().__new__(cls)
+
+    def __getnewargs__(self):
+        # pickle and copy make the object with __new__, which needs data
+        return ([],)
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        G = incoming_graph_data
+        if (
+            not isinstance(G, Graph)
+            or G.is_multigraph()
+            or G.is_directed() != self.is_directed()
+        ):
+            G = self._mutable_class(G)
+        self.graph = dict(G.graph)
+        self._build(G)
+        self.graph.update(attr)
+
+    def _build(self, G):
+        import numpy as np
+
+        nodes = list(G)
+        n_nodes = len(nodes)
+        index = {n: i for i, n in enumerate(nodes)}
+        self._node = _CSRNodeAtlas(nodes, index, _columns([G._node[n] for n in nodes]))
+        indptr, indices, rows, dicts = _csr_arrays(G._adj, nodes, index, data=True)
+        # an edge is numbered at its entry in the row of its first node, both
+        # directions are matched by position as the data dicts of a view or
+        # of another CSRGraph are made on every access
+        first = rows <= indices
+        edge_index = np.empty(len(indices), dtype=_index_dtype(len(indices)))
+        edge_index[first] = np.arange(np.count_nonzero(first))
+        keys = _entry_keys(rows[first], indices[first], n_nodes)
+        edge_index[~first] = keys.searchsorted(
+            _entry_keys(indices[~first], rows[~first], n_nodes)
+        )
+        edge_dicts = [dicts[p] for p in np.flatnonzero(first).tolist()]
+        self._adj = CSRAdjacency(
+            nodes, index, indptr, indices, edge_index, _columns(edge_dicts)
+        )
+
+    @property
+    def csr(self):
+        """The :class:`CSRAdjacency` with the arrays of the graph."""
+        return self._adj
+
+    def to_directed_class(self):
+        return nx.DiGraph
+
+    def to_undirected_class(self):
+        return nx.Graph
+
+    def copy(self, as_view=False):
+        """Returns a mutable :class:`Graph` copy of the graph, or a view.
+
+        See :meth:`Graph.copy`.
+        """
+        if as_view is True:
+            return nx.graphviews.generic_graph_view(self)
+        G = self._mutable_class()
+        G.graph.update(self.graph)
+        G.add_nodes_from((n, d.copy()) for n, d in self._node.items())
+        G.add_edges_from(
+            (u, v, datadict.copy())
+            for u, nbrs in self._adj.items()
+            for v, datadict in nbrs.items()
+        )
+        return G
+
+
+class CSRDiGraph(CSRGraph, DiGraph):
+    """An immutable directed graph stored in compressed sparse row arrays.
+
+    The out-edges are stored as a :class:`CSRAdjacency` (``csr``) and the
+    in-edges as a second one over the same edge ids (``csr_in``). See
+    :class:`CSRGraph`.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    >>> H = nx.CSRDiGraph(G)
+    >>> list(H.predecessors(0))
+    [2]
+    >>> nx.is_strongly_connected(H)
+    True
+    """
+
+    _mutable_class = DiGraph
+
+    def _build(self, G):
+        import numpy as np
+
+        nodes = list(G)
+        n_nodes = len(nodes)
+        index = {n: i for i, n in enumerate(nodes)}
+        self._node = _CSRNodeAtlas(nodes, index, _columns([G._node[n] for n in nodes]))
+        indptr, indices, rows, dicts = _csr_arrays(G._succ, nodes, index, data=True)
+        columns = _columns(dicts)
+        # the edges are numbered in the order of the out-edges
+        edge_index = np.arange(len(indices), dtype=_index_dtype(len(indices)))
+        self._succ = self._adj = CSRAdjacency(
+            nodes, index, indptr, indices, edge_index, columns
+        )
+        in_indptr, in_indices, in_rows = _csr_arrays(G._pred, nodes, index)
+        in_edge_index = _entry_keys(rows, indices, n_nodes).searchsorted(
+            _entry_keys(in_indices, in_rows, n_nodes)
+        )
+        self._pred = CSRAdjacency(
+            nodes,
+            index,
+            in_indptr,
+            in_indices,
+            in_edge_index.astype(edge_index.dtype),
+            columns,
+        )
+
+    @property
+    def csr_in(self):
+        """The :class:`CSRAdjacency` of the in-edges of the graph."""
+        return self._pred
+
+    def reverse(self, copy=True):
+        """Returns the reverse of the graph, a mutable :class:`DiGraph` if copy.
+
+        See :meth:`DiGraph.reverse`.
+        """
+        if copy:
+            H = self._mutable_class()
+            H.graph.update(_copy.deepcopy(self.graph))
+            H.add_nodes_from((n, _copy.deepcopy(d)) for n, d in self._node.items())
+            H.add_edges_from(
+                (v, u, _copy.deepcopy(d)) for u, v, d in self.edges(data=True)
+            )
+            return H
+        return nx.graphviews.reverse_view(self)
+
+
+def _csr_neighbors(csr, frontier, parents=False):
+    """Returns the concatenated neighbor indices of the node indices in frontier.
+
+    If `parents` is True, also returns the index of the node each neighbor
+    was reached from, as a second array of the same length.
+    """
+    import numpy as np
+
+    starts = csr.indptr[frontier].astype(np.int64)
+    counts = csr.indptr[frontier + 1] - starts
+    ends = np.cumsum(counts)
+    total = ends[-1] if len(ends) else 0
+    offsets = np.repeat(starts - ends + counts, counts) + np.arange(total)
+    if parents:
+        return csr.indices[offsets], np.repeat(frontier, counts)
+    return csr.indices[offsets]
+
+
+def _csr_bfs_levels(csr, sources, cutoff=None):
+    """Yields the sorted arrays of node indices at each level of a BFS.
+
+    The first array holds the indices of `sources`. The search stops after
+    level `cutoff` if it is not None.
+    """
+    import numpy as np
+
+    visited = np.zeros(len(csr.nodes), dtype=bool)
+    frontier = np.unique(np.fromiter((csr.index[s] for s in sources), np.int64))
+    level = 0
+    while len(frontier):
+        visited[frontier] = True
+        yield frontier
+        level += 1
+        if cutoff is not None and level > cutoff:
+            return
+        children = _csr_neighbors(csr, frontier)
+        frontier = np.unique(children[~visited[children]])
+
+
+def _csr_bfs_edges(csr, source, depth_limit):
+    """Yields the (parent, child) index arrays of each level of a BFS.
+
+    Children are in the order of a queue based BFS that scans the neighbors
+    of every node in `indices` order.
+    """
+    import numpy as np
+
+    visited = np.zeros(len(csr.nodes), dtype=bool)
+    frontier = np.array([csr.index[source]])
+    visited[frontier] = True
+    for _ in range(max(depth_limit, 1)):
+        if not len(frontier):
+            return
+        children, parents = _csr_neighbors(csr, frontier, parents=True)
+        unseen = ~visited[children]
+        children, parents = children[unseen], parents[unseen]
+        # keep the first parent of each child, in discovery order
+        first = np.sort(np.unique(children, return_index=True)[1])
+        frontier = children[first]
+        visited[frontier] = True
+        yield parents[first], frontier
+
+
+def _csr_component_labels(csr):
+    """Returns the smallest node index of the component of every node.
+
+    All components are labeled at once: every round takes the minimum label
+    over the neighbors of each node, hooks the old labels to it and then
+    shortcuts the label pointers until they are stable.
+    """
+    import numpy as np
+
+    indptr, indices = csr.indptr, csr.indices
+    labels = np.arange(len(csr.nodes))
+    nonempty = np.flatnonzero(np.diff(indptr))
+    starts = indptr[nonempty]
+    while True:
+        new = labels.copy()
+        if len(nonempty):
+            nbr_min = np.minimum.reduceat(labels[indices], starts)
+            new[nonempty] = np.minimum(new[nonempty], nbr_min)
+        np.minimum.at(new, labels, new)
+        while True:
+            jumped = new[new]
+            if np.array_equal(jumped, new):
+                break
+            new = jumped
+        if np.array_equal(new, labels):
+            return labels
+        labels = new
@@ -0,0 +1,264 @@
+import copy
+import pickle
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import networkx as nx
+from networkx.utils import edges_equal, nodes_equal
+
+
+class TestCSRGraph:
+    def setup_method(self):
+        self.Graph = nx.CSRGraph
+        G = nx.Graph(name="test")
+        G.add_node("a", color="red")
+        G.add_node(1, color="blue", size=3)
+        G.add_edge("a", 1, weight=2.5, label="x")
+        G.add_edge(1, 2, weight=1.0)
+        G.add_edge(2, 2)
+        G.add_edge(2, (3, 4), weight=0.5, big=2**70)
+        self.G = G
+        self.H = self.Graph(G)
+
+    def test_structure(self):
+        G, H = self.G, self.H
+        assert H.is_directed() == G.is_directed()
+        assert list(H) == list(G)
+        assert len(H) == len(G)
+        assert H.number_of_edges() == G.number_of_edges()
+        assert H.graph == {"name": "test"}
+        assert H.name == "test"
+        assert "a" in H and (3, 4) in H
+        assert 5 not in H and [] not in H
+        assert H.has_edge("a", 1) and H.has_edge(2, 2)
+        assert not H.has_edge("a", 2) and not H.has_edge("a", [])
+        for n in G:
+            assert list(H.neighbors(n)) == list(G.neighbors(n))
+            assert H.degree(n) == G.degree(n)
+            assert H.degree(n, weight="weight") == G.degree(n, weight="weight")
+        assert list(H.edges(data=True)) == list(G.edges(data=True))
+        assert list(H.nodes(data=True)) == list(G.nodes(data=True))
+        with pytest.raises(nx.NetworkXError):
+            H.neighbors(5)
+
+    def test_arrays(self):
+        H = self.H
+        csr = H.csr
+        assert csr.indptr.dtype == np.int32
+        assert csr.indices.dtype == np.int32
+        assert csr.indptr.tolist() == [0, 1, 3, 6, 7]
+        assert csr.indices.tolist() == [1, 0, 2, 1, 2, 3, 2]
+        # both directions of an edge share the edge id
+        assert csr.edge_index.tolist() == [0, 0, 1, 1, 2, 3, 3]
+        weights, present = csr.edge_columns["weight"]
+        assert weights.dtype == np.float64
+        assert present.tolist() == [True, True, False, True]
+        big, present = csr.edge_columns["big"]
+        assert big.dtype == object
+        assert H.nodes[1]["size"] == 3
+        assert type(H.nodes[1]["size"]) is int
+        assert type(H["a"][1]["weight"]) is float
+        assert H[2][(3, 4)]["big"] == 2**70
+
+    def test_frozen(self):
+        H = self.H
+        assert nx.is_frozen(H)
+        for method, args in [
+            ("add_node", (5,)),
+            ("add_nodes_from", ([5],)),
+            ("remove_node", (1,)),
+            ("remove_nodes_from", ([1],)),
+            ("add_edge", (1, 5)),
+            ("add_edges_from", ([(1, 5)],)),
+            ("add_weighted_edges_from", ([(1, 5, 1)],)),
+            ("remove_edge", (1, 2)),
+            ("remove_edges_from", ([(1, 2)],)),
+            ("update", (nx.path_graph(2),)),
+            ("clear", ()),
+            ("clear_edges", ()),
+        ]:
+            with pytest.raises(nx.NetworkXError, match="Frozen graph"):
+                getattr(H, method)(*args)
+        with pytest.raises(TypeError):
+            H.nodes["a"]["color"] = "green"
+        with pytest.raises(TypeError):
+            H[1][2]["weight"] = 3
+
+    def test_copy(self):
+        G, H = self.G, self.H
+        C = H.copy()
+        assert type(C) is G.__class__
+        assert nodes_equal(C.nodes(data=True), G.nodes(data=True))
+        assert edges_equal(C.edges(data=True), G.edges(data=True))
+        C.add_edge(1, 5)
+        C[1][2]["weight"] = 7
+        assert not H.has_edge(1, 5)
+        assert H[1][2]["weight"] == 1.0
+        V = H.copy(as_view=True)
+        assert nx.is_frozen(V)
+        assert edges_equal(V.edges(data=True), G.edges(data=True))
+        D = copy.deepcopy(H)
+        assert type(D) is type(H)
+        assert edges_equal(D.edges(data=True), G.edges(data=True))
+
+    def test_pickle(self):
+        G, H = self.G, self.H
+        P = pickle.loads(pickle.dumps(H, -1))
+        assert type(P) is type(H)
+        assert list(P.edges(data=True)) == list(G.edges(data=True))
+        assert list(P.nodes(data=True)) == list(G.nodes(data=True))
+        assert P.graph == H.graph
+
+    def test_views(self):
+        G, H = self.G, self.H
+        S = H.subgraph([1, 2, (3, 4)])
+        GS = G.subgraph([1, 2, (3, 4)])
+        assert edges_equal(S.edges(data=True), GS.edges(data=True))
+        E = H.edge_subgraph([(1, 2)])
+        assert edges_equal(E.edges(), [(1, 2)])
+        T = H.to_directed()
+        assert type(T) is nx.DiGraph
+        assert edges_equal(T.edges(data=True), G.to_directed().edges(data=True))
+
+    def test_algorithms(self):
+        G = nx.les_miserables_graph()
+        H = self.Graph(G)
+        assert nx.shortest_path_length(H, "Valjean", weight="weight") == (
+            nx.shortest_path_length(G, "Valjean", weight="weight")
+        )
+        assert nx.triangles(H) == nx.triangles(G)
+        assert nx.core_number(H) == nx.core_number(G)
+        assert nx.pagerank(H) == pytest.approx(nx.pagerank(G))
+        T = nx.minimum_spanning_tree(H)
+        assert sorted(d["weight"] for u, v, d in T.edges(data=True)) == sorted(
+            d["weight"] for u, v, d in nx.minimum_spanning_tree(G).edges(data=True)
+        )
+        assert nx.community.louvain_communities(
+            H, seed=1
+        ) == nx.community.louvain_communities(G, seed=1)
+        assert edges_equal(nx.k_truss(H, 4).edges, nx.k_truss(G, 4).edges)
+
+    def test_empty(self):
+        H = self.Graph([])
+        assert type(H) is self.Graph
+        assert len(H) == 0
+        assert H.number_of_edges() == 0
+        assert H.csr.indptr.tolist() == [0]
+        # without data, as G.__class__() in algorithms, the class is mutable
+        M = self.Graph(name="empty")
+        assert type(M) is self.G.__class__
+        assert M.graph == {"name": "empty"}
+        M.add_edge(0, 1)
+
+    def test_sorted_rows(self):
+        G = self.G.__class__([(0, 3), (0, 1), (2, 0), (3, 1), (0, 2)])
+        H = self.Graph(G)
+        csr = H.csr
+        for i in range(len(H)):
+            row = csr.indices[csr.indptr[i] : csr.indptr[i + 1]].tolist()
+            assert row == sorted(row)
+        for u in G:
+            for v in G:
+                assert H.has_edge(u, v) == G.has_edge(u, v)
+                assert (v in H[u]) == (v in G[u])
+        assert edges_equal(H.edges(), G.edges())
+
+    def test_csr_input(self):
+        G, H = self.G, self.H
+        for data in (H, H.subgraph(G), self.Graph(H.subgraph([1, 2, (3, 4)]))):
+            C = self.Graph(data)
+            assert edges_equal(C.edges(data=True), data.edges(data=True))
+            assert nodes_equal(C.nodes(data=True), data.nodes(data=True))
+        S = self.Graph(H.subgraph([1, 2, (3, 4)]))
+        assert edges_equal(
+            S.edges(data=True), G.subgraph([1, 2, (3, 4)]).edges(data=True)
+        )
+
+    def test_mutable_results(self):
+        G = nx.les_miserables_graph()
+        if self.Graph.is_directed(self.H):
+            G = G.to_directed()
+        H = self.Graph(G)
+        assert edges_equal(nx.complement(H).edges, nx.complement(G).edges)
+        assert edges_equal(nx.line_graph(H).edges, nx.line_graph(G).edges)
+        R = nx.relabel_nodes(H, {"Valjean": "Jean"})
+        assert "Jean" in R and "Valjean" not in R
+        C = nx.convert_node_labels_to_integers(H)
+        assert edges_equal(C.edges, nx.convert_node_labels_to_integers(G).edges)
+        U = nx.disjoint_union(H, H)
+        assert U.number_of_edges() == 2 * H.number_of_edges()
+        partition = [set(list(G)[:10]), set(list(G)[10:])]
+        Q = nx.quotient_graph(H, partition)
+        assert edges_equal(Q.edges, nx.quotient_graph(G, partition).edges)
+
+    def test_input_conversion(self):
+        H = self.Graph(nx.MultiGraph([(0, 1), (0, 1), (1, 2)]))
+        assert edges_equal(H.edges(), [(0, 1), (1, 2)])
+        H = self.Graph([(0, 1), (1, 2)], name="list")
+        assert edges_equal(H.edges(), [(0, 1), (1, 2)])
+        assert H.graph["name"] == "list"
+
+
+class TestCSRDiGraph(TestCSRGraph):
+    def setup_method(self):
+        self.Graph = nx.CSRDiGraph
+        G = nx.DiGraph(name="test")
+        G.add_node("a", color="red")
+        G.add_node(1, color="blue", size=3)
+        G.add_edge("a", 1, weight=2.5, label="x")
+        G.add_edge(1, 2, weight=1.0)
+        G.add_edge(2, 1)
+        G.add_edge(2, 2)
+        G.add_edge(2, (3, 4), weight=0.5, big=2**70)
+        self.G = G
+        self.H = self.Graph(G)
+
+    def test_structure(self):
+        super().test_structure()
+        G, H = self.G, self.H
+        for n in G:
+            assert list(H.predecessors(n)) == list(G.predecessors(n))
+            assert H.in_degree(n) == G.in_degree(n)
+        assert list(H.in_edges(data=True)) == list(G.in_edges(data=True))
+
+    def test_arrays(self):
+        H = self.H
+        assert H.csr.indptr.tolist() == [0, 1, 2, 5, 5]
+        assert H.csr.indices.tolist() == [1, 2, 1, 2, 3]
+        assert H.csr.edge_index.tolist() == [0, 1, 2, 3, 4]
+        assert H.csr_in.indptr.tolist() == [0, 0, 2, 4, 5]
+        assert H.csr_in.indices.tolist() == [0, 2, 1, 2, 2]
+        assert H.csr_in.edge_index.tolist() == [0, 2, 1, 3, 4]
+        assert H.csr_in.edge_columns is H.csr.edge_columns
+
+    def test_views(self):
+        G, H = self.G, self.H
+        S = H.subgraph([1, 2, (3, 4)])
+        GS = G.subgraph([1, 2, (3, 4)])
+        assert edges_equal(S.edges(data=True), GS.edges(data=True))
+        R = H.reverse()
+        assert type(R) is nx.DiGraph
+        assert edges_equal(R.edges(data=True), G.reverse().edges(data=True))
+        R = H.reverse(copy=False)
+        assert edges_equal(R.edges(data=True), G.reverse().edges(data=True))
+        U = H.to_undirected()
+        assert type(U) is nx.Graph
+        assert edges_equal(U.edges(), G.to_undirected().edges())
+
+    def test_algorithms(self):
+        G = nx.gnp_random_graph(50, 0.1, seed=42, directed=True)
+        H = self.Graph(G)
+        assert nx.shortest_path_length(H, 0) == nx.shortest_path_length(G, 0)
+        assert list(nx.strongly_connected_components(H)) == list(
+            nx.strongly_connected_components(G)
+        )
+        assert nx.pagerank(H) == pytest.approx(nx.pagerank(G))
+
+    def test_input_conversion(self):
+        H = self.Graph(nx.path_graph(3))
+        assert edges_equal(H.edges(), [(0, 1), (1, 0), (1, 2), (2, 1)])
+        U = nx.CSRGraph(nx.DiGraph([(0, 1), (1, 0)]))
+        assert not U.is_directed()
+        assert edges_equal(U.edges(), [(0, 1)])
@@ -317,6 +317,7 @@ needs_numpy = [
     "algorithms/node_classification/__init__.py",
     "algorithms/non_randomness.py",
     "algorithms/shortest_paths/dense.py",
+    "classes/csrgraph.py",
     "linalg/bethehessianmatrix.py",
     "linalg/laplacianmatrix.py",
     "utils/misc.py",
@@ -340,6 +341,7 @@ needs_scipy = [
     "algorithms/node_classification/__init__.py",
     "algorithms/node_classification/hmn.py",
     "algorithms/node_classification/lgc.py",
+    "algorithms/shortest_paths/dense.py",
     "algorithms/similarity.py",
     "convert_matrix.py",
     "drawing/layout.py",
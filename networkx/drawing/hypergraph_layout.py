@@ -3,6 +3,7 @@ import numpy as np
 
 __all__ = [
     "hypergraph",
+    "incidence_matrix",
     "complete_algorithm",
     "cycle_algorithm",
     "star_algorithm",
@@ -16,12 +17,108 @@ class hyperedge:
 
 
 class hypergraph:
+    """Hypergraph with a compressed sparse row incidence index.
+
+    indices[indptr[i]:indptr[i + 1]] are the positions in vertices of the members of hyperedge i,
+    and edge_indices[edge_indptr[j]:edge_indptr[j + 1]] are the hyperedges that vertices[j] belongs to.
+    index maps every vertex to its position in vertices.
+    """
+
     def __init__(self, vertices: list[int], hyperedges: list[hyperedge]):
         self.vertices = np.array(vertices)
         self.hyperedges = np.array(hyperedges)
-
-
-def complete_algorithm(h_graph: hypergraph):
+        self.index = {v: i for i, v in enumerate(self.vertices.tolist())}
+        members = [v for edge in hyperedges for v in edge.vertices.tolist()]
+        for v in members:
+            if v not in self.index:
+                raise nx.NetworkXError(f"The hyperedge vertex {v} is not a vertex of the hypergraph")
+        sizes = [len(edge.vertices) for edge in hyperedges]
+        self.indptr = np.zeros(len(sizes) + 1, dtype=np.intp)
+        np.cumsum(sizes, out=self.indptr[1:])
+        self.indices = np.array([self.index[v] for v in members], dtype=np.intp)
+        # reverse incidence, the same pairs sorted by vertex
+        self.edge_indices = np.repeat(np.arange(len(sizes)), sizes)[np.argsort(self.indices, kind="stable")]
+        self.edge_indptr = np.zeros(len(self.vertices) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self.indices, minlength=len(self.vertices)), out=self.edge_indptr[1:])
+
+    def members(self, i):
+        """Returns the positions in vertices of the members of the i-th hyperedge"""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def incident(self, v):
+        """Returns the indices of the hyperedges that contain the vertex v"""
+        j = self.index[v]
+        return self.edge_indices[self.edge_indptr[j]:self.edge_indptr[j + 1]]
+
+    def degree(self, v):
+        """Returns the number of hyperedges that contain the vertex v"""
+        j = self.index[v]
+        return self.edge_indptr[j + 1] - self.edge_indptr[j]
+
+
+def _members(h_graph: hypergraph):
+    """Returns the vertex indices of all hyperedges concatenated, and the start of each hyperedge in them"""
+    return h_graph.indices, h_graph.indptr
+
+
+def incidence_matrix(h_graph: hypergraph):
+    """Returns the vertices x hyperedges incidence matrix of h_graph as a SciPy CSR array.
+
+    Rows follow the order of h_graph.vertices and columns the order of h_graph.hyperedges.
+    """
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    members, indptr = _members(h_graph)
+    H = sp.sparse.csc_array((np.ones(len(members)), members, indptr),
+                            shape=(len(h_graph.vertices), len(h_graph.hyperedges)))
+    return H.tocsr()
+
+
+def _cycle_pairs(h_graph: hypergraph):
+    """Returns the (row, col) index pairs joining every hyperedge member to the next one, the last to the first"""
+    members, indptr = _members(h_graph)
+    sizes = np.diff(indptr)
+    start = np.repeat(indptr[:-1], sizes)
+    size = np.repeat(sizes, sizes)
+    position = np.arange(len(members)) - start
+    following = members[start + (position + 1) % np.maximum(size, 1)]
+    keep = size > 1
+    return members[keep], following[keep]
+
+
+def _star_pairs(h_graph: hypergraph):
+    """Returns the (row, col) index pairs joining every hyperedge member to the center vertex of its hyperedge"""
+    members, indptr = _members(h_graph)
+    centers = len(h_graph.vertices) + np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return members, centers
+
+
+def _adjacency(rows, cols, n):
+    """Returns the symmetric 0/1 adjacency CSR array of the undirected edges (rows[i], cols[i])"""
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    A = sp.sparse.coo_array((np.ones(2 * len(rows)), (np.concatenate([rows, cols]), np.concatenate([cols, rows]))),
+                            shape=(n, n)).tocsr()
+    A.sum_duplicates()
+    A.data[:] = 1
+    return A
+
+
+def complete_algorithm(h_graph: hypergraph, sparse=False):
+    """Clique expansion, every two vertices of a hyperedge are joined by an edge.
+
+    If sparse is True the adjacency is returned as a SciPy CSR array computed as H @ H.T from the
+    incidence matrix (see incidence_matrix), rows follow the order of h_graph.vertices.
+    """
+    if sparse:
+        H = incidence_matrix(h_graph)
+        A = (H @ H.T).tocsr()
+        A.setdiag(0)
+        A.eliminate_zeros()
+        A.data[:] = 1
+        return A
     g = nx.Graph()
     for v in h_graph.vertices:
         g.add_node(v)
@@ -32,7 +129,14 @@ def complete_algorithm(h_graph: hypergraph):
     return g
 
 
-def cycle_algorithm(h_graph: hypergraph):
+def cycle_algorithm(h_graph: hypergraph, sparse=False):
+    """Cycle expansion, the vertices of every hyperedge are joined in a cycle.
+
+    If sparse is True the adjacency is returned as a SciPy CSR array, rows follow the order of h_graph.vertices.
+    """
+    if sparse:
+        rows, cols = _cycle_pairs(h_graph)
+        return _adjacency(rows, cols, len(h_graph.vertices))
     g = nx.Graph()
     for v in h_graph.vertices:
         g.add_node(v)
@@ -44,7 +148,15 @@ def cycle_algorithm(h_graph: hypergraph):
     return g
 
 
-def star_algorithm(h_graph: hypergraph):
+def star_algorithm(h_graph: hypergraph, sparse=False):
+    """Star expansion, a center vertex is added for every hyperedge and joined to its vertices.
+
+    If sparse is True the adjacency is returned as a SciPy CSR array, rows follow the order of h_graph.vertices
+    followed by the center of every hyperedge.
+    """
+    if sparse:
+        rows, cols = _star_pairs(h_graph)
+        return _adjacency(rows, cols, len(h_graph.vertices) + len(h_graph.hyperedges))
     g = nx.Graph()
     for v in h_graph.vertices:
         g.add_node(v)
@@ -55,7 +167,17 @@ def star_algorithm(h_graph: hypergraph):
     return g
 
 
-def wheel_algorithm(h_graph: hypergraph):
+def wheel_algorithm(h_graph: hypergraph, sparse=False):
+    """Wheel expansion, the star expansion together with the cycle expansion.
+
+    If sparse is True the adjacency is returned as a SciPy CSR array, rows follow the order of h_graph.vertices
+    followed by the center of every hyperedge.
+    """
+    if sparse:
+        star_rows, star_cols = _star_pairs(h_graph)
+        cycle_rows, cycle_cols = _cycle_pairs(h_graph)
+        return _adjacency(np.concatenate([star_rows, cycle_rows]), np.concatenate([star_cols, cycle_cols]),
+                          len(h_graph.vertices) + len(h_graph.hyperedges))
     g = nx.Graph()
     for v in h_graph.vertices:
         g.add_node(v)
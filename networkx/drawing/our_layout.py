@@ -16,23 +16,37 @@ import numpy as np
 from scipy.spatial import ConvexHull
 
 import networkx as nx
-import matplotlib.pyplot as plt
 
 from networkx.drawing import hypergraph_layout
 from networkx.drawing.hypergraph_layout import hyperedge, hypergraph
 
 import logging
 
-# create and configure logger
-
-logging.basicConfig(filename='my_logging.log', level=logging.INFO)
-logger = logging.getLogger()
+# the application configures the handlers, nothing is logged inside the per-vertex loops
+logger = logging.getLogger(__name__)
 
 __all__ = [
     "force_directed_hyper_graphs_using_social_and_gravity_scaling",
-    "force_directed"
+    "force_directed",
+    "force_directed_update",
+    "CentralityMass",
+    "PivotCentralityMass",
+    "hyper_graph_layout",
+    "draw_hyper_graph",
+    "render_hyper_graph",
+    "render_hyper_graphs",
 ]
 
+# number of vertices above which method="auto" switches to the Barnes-Hut approximation
+_BARNES_HUT_MIN_NODES = 2000
+# maximum depth of the Barnes-Hut quadtree
+_BARNES_HUT_MAX_DEPTH = 16
+# offsets of the four children of a quadtree cell
+_QUAD_X = np.array([0, 0, 1, 1])
+_QUAD_Y = np.array([0, 1, 0, 1])
+# number of vertex pairs computed at once by the exact method
+_EXACT_BLOCK_SIZE = 1 << 20
+
 
 def get_points_order(hull):
     order_by = hull.simplices[0]
@@ -50,13 +64,15 @@ def get_points_order(hull):
 
 
 def force_directed(G: nx.Graph, seed: int, iterations: int = 50, threshold=70e-4, centrality=None, gravity: int = 6,
-                   gravity_multiplier: float = 20., dthreshold: float = 3):
+                   gravity_multiplier: float = 20., dthreshold: float = 3, method: str = "auto", theta: float = 0.5,
+                   callback=None, pos=None, temperature=None):
     """
 
     Parameters
     ----------
-    G: nx.Graph
-     for easy calculations and usage of networkx functions
+    G: nx.Graph or SciPy sparse array
+     for easy calculations and usage of networkx functions,
+     a sparse adjacency (such as the sparse=True expansions of hypergraph_layout) is used as is
     seed: int
         Randomize the initial positions of nodes for consistent results
     iterations: int (default=50)
@@ -72,6 +88,22 @@ def force_directed(G: nx.Graph, seed: int, iterations: int = 50, threshold=70e-4
         the multiplier of the gravitational force in the step function
     dthreshold: float (default=3.)
         how much to divide the threshold when reaching the current threshold
+    method: str (default="auto")
+        how to compute the repulsive forces: "exact" computes every pair of vertices in batched blocks,
+        "barnes_hut" approximates far away vertices with a quadtree in O(n log n) per iteration and
+        "auto" uses "barnes_hut" for graphs with more than 2000 vertices and "exact" otherwise
+    theta: float (default=0.5)
+        Barnes-Hut opening criterion, a quadtree cell is approximated by its center of mass when
+        its width is smaller than theta times its distance from the vertex
+    callback: function (default=None)
+        called as callback(iteration, iterations) after every iteration, to report progress.
+        An exception raised by it stops the computation
+    pos: array or dict (default=None)
+        starting positions instead of random ones, an array with a row per node or a dict node -> (x, y).
+        Nodes missing from the dict are placed next to their placed neighbours
+    temperature: float (default=None)
+        the largest step of the first iteration, .1 of the size of the starting positions if None.
+        A small temperature keeps a given pos almost unchanged
 
     Returns
     -------
@@ -83,37 +115,57 @@ def force_directed(G: nx.Graph, seed: int, iterations: int = 50, threshold=70e-4
     >>> pos = force_directed(g, 1, iterations=1000)
     """
     import numpy as np
-    A = nx.to_numpy_array(G)
-    k = math.sqrt(1 / len(A))
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    if sp.sparse.issparse(G):
+        A = sp.sparse.csr_array(G)
+    else:
+        A = nx.to_scipy_sparse_array(G, format="csr")
+    n = A.shape[0]
+    if method == "auto":
+        method = "barnes_hut" if n > _BARNES_HUT_MIN_NODES else "exact"
+    if method == "exact":
+        def displacement(pos, k):
+            return _displacement_exact(pos, A, k)
+    elif method == "barnes_hut":
+        edges = A.tocoo()
+        row, col, weight = edges.row, edges.col, edges.data
+
+        def displacement(pos, k):
+            return (_repulsion_barnes_hut(pos, k, theta) + _attraction(pos, row, col, weight, k)).T
+    else:
+        raise ValueError(f"Unknown repulsion method: {method}")
+    k = math.sqrt(1 / n)
     if seed is not None:
         logger.info(f"Seed for random position was given: {seed}")
         np.random.seed(seed)
     else:
         logger.info(f"No seed for random position was given")
-    logger.info(f"Generating random starting position")
-    pos = np.asarray(np.random.rand(len(A), 2))
-    logger.info(f'{pos}')
-    I = np.zeros(shape=(2, len(A)), dtype=float)
+    if pos is None:
+        logger.info(f"Generating random starting position")
+        pos = np.asarray(np.random.rand(n, 2))
+    else:
+        pos = _initial_positions(A, range(n) if sp.sparse.issparse(G) else list(G), pos, k)
+    logger.debug('starting positions: %s', pos)
     # the initial "temperature"  is about .1 of domain area (=1x1)
     # this is the largest step allowed in the dynamics.
-    t = max(max(pos.T[0]) - min(pos.T[0]), max(pos.T[1]) - min(pos.T[1])) * 0.1
+    if temperature is None:
+        t = max(max(pos.T[0]) - min(pos.T[0]), max(pos.T[1]) - min(pos.T[1])) * 0.1
+    else:
+        t = temperature
     # simple cooling scheme.
     # linearly step down by dt on each iteration so last iteration is size dt.
     dt = t / float(iterations + 1)
     gamma_t = 0
-    mass = get_mass(G, centrality)
+    mass = np.asarray(get_mass(G, centrality), dtype=float)
 
     center = (np.sum(pos, axis=0) / len(pos))
     logger.info(f'Starting iterations: {iterations}, or until gravity force is {gravity * 20}')
     for iteration in range(iterations):
-        I *= 0
-        for v in range(len(A)):
-            delta = (pos[v] - pos).T
-            distance = np.sqrt((delta ** 2).sum(axis=0))
-            distance = np.where(distance < 0.01, 0.01, distance)
-            Ai = A[v]
-            # displacement "force"
-            I[:, v] += calculate_position_change_for_vertice(Ai, center, delta, distance, gamma_t, k, mass, pos, v)
+        # displacement "force"
+        I = displacement(pos, k)
+        I += gamma_t * mass * (center - pos).T
         length = np.sqrt((I ** 2).sum(axis=0))
         length = np.where(length < 0.01, 0.1, length)
         delta_pos = (I * t / length).T
@@ -123,46 +175,240 @@ def force_directed(G: nx.Graph, seed: int, iterations: int = 50, threshold=70e-4
 
         if gamma_t > gravity * gravity_multiplier:
             break
-        if (np.linalg.norm(delta_pos) / len(A)) < threshold:
+        if (np.linalg.norm(delta_pos) / n) < threshold:
             threshold /= dthreshold
             gamma_t += gravity * round(iteration / 200)
             logger.info(f'threshold reached upping gravity force to: {gamma_t}')
+        if callback is not None:
+            callback(iteration, iterations)
         iteration += 1
     logger.info(f'finished calculating positions of graph')
     return pos
 
 
-def calculate_position_change_for_vertice(Ai, center, delta, distance, gamma_t, k, mass, pos, v):
+def force_directed_update(G: nx.Graph, pos, changed=(), seed=None, iterations: int = 20, temperature: float = 0.01,
+                          **kwargs):
+    """Updates a force_directed layout after a small change of G instead of starting over.
+
+    Parameters
+    ----------
+    G: nx.Graph or SciPy sparse array
+        the changed graph
+    pos: dict
+        the previous positions, node -> (x, y), for a sparse adjacency the nodes are the row indices
+    changed: iterable (default=())
+        nodes whose previous position is not kept, like the vertices of an added or removed hyperedge.
+        They are placed next to their neighbours, as the nodes that are not in pos
+    seed: int
+        for the small random shifts of the placed nodes
+    iterations: int (default=20)
+        maximum number of iterations, a fraction of the ones needed from random positions
+    temperature: float (default=0.01)
+        the largest step of the first iteration
+    kwargs:
+        the other parameters of force_directed
+
+    Returns
+    -------
+    pos : list[float]
+        List with the positions of all of the nodes
+
+    Example
+    >>> g = nx.random_tree(70, 1)
+    >>> pos = dict(zip(g, force_directed(g, 1, iterations=1000)))
+    >>> g.add_edge(3, 70)
+    >>> pos = force_directed_update(g, pos, changed=[3], seed=1)
+    """
+    changed = set(changed)
+    pos = {v: xy for v, xy in pos.items() if v not in changed}
+    return force_directed(G, seed, iterations=iterations, pos=pos, temperature=temperature, **kwargs)
+
+
+def _initial_positions(A, nodes, pos, k):
+    """
+
+    Parameters
+    ----------
+    A: sparse matrix
+        adjacency's matrix of the graph in CSR format
+    nodes:
+        the node of every row of A
+    pos: array or dict
+        positions of some of the nodes
+    k: float
+        area and minimum distance between two nodes
+
+    Returns
+    -------
+    the starting positions of all the nodes. A node without a position is placed at the mean of its placed
+    neighbours moved by at most k / 10, repeatedly so that chains of new nodes are placed as well.
+    Nodes with no placed node in their component get random positions in the box of the placed ones
+    """
+    if not isinstance(pos, dict):
+        return np.array(pos, dtype=float)
+    n = A.shape[0]
+    result = np.zeros((n, 2))
+    placed = np.zeros(n, dtype=bool)
+    for i, v in enumerate(nodes):
+        if v in pos:
+            result[i] = pos[v]
+            placed[i] = True
+    if not placed.any():
+        return np.random.rand(n, 2)
+    connected = (A != 0).astype(float)
+    while not placed.all():
+        missing = np.flatnonzero(~placed)
+        neighbours = connected[missing][:, placed]
+        count = np.asarray(neighbours.sum(axis=1)).ravel()
+        found = count > 0
+        if not found.any():
+            break
+        mean = (neighbours @ result[placed])[found] / count[found, None]
+        result[missing[found]] = mean + (np.random.rand(found.sum(), 2) - 0.5) * (k / 5)
+        placed[missing[found]] = True
+    lo = result[placed].min(axis=0)
+    hi = result[placed].max(axis=0)
+    result[~placed] = lo + np.random.rand((~placed).sum(), 2) * (hi - lo)
+    return result
+
+
+def _displacement_exact(pos, A, k):
+    """
+
+    Parameters
+    ----------
+    pos: matrix
+        positions of all the vertices
+    A: sparse matrix
+        adjacency's matrix of the graph in CSR format
+    k: float
+        area and minimum distance between two nodes
+
+    Returns
+    -------
+    the repulsion and attraction displacement of every vertex, shape (2, n).
+    All pairs are computed in blocks of vertices at once, only a block of rows of A is made dense at a time
+    """
+    n = len(pos)
+    I = np.empty(shape=(2, n), dtype=float)
+    step = max(1, _EXACT_BLOCK_SIZE // n)
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        dx = pos[start:stop, 0, None] - pos[None, :, 0]
+        dy = pos[start:stop, 1, None] - pos[None, :, 1]
+        distance = np.sqrt(dx ** 2 + dy ** 2)
+        distance = np.where(distance < 0.01, 0.01, distance)
+        force = k * k / distance ** 2 - A[start:stop].toarray() * distance / k
+        # cumsum adds the pairs left to right, the same order as summing vertex by vertex
+        I[0, start:stop] = (dx * force).cumsum(axis=1)[:, -1]
+        I[1, start:stop] = (dy * force).cumsum(axis=1)[:, -1]
+    return I
+
+
+def _attraction(pos, row, col, weight, k):
+    """
+
+    Parameters
+    ----------
+    pos: matrix
+        positions of all the vertices
+    row, col, weight:
+        sparse edge list, both directions of every undirected edge are present
+    k: float
+        area and minimum distance between two nodes
+
+    Returns
+    -------
+    the attraction part of the displacement of every vertex, computed only along the edges
+    """
+    delta = pos[row] - pos[col]
+    distance = np.sqrt((delta ** 2).sum(axis=1))
+    distance = np.where(distance < 0.01, 0.01, distance)
+    force = delta * (weight * distance / k)[:, None]
+    disp = np.empty_like(pos)
+    disp[:, 0] = -np.bincount(row, force[:, 0], minlength=len(pos))
+    disp[:, 1] = -np.bincount(row, force[:, 1], minlength=len(pos))
+    return disp
+
+
+def _repulsion_barnes_hut(pos, k, theta=0.5):
     """
 
     Parameters
     ----------
-    Ai: matrix
-        adjacency's matrix for node v
-    center:
-        the position of the relative center
-
-    delta:
-        matrix of the vector from v to all other vertices
-    distance: matrix
-        normalized distance from v to all other nodes in graph
-    gamma_t: float
-        the gravity force
+    pos: matrix
+        positions of all the vertices
     k: float
         area and minimum distance between two nodes
-    mass:
-        the mass/centrality of v
-    pos
-    v: int
-    id of v
+    theta: float
+        a cell is approximated by its center of mass when its width is smaller than theta times its distance
 
     Returns
     -------
-    the calculations of the change in position
+    the Barnes-Hut approximation of the repulsion part of the displacement of every vertex.
+    The quadtree is stored level by level as sorted cell keys, and the tree is walked for all the
+    vertices at once, one level at a time, so every step is a batched NumPy operation.
     """
-    return (
-                   delta * (k * k / distance ** 2 - Ai * distance / k)
-           ).sum(axis=1) + gamma_t * mass[v] * (center - pos[v])
+    n = len(pos)
+    lo = pos.min(axis=0)
+    size = (pos.max(axis=0) - lo).max()
+    if size == 0:
+        size = 1.
+    unit = (pos - lo) / size
+    max_depth = max(1, min(_BARNES_HUT_MAX_DEPTH, math.ceil(math.log(n, 4))))
+
+    levels = []
+    for level in range(max_depth + 1):
+        side = 1 << level
+        cell = np.minimum((unit * side).astype(np.int64), side - 1)
+        keys, inverse, count = np.unique(cell[:, 0] * side + cell[:, 1], return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        com = np.empty((len(keys), 2))
+        com[:, 0] = np.bincount(inverse, pos[:, 0], minlength=len(keys)) / count
+        com[:, 1] = np.bincount(inverse, pos[:, 1], minlength=len(keys)) / count
+        levels.append((keys, inverse, count, com))
+
+    disp = np.zeros_like(pos)
+
+    def accumulate(vertices, delta, weight):
+        distance = np.sqrt((delta ** 2).sum(axis=1))
+        distance = np.where(distance < 0.01, 0.01, distance)
+        force = delta * (weight * k * k / distance ** 2)[:, None]
+        disp[:, 0] += np.bincount(vertices, force[:, 0], minlength=n)
+        disp[:, 1] += np.bincount(vertices, force[:, 1], minlength=n)
+
+    # pairs of (vertex, cell) still to be opened, every vertex starts at the root
+    vertices = np.arange(n)
+    cells = np.zeros(n, dtype=np.intp)
+    for level in range(max_depth + 1):
+        keys, inverse, count, com = levels[level]
+        delta = pos[vertices] - com[cells]
+        distance = np.sqrt((delta ** 2).sum(axis=1))
+        # a cell holding a single vertex is that vertex, so it never has to be opened
+        far = ((size / (1 << level) < theta * distance) | (count[cells] == 1)) & (inverse[vertices] != cells)
+        accumulate(vertices[far], delta[far], count[cells[far]])
+        vertices, cells = vertices[~far], cells[~far]
+        if level == max_depth:
+            break
+        side = 1 << level
+        x, y = np.divmod(keys[cells], side)
+        children = (2 * x[:, None] + _QUAD_X) * (2 * side) + (2 * y[:, None] + _QUAD_Y)
+        next_keys = levels[level + 1][0]
+        index = np.minimum(np.searchsorted(next_keys, children), len(next_keys) - 1)
+        exists = next_keys[index] == children
+        vertices = np.broadcast_to(vertices[:, None], children.shape)[exists]
+        cells = index[exists]
+
+    # the cells left at the deepest level are too close, so they are computed vertex by vertex
+    keys, inverse, count, com = levels[max_depth]
+    members = np.argsort(inverse, kind="stable")
+    start = np.cumsum(count) - count
+    repeat = count[cells]
+    offset = np.arange(repeat.sum()) - np.repeat(np.cumsum(repeat) - repeat, repeat)
+    others = members[np.repeat(start[cells], repeat) + offset]
+    vertices = np.repeat(vertices, repeat)
+    accumulate(vertices, pos[vertices] - pos[others], 1.)
+    return disp
 
 
 def get_mass(G, centrality):
@@ -170,17 +416,26 @@ def get_mass(G, centrality):
 
     Parameters
     ----------
-    G: nx.Graph
+    G: nx.Graph or SciPy sparse array
         the graph to run the centrality algorithm on
     centrality:
         nx function about what kind of centrality to use
-        nx.closeness_centrality, nx.degree_centrality, nx.betweenness_centrality
+        nx.closeness_centrality, nx.degree_centrality, nx.betweenness_centrality,
+        or a mass provider (CentralityMass, PivotCentralityMass)
 
     Returns
     -------
     mass: np.array
         returns an array with the values of the centrality
     """
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    if isinstance(centrality, CentralityMass):
+        A = sp.sparse.csr_array(G) if sp.sparse.issparse(G) else nx.to_scipy_sparse_array(G, format="csr")
+        return centrality.mass(A)
+    if sp.sparse.issparse(G):
+        return _sparse_mass(sp.sparse.csr_array(G), centrality)
     if centrality is None:
         logger.info(
             f"No Centrality type to classify mass was given, therefore the algorithm will use nx.closeness_centrality")
@@ -192,6 +447,214 @@ def get_mass(G, centrality):
     return mass
 
 
+def _sparse_mass(A, centrality):
+    """
+
+    Parameters
+    ----------
+    A: sparse matrix
+        symmetric adjacency's matrix of an undirected graph in CSR format
+    centrality:
+        nx function about what kind of centrality to use
+
+    Returns
+    -------
+    mass: np.array
+        the values of the centrality in the order of the rows of A.
+        Closeness and degree centrality are computed from A directly with the same formulas as networkx,
+        any other centrality is computed on a graph built from A
+    """
+    import scipy as sp
+    import scipy.sparse.csgraph  # call as sp.sparse.csgraph
+
+    n = A.shape[0]
+    if centrality is nx.degree_centrality:
+        if n <= 1:
+            return np.ones(n)
+        # a self loop adds two to the degree
+        degree = np.diff(A.indptr) + (A.diagonal() != 0)
+        return degree * (1 / (n - 1.0))
+    if centrality is not None and centrality is not nx.closeness_centrality:
+        return np.asarray(list(centrality(nx.from_scipy_sparse_array(A)).values()), dtype=float)
+    mass = np.zeros(n)
+    if n <= 1:
+        return mass
+    step = max(1, _EXACT_BLOCK_SIZE // n)
+    for start in range(0, n, step):
+        distance = sp.sparse.csgraph.shortest_path(A, unweighted=True, indices=np.arange(start, min(start + step, n)))
+        reachable = np.isfinite(distance)
+        totsp = np.where(reachable, distance, 0).sum(axis=1)
+        found = (reachable.sum(axis=1) - 1.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            closeness = np.where(totsp > 0, found / totsp, 0.0)
+        mass[start:start + step] = closeness * (found / (n - 1))
+    return mass
+
+
+class CentralityMass:
+    """Mass provider that computes the mass of the vertices from a centrality and reuses it
+    as long as the graph is not changed.
+
+    It can be given as the centrality of force_directed and of the hypergraph layouts,
+    and called as centrality(G) like the networkx centrality functions.
+
+    Parameters
+    ----------
+    centrality: nx function (default=None)
+        the centrality, nx.closeness_centrality if None
+
+    Attributes
+    ----------
+    error_bound: float
+        the error bound of the last computed mass, 0 for exact centralities
+
+    Example
+    >>> mass = CentralityMass(nx.closeness_centrality)
+    >>> g = nx.random_tree(70, 1)
+    >>> pos = force_directed(g, 1, centrality=mass)
+    >>> pos = force_directed_update(g, dict(zip(g, pos)), centrality=mass)  # closeness is not computed again
+    """
+
+    def __init__(self, centrality=None):
+        self.centrality = centrality
+        self.error_bound = 0.
+        self._key = None
+        self._mass = None
+
+    def __call__(self, G):
+        import scipy as sp
+        import scipy.sparse  # call as sp.sparse
+
+        if sp.sparse.issparse(G):
+            A = sp.sparse.csr_array(G)
+            nodes = range(A.shape[0])
+        else:
+            A = nx.to_scipy_sparse_array(G, format="csr")
+            nodes = G
+        return dict(zip(nodes, self.mass(A)))
+
+    def mass(self, A):
+        """Returns the mass of the rows of the CSR adjacency A, computed again only if A changed"""
+        import hashlib
+
+        h = hashlib.sha256()
+        for array in (A.indptr, A.indices, A.data):
+            h.update(array.tobytes())
+        key = (A.shape, h.hexdigest())
+        if key != self._key:
+            logger.info('computing mass with %s', self)
+            self._mass = self._compute(A)
+            self._key = key
+        return self._mass
+
+    def _compute(self, A):
+        return _sparse_mass(A, self.centrality)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.centrality})"
+
+
+class PivotCentralityMass(CentralityMass):
+    """Mass provider that estimates closeness or betweenness centrality from breadth first searches
+    from k random pivots instead of from every vertex.
+
+    Closeness uses the estimator of Eppstein and Wang [1]_: the sum of the distances of a vertex to the
+    others is estimated from its distances to the pivots in its component. With k pivots the estimated
+    average distance a of every vertex is within delta = sqrt(log(n) / k) times the diameter of the exact
+    one with high probability, the diameter being bounded by twice the largest distance from a pivot.
+    The mass of a vertex in a component of size s is (s - 1) / (n - 1) / a, and the exact average distance
+    is at least 1 and at least a - delta, so error_bound = max (s - 1) / (n - 1) * delta / (a * max(1, a - delta))
+    bounds the error of the mass of every vertex with the same probability. The vertices of components without
+    a pivot are computed exactly.
+
+    Betweenness uses the pivots of nx.betweenness_centrality [2]_. By Hoeffding's inequality, with probability
+    at least 1 - 1 / n every normalized betweenness is within error_bound = sqrt(log(2 n^2) / (2 k)) of the
+    exact one.
+
+    Parameters
+    ----------
+    kind: str (default="closeness")
+        "closeness" or "betweenness"
+    k: int (default=None)
+        number of pivots, ceil(log(n) / epsilon^2) if None. The centrality is exact when k >= n
+    epsilon: float (default=0.1)
+        relative error used to choose k
+    seed: int (default=None)
+        seed of the choice of the pivots
+
+    References
+    ----------
+    .. [1] David Eppstein and Joseph Wang:
+       Fast Approximation of Centrality.
+       Journal of Graph Algorithms and Applications 8(1) (2004) 39-45.
+    .. [2] Ulrik Brandes and Christian Pich:
+       Centrality Estimation in Large Networks.
+       International Journal of Bifurcation and Chaos 17(7) (2007) 2303-2318.
+
+    Example
+    >>> g = nx.random_tree(500, 1)
+    >>> mass = PivotCentralityMass(k=50, seed=1)
+    >>> pos = force_directed(g, 1, iterations=10, centrality=mass)
+    >>> bound = mass.error_bound
+    """
+
+    def __init__(self, kind="closeness", k=None, epsilon=0.1, seed=None):
+        if kind not in ("closeness", "betweenness"):
+            raise ValueError(f"Unknown centrality kind: {kind}")
+        super().__init__(nx.closeness_centrality if kind == "closeness" else nx.betweenness_centrality)
+        self.kind = kind
+        self.k = k
+        self.epsilon = epsilon
+        self.seed = seed
+
+    def _compute(self, A):
+        import scipy as sp
+        import scipy.sparse.csgraph  # call as sp.sparse.csgraph
+
+        n = A.shape[0]
+        k = self.k if self.k is not None else math.ceil(math.log(max(n, 2)) / self.epsilon ** 2)
+        if k >= n:
+            self.error_bound = 0.
+            return _sparse_mass(A, self.centrality)
+        if self.kind == "betweenness":
+            self.error_bound = math.sqrt(math.log(2 * n ** 2) / (2 * k))
+            mass = nx.betweenness_centrality(nx.from_scipy_sparse_array(A), k=k, seed=self.seed)
+            return np.asarray(list(mass.values()), dtype=float)
+
+        pivots = np.random.default_rng(self.seed).choice(n, size=k, replace=False)
+        distance = sp.sparse.csgraph.shortest_path(A, unweighted=True, indices=pivots)
+        reachable = np.isfinite(distance)
+        count = reachable.sum(axis=0)
+        _, labels = sp.sparse.csgraph.connected_components(A, directed=False)
+        size = np.bincount(labels)[labels]
+        # a pivot of the component of v is a uniform sample of it, so size * mean distance estimates the sum
+        with np.errstate(divide="ignore", invalid="ignore"):
+            totsp = size * np.where(reachable, distance, 0).sum(axis=0) / count
+            mass = np.where(totsp > 0, (size - 1.0) / totsp, 0.0) * ((size - 1.0) / (n - 1))
+        delta = math.sqrt(math.log(n) / k) * 2 * np.where(reachable, distance, 0).max()
+        estimated = (count > 0) & (size > 1)
+        average = totsp[estimated] / (size[estimated] - 1.0)
+        # the exact mass is at most top, so the error is also at most max(mass, top)
+        top = (size[estimated] - 1.0) / (n - 1)
+        with np.errstate(divide="ignore"):
+            error = np.minimum(top * delta / (average * np.maximum(1., average - delta)),
+                               np.maximum(mass[estimated], top))
+        self.error_bound = error.max(initial=0.)
+        missed = np.flatnonzero(count == 0)
+        if len(missed):
+            # components without pivots are computed exactly
+            distance_missed = sp.sparse.csgraph.shortest_path(A, unweighted=True, indices=missed)
+            reachable_missed = np.isfinite(distance_missed)
+            totsp = np.where(reachable_missed, distance_missed, 0).sum(axis=1)
+            found = reachable_missed.sum(axis=1) - 1.0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mass[missed] = np.where(totsp > 0, found / totsp, 0.0) * (found / (n - 1))
+        return mass
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.kind!r}, k={self.k}, epsilon={self.epsilon}, seed={self.seed})"
+
+
 def in_hull(point, hull, tolerance=1e-12):
     """
        Parameters
@@ -208,7 +671,6 @@ def in_hull(point, hull, tolerance=1e-12):
        mass: bool
             if the point inside the convex hull- True, otherwise- False
        """
-    logger.info("This function checks if a given point is in a given convex hull")
     # taken from
     # https://stackoverflow.com/questions/16750618/whats-an-efficient-way-to-find-if-a-point-lies-in-the-convex-hull-of-a-point-cl
     # In words, a point is in the hull if and only if for every equation (describing the facets) the dot product between
@@ -218,7 +680,7 @@ def in_hull(point, hull, tolerance=1e-12):
         for eq in hull.equations)
 
 
-def convex_pos(hull, proportion=400):
+def convex_pos(hull, proportion=400, width=None):
     """
        Parameters
        ----------
@@ -227,24 +689,24 @@ def convex_pos(hull, proportion=400):
        proportion:
            The parameter that determines how much to divide the canvas
            (to get the distance from the real position of the point to its new position)
+       width:
+           width of the canvas in inches, the default figure width of matplotlib if None
        Returns
        -------
        hull:
            the hull with the new positions
        """
-    logger.info("This function computes a new point outside the convex hull to circle the convex hull")
+    if width is None:
+        import matplotlib as mpl
+
+        width = mpl.rcParams["figure.figsize"][0]
     tmp_pos = []
     center = np.divide(np.sum(hull.points, axis=0), len(hull.points))
+    dist = width / proportion
     for x in hull.points:
-        logger.info("computing linear equation from convex point to the center of the convex")
         m = (x[1] - center[1]) / (x[0] - center[0])
         b = center[1] - m * center[0]
-        logger.info("computing a point which has proportional"
-                    " distance from the given point and is on the linear equation")
-
-        dist = plt.gcf().get_size_inches()[0] / proportion
         x0 = x[0] - dist * (math.sqrt(1 / (1 + m ** 2)))
-        logger.info("adding the point which is *not* inside the convex hull")
         if not in_hull((x0, m * x0 + b), hull):
             tmp_pos.append((x0, m * x0 + b))
         else:
@@ -270,7 +732,6 @@ def angle_between(x0, x1, y0, y1):
          int:
              degree between 2 points
          """
-    logger.info("This function returns the angle between 2 points")
     xDiff = x1 - x0
     yDiff = y1 - y0
     return math.degrees(math.atan2(yDiff, xDiff))
@@ -287,7 +748,6 @@ def random_color(brightness_threshold=0.2):
        int:
            random color (with RBG values > brightness_threshold)
        """
-    logger.info("This function returns a random not too bright color")
     import random
     red = random.random()
     green = random.random()
@@ -311,6 +771,9 @@ def force_directed_hyper_graphs_using_social_and_gravity_scaling(G: hypergraph_l
 
     After running the algorithm the pos will be updated to reflect the social and force-directed values of the nodes.
 
+    The positions are computed by hyper_graph_layout and drawn by draw_hyper_graph on a new pyplot figure,
+    use render_hyper_graph or render_hyper_graphs to draw without pyplot.
+
 
     Parameters
     ----------
@@ -329,7 +792,8 @@ def force_directed_hyper_graphs_using_social_and_gravity_scaling(G: hypergraph_l
         Centrality type for the Social gravity field used in the algorithm.
 
     graph_type: int optional (default=0)
-        Graph type for choosing type of conversion from hyper-graph to graph (cycle/wheel/star/complete)
+        Graph type for choosing type of conversion from hyper-graph to graph (cycle/wheel/star/complete),
+        it is called with sparse=True and must return the adjacency as a SciPy sparse array
 
     gravity: int optional (default=6)
         is responsible for the amount of gravity for the pos generation
@@ -373,44 +837,76 @@ def force_directed_hyper_graphs_using_social_and_gravity_scaling(G: hypergraph_l
 
     """
     import matplotlib.pyplot as plt
-    from scipy.spatial import ConvexHull
-    from scipy.interpolate import splprep
-    from scipy.interpolate import splev
-    from matplotlib.patches import Ellipse
-    import math
 
+    pos = hyper_graph_layout(G, iterations=iterations, threshold=threshold, centrality=centrality,
+                             graph_type=graph_type, gravity=gravity, seed=seed)
+    figure, ax = plt.subplots()
+    draw_hyper_graph(G, pos, ax, title=title)
+    plt.show()
+    if fig:
+        return figure
+    return pos
+
+
+def hyper_graph_layout(G: hypergraph_layout.hypergraph, iterations=50, threshold=70e-4, centrality=None,
+                       graph_type=None, gravity=6, seed=None, callback=None):
+    """Computes the positions of force_directed_hyper_graphs_using_social_and_gravity_scaling without drawing them.
+
+    Parameters
+    ----------
+    G : hypergraph
+    iterations, threshold, centrality, graph_type, gravity, seed:
+        see force_directed_hyper_graphs_using_social_and_gravity_scaling
+    callback: function (default=None)
+        progress callback, see force_directed
+
+    Returns
+    -------
+    pos : np.array
+        the positions of G.vertices, the centers added by the star and wheel expansions are removed
+    """
     if graph_type is None:
         graph_type = hypergraph_layout.complete_algorithm
-    logger.info(f'graph type to convert hyper-graph to: {graph_type}')
-    g: nx.Graph = graph_type(G)
-    logger.info(f'generated graph:'
-                f'nodes: {g.nodes}'
-                f'edges: {g.edges}')
+    logger.info('graph type to convert hyper-graph to: %s', graph_type)
+    # the expansion is built directly as a sparse adjacency, no nx.Graph is needed for the layout
+    g = graph_type(G, sparse=True)
+    logger.info('generated graph: nodes: %d edges: %d', g.shape[0], g.nnz // 2)
 
     pos = force_directed(G=g, seed=seed, iterations=iterations, threshold=threshold, centrality=centrality,
-                         gravity=gravity)
-    logger.info(f'positions of nodes: {pos}')
+                         gravity=gravity, callback=callback)
+    logger.debug('positions of nodes: %s', pos)
     if graph_type is hypergraph_layout.star_algorithm or graph_type is hypergraph_layout.wheel_algorithm:
-        logger.info(f'removing addon central nodes')
         pos = pos[:len(pos) - len(G.hyperedges)]
-    fig, ax = plt.subplots()
-    logger.info('drawing proportional vertices as circles')
-    size = plt.gcf().get_size_inches()[0]
-    ax.scatter(pos[:, 0], pos[:, 1], s=size, zorder=2)
-    logger.info(f'generating the visual plot for the graph')
-    for ei in G.hyperedges:
-        logger.info(f'calculating convex hull for hyper-edge: {ei.vertices}')
-        indexes = []
-        for v in ei.vertices:
-            indexes.append(np.where(G.vertices == v)[0][0])
+    return pos
+
+
+def draw_hyper_graph(G: hypergraph_layout.hypergraph, pos, ax, title=None):
+    """Draws the vertices of G at pos and every hyperedge around its vertices on the matplotlib Axes ax.
+
+    Only ax and its figure are used, so it works with any figure, including ones not made by pyplot.
+
+    Parameters
+    ----------
+    G : hypergraph
+    pos : np.array
+        positions of G.vertices, as returned by hyper_graph_layout
+    ax : matplotlib Axes
+    title: str optional (default=None)
+        title of the plot
+    """
+    from scipy.interpolate import splprep
+    from scipy.interpolate import splev
+    from matplotlib.patches import Circle, Ellipse
+
+    width = ax.figure.get_size_inches()[0]
+    ax.scatter(pos[:, 0], pos[:, 1], s=width, zorder=2)
+    for i in range(len(G.hyperedges)):
+        indexes = G.members(i)
         if len(indexes) >= 3:
             hull = ConvexHull(pos[indexes])
-            logger.info("Getting the edge positions")
-            new_hull = convex_pos(hull)
-            logger.info("Getting the order of the edges")
+            new_hull = convex_pos(hull, width=width)
             order = get_points_order(new_hull)
             tmp_pos = new_hull.points[order]
-            logger.info("Smoothing the drawing")
             # taken from https://stackoverflow.com/questions/31464345/fitting-a-closed-curve-to-a-set-of-points
             tck, u = splprep(tmp_pos.T, u=None, s=0.0, per=1)
             smooting_param = 1000
@@ -430,18 +926,86 @@ def force_directed_hyper_graphs_using_social_and_gravity_scaling(G: hypergraph_l
             ellipse = Ellipse(center, width=0.020, height=height, angle=angle + 90, fill=False, color=random_color())
             ax.add_artist(ellipse)
         elif len(indexes) == 1:
-            logger.info("Getting the circle size proportional to the canvas size")
+            # circle size proportional to the canvas size
             proportion = 200
-            size = plt.gcf().get_size_inches()[0] / proportion
-            draw_circle = plt.Circle((pos[indexes][0][0], pos[indexes][0][1]), size, fill=False, color=random_color())
+            draw_circle = Circle((pos[indexes][0][0], pos[indexes][0][1]), width / proportion, fill=False,
+                                 color=random_color())
             ax.add_artist(draw_circle)
 
-    logger.info("drawing vertices' numbers")
     for i, txt in enumerate(G.vertices):
         ax.annotate(txt, pos[i], color='blue')
     if title is not None:
-        plt.title(title)
-    plt.show()
-    if fig:
-        return fig
-    return pos
+        ax.set_title(title)
+
+
+def render_hyper_graph(G: hypergraph_layout.hypergraph, pos, title=None, format="png", dpi=100):
+    """Draws G with the Agg backend into memory.
+
+    A new Figure is made for every call without going through pyplot, so no global
+    matplotlib state is shared and it is safe to call from a server or a worker process.
+
+    Parameters
+    ----------
+    G : hypergraph
+    pos : np.array
+        positions of G.vertices, as returned by hyper_graph_layout
+    title: str optional (default=None)
+        title of the plot
+    format: str optional (default="png")
+        image format passed to Figure.savefig
+    dpi: int optional (default=100)
+
+    Returns
+    -------
+    bytes
+        the rendered image
+    """
+    import io
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    draw_hyper_graph(G, pos, figure.subplots(), title=title)
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=format, dpi=dpi)
+    return buffer.getvalue()
+
+
+def _layout_and_render(G, layout_kwargs, render_kwargs):
+    pos = hyper_graph_layout(G, **layout_kwargs)
+    return pos, render_hyper_graph(G, pos, **render_kwargs)
+
+
+def render_hyper_graphs(hypergraphs, n_jobs=None, title=None, format="png", dpi=100, **kwargs):
+    """Computes the layout of every hypergraph and renders it, using a pool of processes.
+
+    Parameters
+    ----------
+    hypergraphs : iterable of hypergraph
+    n_jobs: int optional (default=None)
+        number of worker processes, the number of CPUs if None. With 1 everything runs in the calling process
+    title, format, dpi:
+        see render_hyper_graph
+    kwargs:
+        passed to hyper_graph_layout (iterations, threshold, centrality, graph_type, gravity, seed),
+        they have to be picklable, as the networkx centrality functions and the hypergraph_layout expansions are
+
+    Returns
+    -------
+    list of (pos, bytes)
+        the positions and the rendered image of every hypergraph, in the order they were given
+
+    Example
+    >>> G = hypergraph([1, 2, 3, 4], [hyperedge([1, 2, 3]), hyperedge([3, 4])])
+    >>> [(pos, png)] = render_hyper_graphs([G], n_jobs=1, iterations=20, seed=1)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    job = partial(_layout_and_render, layout_kwargs=kwargs, render_kwargs={"title": title, "format": format,
+                                                                           "dpi": dpi})
+    if n_jobs == 1:
+        return [job(G) for G in hypergraphs]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(job, hypergraphs))
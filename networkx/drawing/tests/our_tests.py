@@ -37,6 +37,108 @@ class TestLayout:
         has_nan = any(math.isnan(c) for coords in pos.values() for c in coords)
         assert not has_nan, "values should not be nan"
 
+    def test_barnes_hut_repulsion(self):
+        from networkx.drawing.our_layout import _displacement_exact, _repulsion_barnes_hut
+        import scipy as sp
+        import scipy.sparse  # call as sp.sparse
+
+        pos = np.random.default_rng(1).random((500, 2))
+        k = np.sqrt(1 / 500)
+        exact = _displacement_exact(pos, sp.sparse.csr_array((500, 500)), k).T
+        # with theta=0 no cell is ever approximated
+        assert np.allclose(_repulsion_barnes_hut(pos, k, theta=0), exact)
+        approx = _repulsion_barnes_hut(pos, k, theta=0.5)
+        assert np.linalg.norm(approx - exact) / np.linalg.norm(exact) < 0.01
+
+    def test_force_directed_methods(self):
+        g = nx.random_regular_graph(3, 70, 1)
+        pos = nx.force_directed(g, seed=1, iterations=100, method="barnes_hut")
+        assert pos.shape == (70, 2)
+        assert not np.isnan(pos).any()
+        pytest.raises(ValueError, nx.force_directed, g, 1, method="nope")
+
+    def test_hypergraph_incidence(self):
+        G = hypergraph(["a", "b", "c", "d"], [hyperedge(["c", "a"]), hyperedge(["b"]), hyperedge(["a", "b", "d"])])
+        assert G.index == {"a": 0, "b": 1, "c": 2, "d": 3}
+        assert list(G.members(0)) == [2, 0]
+        assert list(G.members(2)) == [0, 1, 3]
+        assert list(G.incident("a")) == [0, 2]
+        assert list(G.incident("c")) == [0]
+        assert [G.degree(v) for v in "abcd"] == [2, 2, 1, 1]
+        pytest.raises(nx.NetworkXError, hypergraph, [1, 2], [hyperedge([1, 3])])
+
+    def test_sparse_expansions(self):
+        from networkx.drawing import hypergraph_layout
+
+        G = hypergraph([1, 2, 3, 4, 5, 6], [hyperedge([1, 2, 3, 4]), hyperedge([5, 6]), hyperedge([4, 1, 3]),
+                                            hyperedge([1])])
+        for algorithm in [hypergraph_layout.complete_algorithm, hypergraph_layout.cycle_algorithm,
+                          hypergraph_layout.star_algorithm, hypergraph_layout.wheel_algorithm]:
+            expected = nx.to_scipy_sparse_array(algorithm(G)).toarray()
+            assert np.array_equal(algorithm(G, sparse=True).toarray(), expected)
+            pos = nx.force_directed(algorithm(G, sparse=True), seed=1, iterations=100)
+            assert np.array_equal(pos, nx.force_directed(algorithm(G), seed=1, iterations=100))
+
+    def test_render_hyper_graph(self):
+        pytest.importorskip("matplotlib")
+        from networkx.drawing import hypergraph_layout
+
+        G = hypergraph([1, 2, 3, 4, 5, 6], [hyperedge([1, 2, 3, 4]), hyperedge([5, 6]), hyperedge([1])])
+        pos = nx.hyper_graph_layout(G, iterations=20, graph_type=hypergraph_layout.star_algorithm, seed=1)
+        assert pos.shape == (6, 2)
+        assert nx.render_hyper_graph(G, pos).startswith(b"\x89PNG")
+        [(batch_pos, png)] = nx.render_hyper_graphs([G], n_jobs=1, iterations=20,
+                                                    graph_type=hypergraph_layout.star_algorithm, seed=1)
+        assert np.array_equal(batch_pos, pos)
+        assert png.startswith(b"\x89PNG")
+
+    def test_force_directed_callback(self):
+        g = nx.random_tree(20, 1)
+        calls = []
+        pos = nx.force_directed(g, seed=1, iterations=10, callback=lambda i, n: calls.append((i, n)))
+        assert calls == [(i, 10) for i in range(10)]
+        assert np.array_equal(pos, nx.force_directed(g, seed=1, iterations=10))
+
+        def stop(i, n):
+            raise nx.NetworkXError("stopped")
+
+        pytest.raises(nx.NetworkXError, nx.force_directed, g, 1, iterations=10, callback=stop)
+
+    def test_force_directed_update(self):
+        g = nx.random_tree(70, 1)
+        pos = nx.force_directed(g, seed=1, iterations=300)
+        assert np.array_equal(nx.force_directed(g, seed=1, iterations=0, pos=pos), pos)
+        g.add_edge(3, 70)
+        new_pos = nx.force_directed_update(g, dict(zip(g, pos)), changed=[3], seed=1, iterations=5)
+        assert new_pos.shape == (71, 2)
+        # steps of at most 0.01, cooling down
+        assert np.abs(new_pos[:70] - pos).max() < 0.05
+        assert np.linalg.norm(new_pos[70] - new_pos[3]) < 0.1
+
+    def test_centrality_mass(self):
+        g = nx.random_tree(70, 1)
+        g.add_edge(100, 101)
+        exact = nx.closeness_centrality(g)
+        mass = nx.CentralityMass()
+        assert mass(g) == pytest.approx(exact)
+        assert mass.error_bound == 0
+        pos = nx.force_directed(g, seed=1, iterations=50, centrality=mass)
+        assert np.array_equal(pos, nx.force_directed(g, seed=1, iterations=50))
+
+        # all the pivots, exact
+        assert nx.PivotCentralityMass(k=72)(g) == pytest.approx(exact)
+        approx = nx.PivotCentralityMass(k=30, seed=1)
+        estimate = approx(g)
+        assert approx.error_bound > 0
+        assert estimate[100] == pytest.approx(exact[100])
+        assert max(abs(estimate[v] - exact[v]) for v in g) < 0.1
+        # the bound is on the mass itself
+        assert max(abs(estimate[v] - exact[v]) for v in g) <= approx.error_bound <= 1
+        betweenness = nx.PivotCentralityMass("betweenness", k=30, seed=1)
+        betweenness(g)
+        assert betweenness.error_bound == pytest.approx(np.sqrt(np.log(2 * 72 ** 2) / 60))
+        pytest.raises(ValueError, nx.PivotCentralityMass, "degree")
+
     def test_forest_pos(self):
         # random forest
         g: nx.Graph = nx.random_tree(70, 1)
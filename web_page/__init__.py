@@ -2,4 +2,8 @@ from flask import Flask
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'ecf6e975838a2f7bf3c5dbe7d55ebe5b'  ###
+app.config['LAYOUT_CACHE_ENTRIES'] = 128
+app.config['LAYOUT_CACHE_BYTES'] = 64 * 2 ** 20
+app.config['LAYOUT_JOB_WORKERS'] = 2
+app.config['LAYOUT_JOB_LIMIT'] = 32
 from web_page import routes
@@ -0,0 +1,70 @@
+import hashlib
+import threading
+import warnings
+from collections import OrderedDict
+
+
+def hypergraph_key(G, **params):
+    """Returns a hash of the hypergraph G together with the layout parameters.
+
+    Two hypergraphs with the same vertices and the same hyperedges (in the same order) get the same key.
+    Functions, like the centrality or the expansion algorithm, are identified by their name.
+    """
+    h = hashlib.sha256()
+    h.update(repr(G.vertices.tolist()).encode())
+    h.update(G.indptr.tobytes())
+    h.update(G.indices.tobytes())
+    for name in sorted(params):
+        value = params[name]
+        h.update(repr((name, getattr(value, "__name__", value))).encode())
+    return h.hexdigest()
+
+
+class LayoutCache:
+    """Thread safe LRU cache of (positions, image bytes) keyed by hypergraph_key.
+
+    The least recently used results are evicted when there are more than max_entries of them
+    or when they take more than max_bytes together.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=64 * 2**20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key):
+        """Returns the (positions, image) stored for key, or None"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, pos, image):
+        """Stores (pos, image) for key. Returns False, with a warning, if it is larger than max_bytes on its own"""
+        size = pos.nbytes + len(image)
+        if size > self.max_bytes:
+            warnings.warn(
+                f"layout {key} takes {size} bytes, more than the cache limit of {self.max_bytes}"
+            )
+            return False
+        with self._lock:
+            if key in self._entries:
+                old_pos, old_image = self._entries.pop(key)
+                self.nbytes -= old_pos.nbytes + len(old_image)
+            self._entries[key] = (pos, image)
+            self.nbytes += size
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _, (old_pos, old_image) = self._entries.popitem(last=False)
+                self.nbytes -= old_pos.nbytes + len(old_image)
+        return True
@@ -1,6 +1,6 @@
 from flask_wtf import FlaskForm
 from wtforms import SubmitField, IntegerField, SelectField
-from wtforms.validators import DataRequired
+from wtforms.validators import DataRequired, Optional
 
 
 class Parameters(FlaskForm):
@@ -8,6 +8,7 @@ class Parameters(FlaskForm):
     edges = IntegerField('Number of edges', validators=[DataRequired()])
     gravity = IntegerField('Gravity', default=6)
     iter = IntegerField('Number of iterations', default=50)
+    seed = IntegerField('Seed', validators=[Optional()])
     centrality = SelectField(u'Centrality', choices=[('cl', 'Closeness'), ('bt', 'Betweeness'), ('dg', 'Degree')])
     type = SelectField(u'Initialization algorithm', choices=[('Comp', 'Complete algorithm'), ('Cyc', 'Cycle algorithm'),
                                                              ('Str', 'Start algorithm'), ('Wh', 'Wheel algorithm')])
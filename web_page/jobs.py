@@ -0,0 +1,133 @@
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from networkx.drawing.our_layout import hyper_graph_layout, render_hyper_graph
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker when its job was cancelled while running."""
+
+
+class JobQueueFull(Exception):
+    """Raised by JobQueue.submit when too many jobs are waiting or running."""
+
+
+def _run_job(key, G, params, progress, cancelled):
+    def callback(iteration, iterations):
+        if key in cancelled:
+            raise JobCancelled(key)
+        progress[key] = (iteration + 1) / iterations
+
+    pos = hyper_graph_layout(G, callback=callback, **params)
+    return pos, render_hyper_graph(G, pos)
+
+
+class JobQueue:
+    """Runs layout jobs in a pool of max_workers processes and stores their results in cache.
+
+    Jobs are identified by their cache key (see cache.hypergraph_key), so submitting the same
+    input twice gives the same job. At most max_jobs jobs can be waiting or running at once.
+    Progress is reported by force_directed after every iteration through a shared dict.
+    The state of the last max_jobs jobs that failed or were cancelled is kept for status.
+    """
+
+    def __init__(self, cache, max_workers=2, max_jobs=32):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self._jobs = {}
+        self._ended = OrderedDict()
+        self._lock = threading.Lock()
+        self._manager = None
+        self._executor = None
+        self._progress = None
+        self._cancelled = None
+
+    def _start(self):
+        # started on the first job, so importing the web page does not spawn processes
+        if self._executor is None:
+            self._manager = multiprocessing.Manager()
+            self._progress = self._manager.dict()
+            self._cancelled = self._manager.dict()
+            self._executor = ProcessPoolExecutor(self.max_workers)
+
+    def submit(self, key, G, params):
+        """Starts computing the layout of G with params unless it is cached or already submitted"""
+        with self._lock:
+            if key in self.cache or key in self._jobs:
+                return
+            if len(self._jobs) >= self.max_jobs:
+                raise JobQueueFull(key)
+            self._start()
+            self._ended.pop(key, None)
+            self._cancelled.pop(key, None)
+            self._progress[key] = 0.0
+            job = self._executor.submit(
+                _run_job, key, G, params, self._progress, self._cancelled
+            )
+            self._jobs[key] = job
+        job.add_done_callback(lambda job: self._finish(key, job))
+
+    def _finish(self, key, job):
+        error = None
+        if job.cancelled() or isinstance(job.exception(), JobCancelled):
+            state = "cancelled"
+        elif job.exception() is not None:
+            state, error = "failed", repr(job.exception())
+        elif self.cache.put(key, *job.result()):
+            state = "done"
+        else:
+            state, error = "failed", "the layout is too large to be stored"
+        with self._lock:
+            if self._jobs.get(key) is job:
+                del self._jobs[key]
+            progress = self._progress.pop(key, 0.0)
+            self._cancelled.pop(key, None)
+            if state != "done":
+                self._ended[key] = {
+                    "state": state,
+                    "progress": progress,
+                    "error": error,
+                }
+                while len(self._ended) > self.max_jobs:
+                    self._ended.popitem(last=False)
+
+    def status(self, key):
+        """Returns a dict with the state of the job (pending, running, done, failed, cancelled or unknown)
+        and its progress between 0 and 1. A failed job also has the reason under 'error'"""
+        if key in self.cache:
+            return {"state": "done", "progress": 1.0}
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                return dict(self._ended.get(key, {"state": "unknown", "progress": 0.0}))
+            progress = self._progress.get(key, 0.0)
+        if not job.done():
+            state = "running" if job.running() else "pending"
+        else:
+            # the result is being stored
+            state = "running"
+        return {"state": state, "progress": progress}
+
+    def cancel(self, key):
+        """Cancels the job, a running job stops at its next iteration. Returns False if there is no such job"""
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.done():
+                return False
+            self._cancelled[key] = True
+        # a job that did not start is finished by cancel, which calls _finish and takes the lock
+        job.cancel()
+        return True
+
+    def shutdown(self):
+        """Cancels all the jobs and waits for the workers to stop"""
+        if self._executor is not None:
+            with self._lock:
+                for key in self._jobs:
+                    self._cancelled[key] = True
+            self._executor.shutdown(cancel_futures=True)
+            self._manager.shutdown()
+            self._executor = self._manager = None
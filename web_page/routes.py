@@ -1,23 +1,26 @@
-import os
-
-from flask import render_template, url_for, redirect, request
+from flask import render_template, url_for, redirect, request, abort, Response, jsonify
 
 import networkx as nx
 from networkx.drawing import hypergraph_layout
 from web_page import app
+from web_page.cache import LayoutCache, hypergraph_key
 from web_page.forms import Parameters
-from networkx.drawing.our_layout import force_directed_hyper_graphs_using_social_and_gravity_scaling
+from web_page.jobs import JobQueue, JobQueueFull
+
+layout_cache = LayoutCache(app.config['LAYOUT_CACHE_ENTRIES'], app.config['LAYOUT_CACHE_BYTES'])
+layout_jobs = JobQueue(layout_cache, app.config['LAYOUT_JOB_WORKERS'], app.config['LAYOUT_JOB_LIMIT'])
 
 
-def random_hypergraph(num_of_vtx, num_of_edges):
+def random_hypergraph(num_of_vtx, num_of_edges, seed=None):
     import random
+    rng = random.Random(seed)
     vtx = list(range(num_of_vtx))
     edges = []
     for edge in range(num_of_edges):
         v = set()
-        num_of_vtx_in_edge = random.randint(1, num_of_vtx)
+        num_of_vtx_in_edge = rng.randint(1, num_of_vtx)
         for _ in range(num_of_vtx_in_edge):
-            rand_vtx = random.randint(0, num_of_vtx - 1)
+            rand_vtx = rng.randint(0, num_of_vtx - 1)
             v.add(rand_vtx)
         E = hypergraph_layout.hyperedge(list(v))
         edges.append(E)
@@ -44,22 +47,51 @@ def find_algo(algo):
         return hypergraph_layout.wheel_algorithm
 
 
-@app.route("/result")
-def result():
-    return render_template('templates/resultpage.html')
+@app.route("/result/<key>")
+def result(key):
+    status = layout_jobs.status(key)
+    if status['state'] == 'unknown':
+        abort(404)
+    if status['state'] != 'done':
+        return render_template('templates/resultpage.html', status=status)
+    return render_template('templates/resultpage.html', status=status, image_url=url_for('plot', key=key))
+
+
+@app.route("/plot/<key>.png")
+def plot(key):
+    cached = layout_cache.get(key)
+    if cached is None:
+        abort(404)
+    return Response(cached[1], mimetype='image/png')
+
+
+@app.route("/jobs/<key>")
+def job_status(key):
+    status = layout_jobs.status(key)
+    if status['state'] == 'unknown':
+        abort(404)
+    return jsonify(status)
+
+
+@app.route("/jobs/<key>/cancel", methods=['POST'])
+def job_cancel(key):
+    if not layout_jobs.cancel(key):
+        abort(404)
+    return jsonify(layout_jobs.status(key))
 
 
 @app.route("/", methods=['GET', 'POST'])
 def home():
     form = Parameters()
     if request.method == 'POST':
-        fig = force_directed_hyper_graphs_using_social_and_gravity_scaling(
-            G=random_hypergraph(form.vtx.data, form.edges.data),
-            iterations=form.iter.data,
-            centrality=find_centrality(form.centrality.data),
-            graph_type=find_algo(form.type.data), gravity=form.gravity.data, fig=True)
-        pic_path = os.path.join(app.root_path, 'static/images/plot.png')
-        fig.savefig(pic_path)
-        return redirect(url_for('result'))
+        G = random_hypergraph(form.vtx.data, form.edges.data, form.seed.data)
+        params = dict(iterations=form.iter.data, centrality=find_centrality(form.centrality.data),
+                      graph_type=find_algo(form.type.data), gravity=form.gravity.data, seed=form.seed.data)
+        key = hypergraph_key(G, **params)
+        try:
+            layout_jobs.submit(key, G, params)
+        except JobQueueFull:
+            abort(503)
+        return redirect(url_for('result', key=key))
     else:
         return render_template('templates/homepage.html', form=form)
@@ -0,0 +1,67 @@
+"""Unit tests for the layout cache of the web page."""
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("flask")
+
+import networkx as nx
+from networkx.drawing.hypergraph_layout import hyperedge, hypergraph
+from web_page.cache import LayoutCache, hypergraph_key
+
+
+def _entry(nbytes):
+    return np.zeros(nbytes // 8), b""
+
+
+class TestHypergraphKey:
+    def test_stable(self):
+        G = hypergraph([0, 1, 2, 3], [hyperedge([0, 1]), hyperedge([1, 2, 3])])
+        H = hypergraph([0, 1, 2, 3], [hyperedge([0, 1]), hyperedge([1, 2, 3])])
+        params = dict(iterations=10, centrality=nx.closeness_centrality, gravity=6)
+        assert hypergraph_key(G, **params) == hypergraph_key(H, **params)
+        # the order of the parameters does not matter
+        assert hypergraph_key(G, **params) == hypergraph_key(
+            G, **dict(reversed(params.items()))
+        )
+
+    def test_different(self):
+        G = hypergraph([0, 1, 2, 3], [hyperedge([0, 1]), hyperedge([1, 2, 3])])
+        H = hypergraph([0, 1, 2, 3], [hyperedge([0, 1]), hyperedge([1, 2])])
+        assert hypergraph_key(G) != hypergraph_key(H)
+        assert hypergraph_key(G, iterations=10) != hypergraph_key(G, iterations=11)
+        assert hypergraph_key(G, centrality=nx.closeness_centrality) != hypergraph_key(
+            G, centrality=nx.degree_centrality
+        )
+
+
+class TestLayoutCache:
+    def test_lru_eviction(self):
+        cache = LayoutCache(max_entries=2)
+        cache.put("a", *_entry(8))
+        cache.put("b", *_entry(8))
+        assert cache.get("a") is not None
+        cache.put("c", *_entry(8))
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_byte_bound(self):
+        cache = LayoutCache(max_bytes=100)
+        cache.put("a", *_entry(40))
+        cache.put("b", *_entry(40))
+        assert cache.nbytes == 80
+        cache.put("c", *_entry(40))
+        assert "a" not in cache
+        assert cache.nbytes == 80
+        # replacing an entry does not count it twice
+        cache.put("c", *_entry(16))
+        assert cache.nbytes == 56
+        assert len(cache) == 2
+
+    def test_too_large(self):
+        cache = LayoutCache(max_bytes=100)
+        cache.put("a", *_entry(40))
+        with pytest.warns(UserWarning):
+            assert not cache.put("b", *_entry(200))
+        assert "b" not in cache
+        assert "a" in cache
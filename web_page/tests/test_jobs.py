@@ -0,0 +1,116 @@
+"""Unit tests for the layout job queue of the web page."""
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("matplotlib")
+pytest.importorskip("flask")
+
+from networkx.drawing.hypergraph_layout import hyperedge, hypergraph
+from web_page.cache import LayoutCache
+from web_page.jobs import JobQueue, JobQueueFull
+
+
+def _hypergraph():
+    return hypergraph(
+        list(range(6)), [hyperedge([0, 1, 2]), hyperedge([2, 3]), hyperedge([3, 4, 5])]
+    )
+
+
+def _wait(queue, key, states=("done", "failed", "cancelled"), timeout=60):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        status = queue.status(key)
+        if status["state"] in states:
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"job {key} is still {queue.status(key)}")
+
+
+class TestJobQueue:
+    def setup_method(self):
+        self.cache = LayoutCache()
+        self.queue = JobQueue(self.cache, max_workers=1, max_jobs=2)
+
+    def teardown_method(self):
+        self.queue.shutdown()
+
+    def test_submit(self):
+        assert self.queue.status("a")["state"] == "unknown"
+        self.queue.submit("a", _hypergraph(), dict(iterations=5, seed=1))
+        assert self.queue.status("a")["state"] in ("pending", "running", "done")
+        assert _wait(self.queue, "a") == {"state": "done", "progress": 1.0}
+        pos, image = self.cache.get("a")
+        assert pos.shape == (6, 2)
+        assert image.startswith(b"\x89PNG")
+        assert (
+            not self.queue._jobs
+            and not self.queue._progress
+            and not self.queue._cancelled
+        )
+        # cached results are not computed again
+        self.queue.submit("a", _hypergraph(), dict(iterations=5, seed=1))
+        assert not self.queue._jobs
+
+    def test_failure(self):
+        self.queue.submit("a", _hypergraph(), dict(no_such_parameter=1))
+        status = _wait(self.queue, "a")
+        assert status["state"] == "failed"
+        assert "no_such_parameter" in status["error"]
+        assert "a" not in self.cache
+        assert not self.queue._jobs and not self.queue._progress
+        # a failed job can be submitted again
+        self.queue.submit("a", _hypergraph(), dict(iterations=5, seed=1))
+        assert _wait(self.queue, "a")["state"] == "done"
+
+    def test_too_large(self):
+        self.cache.max_bytes = 10
+        self.queue.submit("a", _hypergraph(), dict(iterations=5, seed=1))
+        with pytest.warns(UserWarning):
+            status = _wait(self.queue, "a")
+        assert status["state"] == "failed"
+        assert "too large" in status["error"]
+        assert not self.queue._jobs and not self.queue._progress
+
+    def test_cancel(self):
+        self.queue.max_jobs = 3
+        params = dict(iterations=10**6, threshold=0, seed=1)
+        for key in "abc":
+            self.queue.submit(key, _hypergraph(), params)
+        with pytest.raises(JobQueueFull):
+            self.queue.submit("d", _hypergraph(), params)
+        # a stops at its next iteration, b and c before their first one
+        _wait(self.queue, "a", states=("running",))
+        for key in "cab":
+            assert self.queue.cancel(key)
+        for key in "abc":
+            assert _wait(self.queue, key)["state"] == "cancelled"
+        assert (
+            not self.queue._jobs
+            and not self.queue._progress
+            and not self.queue._cancelled
+        )
+        assert not self.queue.cancel("a")
+        assert not self.queue.cancel("d")
+
+    def test_ended_bound(self):
+        for key in "abc":
+            self.queue.submit(key, _hypergraph(), dict(no_such_parameter=1))
+            _wait(self.queue, key)
+        assert self.queue.status("a")["state"] == "unknown"
+        assert self.queue.status("c")["state"] == "failed"
+
+    def test_shutdown(self):
+        params = dict(iterations=10**6, threshold=0, seed=1)
+        self.queue.submit("a", _hypergraph(), params)
+        self.queue.submit("b", _hypergraph(), params)
+        _wait(self.queue, "a", states=("running",))
+        self.queue.shutdown()
+        assert self.queue.status("a")["state"] == "cancelled"
+        assert self.queue.status("b")["state"] == "cancelled"
+        assert not self.queue._jobs
+        # the queue starts again on the next job
+        self.queue.submit("c", _hypergraph(), dict(iterations=5, seed=1))
+        assert _wait(self.queue, "c")["state"] == "done"